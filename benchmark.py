@@ -0,0 +1,389 @@
+# Benchmark suite for image_rating_app.py
+#
+# Generates a reproducible synthetic image corpus and times the app's hot paths
+# (import/thumbnailing, thumbnail list rendering, navigation, rating, filtering,
+# quality scoring, export to a folder and to an archive, and reopening the last
+# session) on a real Tk window. Results are written as JSON so two commits
+# can be compared:
+#
+#   xvfb-run -a python benchmark.py --count 5000 --output before.json
+#   xvfb-run -a python benchmark.py --count 5000 --output after.json
+#   python benchmark.py --compare before.json after.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw
+
+import image_rating_app
+
+DEFAULT_RESOLUTIONS = "640x480,1600x1200,4000x3000"
+
+
+def make_image(args):
+    path, w, h, seed = args
+    rng = random.Random(seed)
+    img = Image.new("RGB", (w, h), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = rng.randrange(w), rng.randrange(h)
+        x1, y1 = x0 + rng.randrange(1, w // 2 + 2), y0 + rng.randrange(1, h // 2 + 2)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.rectangle((x0, y0, x1, y1), fill=color)
+        else:
+            draw.ellipse((x0, y0, x1, y1), fill=color)
+    img.save(path)
+    return os.path.getsize(path)
+
+
+def generate_corpus(folder, count, resolutions, seed):
+    # Reuses an existing corpus when it was generated with the same parameters
+    params = {"count": count, "resolutions": resolutions, "seed": seed,
+              "extensions": list(image_rating_app.SUPPORTED_EXTENSIONS)}
+    marker = os.path.join(folder, ".corpus.json")
+    try:
+        with open(marker, "r", encoding="utf-8") as f:
+            if json.load(f) == params:
+                return
+    except (OSError, ValueError):
+        pass
+
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+    rng = random.Random(seed)
+    sizes = [tuple(int(v) for v in res.split("x")) for res in resolutions.split(",")]
+    extensions = image_rating_app.SUPPORTED_EXTENSIONS
+    jobs = []
+    for i in range(count):
+        w, h = rng.choice(sizes)
+        if rng.random() < 0.5:
+            w, h = h, w  # Mix of landscape and portrait
+        ext = extensions[i % len(extensions)]
+        jobs.append((os.path.join(folder, f"img_{i:06d}{ext}"), w, h, seed + i))
+    with ProcessPoolExecutor() as pool:
+        total = sum(pool.map(make_image, jobs, chunksize=16))
+    params["bytes"] = total
+    with open(marker, "w", encoding="utf-8") as f:
+        json.dump(params, f)
+
+
+def summarize(samples):
+    if not samples:
+        return {"n": 0}
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+    return {
+        "n": len(samples),
+        "mean_ms": sum(samples) / len(samples) * 1000,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def pump(root, until, timeout):
+    deadline = time.perf_counter() + timeout
+    while not until():
+        root.update()
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark step did not finish in time")
+        time.sleep(0.001)
+
+
+def pump_for(root, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+
+
+def make_app():
+    root = image_rating_app.tk.Tk()
+    app = image_rating_app.ImageClassifierApp(root)
+    root.update()
+    return root, app
+
+
+def close_app(app):
+    # Flushes the stores and destroys the Tk root
+    app.on_close()
+
+
+def bench_import(folder, timeout):
+    root, app = make_app()
+    t0 = time.perf_counter()
+    app.start_import(folder)
+    pump(root, lambda: app.tk_img is not None, timeout)
+    first_image = time.perf_counter() - t0
+    pump(root, lambda: not app.import_status, timeout)
+    scanned = time.perf_counter() - t0
+    pump(root, lambda: app.thumb_queue.pending() == 0, timeout)
+    thumbnails = time.perf_counter() - t0
+    result = {
+        "images": len(app.images),
+        "first_image_s": first_image,
+        "scan_s": scanned,
+        "thumbnails_s": thumbnails,
+        "images_per_s": len(app.images) / max(thumbnails, 1e-9),
+    }
+    return root, app, result
+
+
+def bench_restore(timeout):
+    # Start-up with the session the previous run left behind, as from the command line
+    t0 = time.perf_counter()
+    root = image_rating_app.tk.Tk()
+    app = image_rating_app.ImageClassifierApp(root)
+    app.restore_session()
+    root.update()
+    first_screen = time.perf_counter() - t0
+    pump(root, lambda: app.snapshot is not None and app.current_img_path is not None, timeout)
+    interactive = time.perf_counter() - t0
+    result = {
+        "images": len(app.images),
+        "first_screen_s": first_screen,
+        "interactive_s": interactive,
+    }
+    close_app(app)
+    return result
+
+
+def bench_render(root, app, rng, steps):
+    samples = []
+    total_h = len(app.images) * app.thumb_row_height()
+    for _ in range(steps):
+        app.thumb_offset = rng.randrange(max(1, total_h))
+        t0 = time.perf_counter()
+        app.update_thumbnails()
+        root.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    return summarize(samples)
+
+
+def bench_navigation(root, app, steps, pause):
+    app.select_image(0)
+    root.update()
+    samples = []
+    for _ in range(min(steps, len(app.images) - 1)):
+        t0 = time.perf_counter()
+        app.move_selection(1)
+        root.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+        if pause:
+            pump_for(root, pause)
+    return summarize(samples)
+
+
+def bench_rating(root, app, rng, steps):
+    app.select_image(0)
+    root.update()
+    samples = []
+    for _ in range(min(steps, len(app.images))):
+        t0 = time.perf_counter()
+        app.rate_image(rng.randint(1, 5))
+        root.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    rebuild = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        app.update_rated_list()
+        root.update_idletasks()
+        rebuild.append(time.perf_counter() - t0)
+    return summarize(samples), summarize(rebuild)
+
+
+def bench_filter(root, app):
+    samples = []
+    for selection in ["All", 1, 2, 3, 4, 5] * 2:
+        app.filter_var.set(str(selection))
+        t0 = time.perf_counter()
+        app.apply_filter(None)
+        root.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    return summarize(samples)
+
+
+def bench_export(app, target, timeout):
+    app.filter_var.set("All")
+    app.apply_filter(None)
+    paths = list(app.rated_paths())
+    job = image_rating_app.ExportJob(paths, target, "copy")
+    t0 = time.perf_counter()
+    job.start()
+    deadline = t0 + timeout
+    while not job.finished:
+        if time.perf_counter() > deadline:
+            job.cancel()
+            raise TimeoutError("export did not finish in time")
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - t0
+    return {
+        "files": len(job.transferred),
+        "errors": len(job.errors),
+        "seconds": elapsed,
+        "files_per_s": len(job.transferred) / max(elapsed, 1e-9),
+        "mb_per_s": job.bytes_done / 1048576 / max(elapsed, 1e-9),
+    }
+
+
+def bench_scoring(root, app, timeout):
+    # Quality scores for the whole folder from the stored thumbnails
+    if image_rating_app.load_numpy() is None:
+        return {"n": 0}
+    t0 = time.perf_counter()
+    app.start_scoring()
+    pump(root, lambda: not app.scoring_status, timeout)
+    elapsed = time.perf_counter() - t0
+    return {
+        "images": len(app.images),
+        "seconds": elapsed,
+        "images_per_s": len(app.images) / max(elapsed, 1e-9),
+    }
+
+
+def bench_archive(app, target, timeout):
+    # Filtered set downsized and re-encoded into one zip
+    paths = list(app.rated_paths())
+    job = image_rating_app.ArchiveExportJob(paths, target, "JPEG", max_edge=1024, quality=85)
+    t0 = time.perf_counter()
+    job.start()
+    deadline = t0 + timeout
+    while not job.finished:
+        if time.perf_counter() > deadline:
+            job.cancel()
+            raise TimeoutError("archive export did not finish in time")
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - t0
+    return {
+        "files": len(job.transferred),
+        "errors": len(job.errors),
+        "seconds": elapsed,
+        "files_per_s": len(job.transferred) / max(elapsed, 1e-9),
+        "archive_mb": os.path.getsize(target) / 1048576 if os.path.exists(target) else 0,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    workdir = args.workdir or os.path.join(tempfile.gettempdir(), "image_rating_bench")
+    corpus = os.path.join(workdir, f"corpus_{args.count}_{args.seed}")
+    os.makedirs(workdir, exist_ok=True)
+
+    t0 = time.perf_counter()
+    generate_corpus(corpus, args.count, args.resolutions, args.seed)
+    print(f"corpus ready in {time.perf_counter() - t0:.1f}s: {corpus}", file=sys.stderr)
+
+    # Keep the thumbnail store and rating journals away from the real user cache
+    cache_dir = os.path.join(workdir, "cache")
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.environ["XDG_CACHE_HOME"] = cache_dir
+    os.environ["LOCALAPPDATA"] = cache_dir
+
+    rng = random.Random(args.seed)
+    results = {}
+
+    root, app, results["import_cold"] = bench_import(corpus, args.timeout)
+    close_app(app)
+
+    root, app, results["import_warm"] = bench_import(corpus, args.timeout)
+    results["thumbnail_render"] = bench_render(root, app, rng, args.steps)
+    results["navigation_burst"] = bench_navigation(root, app, args.steps, 0)
+    results["navigation_paced"] = bench_navigation(root, app, args.steps, 0.2)
+    results["rate_image"], results["update_rated_list"] = bench_rating(root, app, rng, args.steps)
+    results["filter_change"] = bench_filter(root, app)
+    results["quality_scoring"] = bench_scoring(root, app, args.timeout)
+
+    target = os.path.join(workdir, "export")
+    shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(target)
+    results["export_copy"] = bench_export(app, target, args.timeout)
+    results["export_archive"] = bench_archive(app, os.path.join(workdir, "export.zip"), args.timeout)
+    close_app(app)
+    results["session_restore"] = bench_restore(args.timeout)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "pillow": Image.__version__,
+            "cpus": os.cpu_count(),
+            "count": args.count,
+            "resolutions": args.resolutions,
+            "seed": args.seed,
+            "steps": args.steps,
+        },
+        "results": results,
+    }
+
+
+def compare(base_path, new_path, threshold):
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    # Lower is better for times, higher is better for throughput
+    keys = {"p50_ms": False, "p95_ms": False, "first_image_s": False, "thumbnails_s": False,
+            "first_screen_s": False, "interactive_s": False, "seconds": False, "images_per_s": True, "mb_per_s": True}
+    regressions = 0
+    for name in sorted(set(base) & set(new)):
+        for key, higher_is_better in keys.items():
+            if key not in base[name] or key not in new[name] or not base[name][key]:
+                continue
+            ratio = new[name][key] / base[name][key]
+            worse = ratio < 1 - threshold if higher_is_better else ratio > 1 + threshold
+            regressions += worse
+            flag = "  REGRESSION" if worse else ""
+            print(f"{name:20s} {key:14s} {base[name][key]:12.2f} -> {new[name][key]:12.2f}  x{ratio:.2f}{flag}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image rating app on a synthetic corpus.")
+    parser.add_argument("--count", type=int, default=1000, help="number of images in the corpus (1k to 200k)")
+    parser.add_argument("--resolutions", default=DEFAULT_RESOLUTIONS, help="comma separated WxH list")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--steps", type=int, default=200, help="samples per latency benchmark")
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds allowed per long step")
+    parser.add_argument("--workdir", help="where the corpus and cache live (default: system temp dir)")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change counted as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(args.compare[0], args.compare[1], args.threshold))
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,2322 @@
 import os
+import sys
 import shutil
-import base64
 import io
+import time
+import sqlite3
+import hashlib
+import json
+import functools
+import itertools
+import math
+import mmap
+import bisect
+import queue
+import types
+import traceback
+from array import array
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
 import tkinter as tk
-from tkinterdnd2 import DND_FILES, TkinterDnD
-from tkinter import filedialog, ttk
+from tkinter import filedialog, simpledialog, ttk
 from tkinter import messagebox
+import PIL
 from PIL import Image, ImageTk
 
 import threading
 
-qr_code_base64 = """
-iVBORw0KGgoAAAANSUhEUgAAAh8AAAIcCAYAAABWycx/AAABB2lDQ1BJQ0MgUHJvZmlsZQAAKM9jYGA8wQAELAYMDLl5JUVB7k4KEZFRCuwPGBiBEAwSk4sLGHADoKpv1yBqL+sykA44U1KLk4H0ByBWKQJaDjRSBMgWSYewNUDsJAjbBsQuLykoAbIDQOyikCBnIDsFyNZIR2InIbGTC4pA6nuAbJvcnNJkhLsZeFLzQoOBNAcQyzAUMwQxuDM4gfwPUZK/iIHB4isDA/MEhFjSTAaG7a0MDBK3EGIqCxgY+FsYGLadR4ghwqQgsSgRLMQCxExpaQwMn5YzMPBGMjAIX2Bg4IqGBQQOtymA3ebOkA+E6Qw5DKlAEU+GPIZkBj0gy4jBgMGQwQwAptY/P1N/5B4AAAAJcEhZcwAADsIAAA7CARUoSoAAAABJdEVYdFNvZnR3YXJlAEFuZHJvaWQgVUtRMS4yMzA5MjQuMDAxLldXX1Bob25lLTM0LjAyMTAuMDIxMC4yNzYtMCByZWxlYXNlLWtleXMfOpqhAAACz2lUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSfvu78nIGlkPSdXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQnPz4NCjx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iPjxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+PHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9InV1aWQ6ZmFmNWJkZDUtYmEzZC0xMWRhLWFkMzEtZDMzZDc1MTgyZjFiIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iPjx4bXA6Q3JlYXRvclRvb2w+QW5kcm9pZCBVS1ExLjIzMDkyNC4wMDEuV1dfUGhvbmUtMzQuMDIxMC4wMjEwLjI3Ni0wIHJlbGVhc2Uta2V5czwveG1wOkNyZWF0b3JUb29sPjx4bXA6Y3JlYXRvcnRvb2w+QW5kcm9pZCBVS1ExLjIzMDkyNC4wMDEuV1dfUGhvbmUtMzQuMDIxMC4wMjEwLjI3Ni0wIHJlbGVhc2Uta2V5czwveG1wOmNyZWF0b3J0b29sPjwvcmRmOkRlc2NyaXB0aW9uPjxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSJ1dWlkOmZhZjViZGQ1LWJhM2QtMTFkYS1hZDMxLWQzM2Q3NTE4MmYxYiIgeG1sbnM6ZXhpZj0iaHR0cDovL25zLmFkb2JlLmNvbS9leGlmLzEuMC8iPjxleGlmOkxpZ2h0U291cmNlPjA8L2V4aWY6TGlnaHRTb3VyY2U+PC9yZGY6RGVzY3JpcHRpb24+PC9yZGY6UkRGPjwveDp4bXBtZXRhPg0KPD94cGFja2V0IGVuZD0ndyc/PtQsrS4AAPt/SURBVHhe7L152CVVde+/dp3zvm9D000cGB2CNIPGgckhCnj1IqKAXn1EQxKjCXrzSyKDGImCyWNiAg6ZgEZzrwYwXmX0Xp8oCMQhCOZ6L4J0Jw5AN0RIBJSg0gN0v++p2r8/fvWt3/ess6tq1Tl1hvft/Xmeek6dGtZee621195Vp05t5733EolEIpFIJDIhEr0hEolEIpFIZJzEwUckEolEIpGJEgcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSixMFHJBKJRCKRiRIHH5FIJBKJRCZKHHxEIpFIJBKZKHHwEYlEIpFIZKLEwUckEolEIpGJEgcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSixMFHJBKJRCKRiRIHH5FIJBKJRCZKHHxEIpFIJBKZKHHwEYlEIpFIZKLEwUckEolEIpGJEgcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmytQHH9774LqISJZlfd8jzYFN2ZZt2zVN02K9yp/LFa4fCNXNez90/at8MqzMSQL92VZVdVpplLWvsvXQ9zJw3Cz6nnXi+tRtt9Y9Ug3bOU3TmYyRMpyfEW3TNJVOpyOSG9Q5pw+JDAnbs23bankIpzbLmCYh22VZJkmSDNSdt3vvJUlsY3ucJ8p+ZfL1+izAddZ6r3SQu7RPdLzwNitNj58G1rjU+/T3yHCE+s7lYNuZ0U4nX4mj49ZA8sqyrG+9DSAPV7zOub7OermDhsydQChW9XZ0wnXgWLZfGWXlThPo4pwr9MPAaVehLsnrASQ+m9goy7LgHbhpg3YRil+v7gTyAEUfGxkebUfklLZy/LiYiTsfnNhHuUqIDFJmw7Ltw8JJCKPwlYy+smjTntyh6+9lbWXaQBfWr02bzCqoY8hnuu7D5jZtUwl0ONNG10d/r9seaQ+OyVm29UxkLpdfXUo+Op71Edtywpc8h9BWUGp5GHisFB+ifmxHTz+pcD3Zztb6a/9IwDf8XSf4WYHjQMfESoaTPNcdcMzAHrxuQT9ThXOtMTZOvPeS0R1VoL9LIF7190hzOL4A+tOQD2aJmRh8aGC0WTfeckDf/h+XTXUiCSXi5QgaMtYZ7gj0Pv29DJd3WihDlxXqyNEZzdIdJq3LSvC9FV8xgEQ7gJ95mxUMdNM07bvTNQt3vVz+c1sW+BlJ2wU2CP1EExmO5WzDmfnZRahRPvjgg3LrrbcWD3FFhifJnyfgzuzQQw+VI444opXb9twB43uWZfIf//Ef8o//+I/LunFIXp9TTz21+M5XFPiEHWGL7373u/K9733P1Mkgcf/Kr/yKiHp4jNFt5P7775dvfetbI/uvTdI0leOPP1722muvgbjYFbjqqquKOOD6Yx0+hM+f+cxnyste9jIlpRzvvdxwww3y85//XLrdbrFtmiRJIt1uV974xjeKqLpq//O2O++8U+66666Zit/lCNsUdvfey9FHHy3PeMYz9OGzhZ8xsizzV111lReRuIxpOfPMMwtbt0FIznXXXTdQ7nJd0jQN1jPLsmIbf5533nkDMuoWLZfXdRnee3/ZZZcNyJjG4pzr+7z11lsH7LSSYd845wo7hBbenySJf9Ob3qTFlYJyDjnkEO+c80mSDMif1rJq1ao+HXk9tM1779/97ncPyInLcIuOOeecv+KKKwpbzyozM+zkK7vIeNFX7qPCclaiH3F1puvk6FY6bxsVlsFltCG7beBv/pxFPceF9k1V/OOqVNQdNAu6jc3SHWFuH7r+OpYj7QOb8/flYOuZGXxEIpFIJBLZNYiDj0gkEolEIhMlDj4ikUgkEolMlDj4iEQikUgkMlHi4CMSiUQikchEiYOPSCQSiUQiEyUOPiKRSCQSiUyUFTX4iP8p//9os+78bgINv7MA4L/+obd0lgF9x/HqaH4HQejdA1bKbLASwNsyJfCa9Dq0TcdhJ/1OC/3dAr++nt9Jwvritd9N66CP5/ddCMWgjmlrHOr2FVqvItSutBxsb+p/Ztzvl2A7jrOcWSKUv1YK7WT4KQKHdDqdvga/0hxVB5LG3NxcYYc2bICgDyXmUDmhAUkVnKj5de9tJbIsy6Tb7RYdDeKkiWwcr6c0153OcqXX6xV253ljLDZiW+rO1RoDVfCr62HvJJ8ywAIGG6EBgK6fjg2rfxHDOB6fkIMXisEeTV+Nzm2C50Wxns9+gC6Sy4Vt0U4gv0kHD39ou1n1q4L1YDu6FdgZh9D5y9FAcbnXf9kPPpBYEPwI1jYS33IAgw4kjaWlJZE8wbXR+JG8+YpITwylG4ELdNRlsGwkQmxvA+ec9Ho9kVw+4gJxYwHx1Ol0ZHFxsXUdpwlswAm90+lImqaN6scd2OLiokhgMDIMiAnubHQ8VsGdV6/XK2RxDHNdOW/ouA7hqVPA8Ty4YJ0lb6+IR2sdWFcMCpv4hm3AbSzLsqK+SZJIr9crykC7rwP247q0mXuhh/a9Vb/lDvyCtoR2ZonNWWcmJpYT1VCvvvrqvsm8LHz961+Xpz3tadLtdouOQlpuCLOI914OPvjgIqlgIIbvIfeeddZZcuGFF+rNpfR6PTnqqKNk+/btItQZw2forNI0Le68vPjFL5bzzz+/1v4uHxx0u1056aSTismmynQfBgw6nHPy13/913LyySf3DUTqWLdu3UAC1I2ft33gAx+QCy64oG9/HU3revnll8tpp52mNw+FywftPGCcm5uTww47TK666qq+Y0MgMaZpKk9/+tNl1apVIiV2aoqWkWWZfOADH5Crr7660BvHhUAu2LRpU992yOVPoc70U5/6lPzlX/5lqVyAzqHT6cjmzZv7ZJWB2Fu9erXsu+++encfaZpKt9sV55wsLS3Jpz/9aXnGM55RlFNX1g9+8AN53ete17cN7ZXbAMf2pz71KXnlK19paiNov4cccohkDe5cnn322aYcxDps2rRJHM0CjTyxkvHey7//+7/LK1/5ysKeuq2GuPLKKxv3oRNHT/YyLXjSoSYTy2FSnX/913/tk4PJwHYF2A56PbScddZZWkQtu++++4CcTqfTV9b8/HyxfuKJJ5onGMNxz3/+873kk27V1cG6QE632/Ui4q+99tqiTKt+nuJJfwKWNerEchbanFiObd3pdIr1o48+WhcbhG3Bdm1i3yp0mz7ttNMKPeviBMdBjkW3LMv8hz/84QFZZQtiiyeNK/uOdevEcJCN5e677y701DEY4nvf+15RXpWtsM8556+77rpK+5TR6/W8z/XCehlNJpaDrYbRaSXwr//6r312sCxXXnmlFjNzjH5fdEbAzw0YHVaNulciuNJo+2oAV1eQjSsbya/KuCzcbsfdJ6sPPN2yb/uWKuTgVjffwg7ph/piwVUX6g37hs5drrCt+UrX8rOAVz9f4Yoc623CV9WsZ1U5fIXIV804R/u7qW9x50NID+gGO/Ddhbo7CRq+5S7qTgBvL2Pnzp1FzLKf2bfwGdfbaoOMfrqBzCRJTLFjAflAhrTfrKNjTy84hj9XCvXRO+P4PPntKj+zlMGJVfIEYE0gVbAMTjQoTyjpdDqdIhkjodUB/yFB8uCgDRw9ByT5zwlVMYJ6YdGJGx2XtX7LCdQJtqq7tSvkJx8YqLUJ+4z1ZN+UofXh2MI6+1wa5BHEA9bxE4ko2aFjrR20btMci3Vw/HL98LMLbxPqDKWBfNgX59b5ownQE2DdottygOMutMCWvL5SaD9LTBhHzx94ugpbic4KwUmYkxRs0gacnLDOCQ2dVJqmkuW/xaLx1AH/6W2QPSqwC2yBZGa1DfSALpz82tBvFmCf8qfutEPwOXy81b4WHD3bIVSWtQyOL/hTxxwo214Fxwg/1KrtyfHC7aYKnAOd8XyJGP3DbcmrHIl2gViGnk3ksw9gg7bbBesMfZv4fznDfuNtK4H66JpxQk7hxs4JgI/V32cNq25cRzBMAq1Cy68KfiTJqmM0nFhCn5qmCY6P7QzxV1tNmV7jYNSydD35u24vmrLtIbgzaHKeBO6w6PP1d8RYU+B3rzoztgO2a7tZKJOLePWBW+l16OP4Z4gmsJzQ+djf1LaolwQGeW3h6cLK1fzVtM1yxwHHQFPq2utyY9kPPqwgAXAQh4J3GoQCclZ0E0ow6GB8nljxnRMC6qHrMwraFiF7laGvkNDRWc/nsnEO6tskSQ8LysdVKrDqz/6BH3nfqIQSom5rdWBAyG1TyM/a//p7HTgeOrFuLCvk66bgqlzI9hyvsA3W62BZCf2TDdvq8PlfU3VZ0ENvh64W2QB1RJtoevExKjr2muo/TvSAjON5VnScFit+8IFEA0ej4UrJFcC04ICEvrMSnGV6IMlAZ6FbtrqzHJVhkxl0ZL9DZwtcD+iAurLMccMdjqfnZOpg/3A9tE2GhRNqVVsrgx/W1PblbdwemjwXpOMTg1F05GU5gMuuInQM2yME6mGJwYwGM4hloTLqyLKs78FwtE/Yk3WAvNBgpQrWhePSUr820LpW2X7SsC2cukibFR2nRX12WAEk9MAhNzhLcpwEHIQI0FkKTCRAJD+XJ3R86mNF2XxUdJJsAnSEXroTqoPrgU4PtpgEWkfYP6OHf6vA+agD6s02GQXoA3Rbq4Nf7a511duw3fqgJhNK+nhAGtvZHqHYDqH1Y/tiCdWnCXxOU1lzc3N952ifs10hD8dY5Asdr38+43Inga7bLJCVXISFtu1qzEbvO0Y4ILnztCbvSaCT1SzhA2+ThI74LOtwdDJqA06WFnBskl+Rwfe8rwr2CR9vObcN2K56XfulDB5k8+CrDdjf3GmxvnXwnYyUXtOtQSLX8VeFV3c5IFt3Ck5dlTaNXciz2BcxXFZPDfubH2i1nI+7Hlw33V5hB94uDWIcccjxOKncyj5km3O9pgls6oa4K7jSWfEWYCfr9VkIAE4kHKScKGeBxcVFcXTHw9EdGm5U0Dlp8b/+TNOkktGT8Vn+90ZOvHWgfpLXCXWdlG/YrqyvN3aQOM+rhynbiq8yGWXbQ+BYRwMqrjfbv4lcAL+j/nhuQsviMq2x62gQgJzCOmtwrDWOoTP8PT8/X3y3nI/y0A4kcC7qwO3YCuq5tLRUyOVYGzcucIcKsa39Oy2gH2JD67urMpkImTLsbG5gsxQESC4yQpIdBy6/Gl21atVA4uQEi8bONh23fZskOCRE7rAtNkbHFXo2YRKwzXmbNUa4M9AdYlv+yfLBckIPIItRPgYCeiClYwmgDpa6l9HJ/zGCXIByIDPLn5OwgHPxYj3tJz5Gf7fEL/sMekuDOOz1ejI3NyeSl8t2DZXfyR/+Ddk+BOJK/7wzSVhXxKGM6c7rsEBHvrNntfFKZcXM7bJ582ZZt26diJIlgVG/c062bt0qmzdvnnoA+PxnjcXFRZmbm5OnPe1pstdeexVJwtKgLccwTed2ERE55phj5PHHHy86GMZT54ZO8Zd/+Zdl/fr1fcfVcfjhh8vGjRv15iBJfmfl+c9/vt7Vh8sHT+gcfvd3f1eOOOKIQt862znn5PDDDw8ex/7h9bbndtHleO/l+uuvlw9+8INBvRjUv9PpyHe/+13ZuXNnsb2qTMl9fuutt+rNpXjvZdOmTbJ9+/ZC57oy5ufn5Zd+6ZeK9onONdQxYg6gP/mTP5EvfvGLencln/zkJ/tsiI4cAx+XD+gWFxdlYWFBrrvuOvnCF75Qqz/Iskw2btzYV2+0Fchge3S7Xdl9993loIMOUpIGgd5LS0vykY98RPbff39ZWloqBgpV3HvvvfKWt7xFRA1+oEvIR+vXr5eXvexlfduqcHkbwboF69wujNYToB6Sd+7w7c9+9jO5//779eETBbG2tLRUPN900EEHyZo1a/Shpdx3332ybt26oK/KiHO7NIDf299kbhcsmzdvDsrSYN8dd9wxIGOaC+ZWuPjii7XKtWhZdcswc7tMgsMPP3xA16rlkEMO0SJqefOb3zwgp26xMOm5XZqSZZnfb7/9BsqtWo455hgtppZjjz12QE7Vss8++2gRY0GXW7ece+65WkQtZfMrlc2pcsopp2gRtRxyyCEDcqa97L777oV+VbmXaTK3C5amrF+/fkDGLCy33367VrWSe++910tFHIWWOLdLJBKJRCKRiCIOPiKRSCQSiUyUOPiIRCKRlrH+Nh+J7KrEwUckEolEIpGJEgcfkUgk0jLWf31EIrsqcfARiUQikUhkosTBRyQSiUQikYkSBx+RmUK/XIpvX+t160N9/JZIfkOkFZTD5Xl6lTTL18c1BTJD6/wpql51NLHXKDTRSQJ68Vsp29I39OIyHWdCMeGcK95oWwd01G/O1bqz7KZoWaOg6631wXd9XBUcm6G6RyIh7BEWiYwJdLK+oiPnpNbtdoPHloFEild5W94MqeHOJaP5XVxgjhvebgHnaiBHb0PdrfLHCfSGTtzJat1D8HFZ/ip7Ua+hHgVP84zoQWhSMr+T9754JXkd0BFzx+CtphpsC8VzFYgngEGRde4ZoOsJmZ4mjoTuZfEYwjWYBycSYQZbXiQyYdABcZItWxcaCPB07HXgtcuOXreu5ZaBBIvjdSfDnQjqgc64DsjU9cVARgJ3AxxN3T5t0KlBJ3RE3jg/CDpTT4ME+Mpyfh2wpd6G7Txg0jpYgOw0TSXNZ84V5VcdH6ibpdNm3UREFhYWRGggbSGhqQQwwGOdUFfEFvZxTJbh8zmpcK6QzbXdIxHGFr2RyBipm7RNd2Tee+l2u+Zb40JXipDT6/WCZVWhBwR8PndcOMbSOaBunLglPxfrPPDhMpvqPy5QB++9LC4uFra26IeOkI9tcn4d7BehwYCOJ+wLdc5VVA2+8Mlx7fLBrxVPd5R83tFDlqVz14NkLl/HFeyi47iKJHC3BzIs8R/ZddklJpZjsO873/mOHHXUUXr31EDjv/jii+WMM87Quyspq2sZw0wsN256vZ58+9vfli1bthTbkiSRXq/Xd4WYJEkxfffWrVvl05/+dLEvBPyNzxNPPFGe/exnDyTyMrIsk49//ONFokeiZblC/kvTVDZv3iz333+/qXMAJ554YnE1CzmoN+Tge5qm8upXv1p+//d/v09GHfvtt588/PDDenMplonldFv79re/LT/96U/7bFTFjh075G/+5m+KDp/PsZxfB2ScccYZ0ul0JE1TmZubk16vV3SQfOWPY26//Xb5p3/6p9rysywr7sC9613vEqEYSWiyReiR5nfdRETuueceuf766/vkaVw+cMHEZG9961tlr732KuTUDcDvvfdeOf300wtdQjEreWzBDn/yJ38iL33pS82DpLm5OTnuuONEcnuwzcrs1+bEcmVccskljXPpJLj99tsb9T1xYrkxEyeW2zUnlkvTtG8d/llaWvKe/JWm6cC2TZs2DdStaul0Ov7KK6/sK8cCzi+b2ClJkmK92+32laeP1QuOhwznXFEOf3Y6nb7y3/GOdzSqg/fe77vvvgPlVy1NJpbLsqxPH/29jAcffLAoT9eb7TrsAhnee9/r9YpyEXehbd57/+EPf3hAVtkCfcsI2SJNU3/11VcPyCpbEEubNm0qZKA9VHHnnXf2xSR0DW1D7F133XV+cXFRiyqF26iVOLGcnTixXCQyBnBrFlf9uFLCdv6un/GwXplBRpqmsrCwUJRjuTOBKw3og088kKivRlgni36YJh5XjCwPV+KeflefNUJX0fi9v+yql+Fb/6gvsPinDpah76DxNu0r3LGoA/7Bsb1eT7z6WYdtgXJw18WKz++c4K6fGJ95SvK7h5LHLM7Vd0xwdwZ1sT5wi7ppe81irEZmC3v0RyJjAEmKExffqtZJDElYGjzxz+csLS0V2yzJH+dl+fMe0I3lsCzW19L5cucA+dgu9GwJZHEnZ5E/btg+Sf4TRpI/+6A79BBsL5yPbW3Vj+VANn/6fNCT5D9NZPlzH5bBD/yD8/Ags6NnKCALcrGd614F9PL5s06uwXMjbEvErG43HHfScNCH+EVc4lzUPxIpoz77RiJjBB0DdxBIZNzpglBHYkF3aFpuE0LJObTNol/oPFHbuaPCdsvAaZJAH+7YdCdXhq6b3j4qLEf7X8dYkt+R0LpUoWML21g25OI4XW4VOhakgW0B2wADprbgOzAcl22WEVl5zFYGi0QikUgksuKJg49IJBKJRCITJQ4+IpFIJBKJTJQ4+IhEIpFIJDJR4uAjEolEIpHIRImDj0gkEolEIhMlDj4ikUgkEolMlDj4iNSSZZls375dtm7dKlu2bJGtW7fKtm3bivVxLlu2bJHt27fLli1bijIfe+wx2bp1qzz++ONa1VqWlpb66qDLCy1r166VNWvWFMsee+wha9asGdg+rmXt2rWyevVqWZOXveeee4qIFD6pWrZt21bYa/fdd5c99thD1q5dOyBz7dq1ssceexR122OPPWRhYWFAnl4gH7rgRVYSeG/HNIGvOW51HGzbtk0ef/xx2bJli3jvB/xQtiAOuD0gXmEflAFbbdu2TZaWlgZk6QX+xucTTzxhjtuteRvB+fAx/A75iAf4v9fryZYtW0zte8uWLfLEE0+IkL/bej9LZIWj37c+LeLcLrM9t8tuu+3mkyTpm1+gjbk36hYuj9fn5uYGjg0t0JF1bTJHguRNRMdUk3ksRoXn8MCcG5/+9KcH9CxbMI/Hww8/7L2az6SMLMv8rbfeOiArtPC8NP/0T//UyDYPP/zwgLy2Fz1nTN3cMc45f95552lVg/C8LWUyeV4e3v8rv/IrWlyQXq/nsyzzvV7PH3rooQPyq5Yjjzyyz9+heVggG5x88sm+0+kE66KXJEn8brvt1icrtK6Jc7vYiXO7RHZZPL0imq9qJnFli/ISmilU8jsYljcoZvlrv6ErXm9txTnX9yrzabxhlN8giTk3mtgex8J/bAP+xHGor9VOGb02fFZe+w5Cuvj87aOor35DJ+pttTHK4Feyc3xwu2GZ1lekJ/lcROw3y7wukvsSb0NFvfHJ8BtT0zSVNE1N9Uf7EpIPdBmRCDO5DBpZtjg1lwQS1aSSC3eEOtnVoV+VjVdLWwcPPp9PA+s4jzuUcVLWaTnj67m5/ujEhORyZ4S68UR3VlBGJ58oztqxjhv2EerJdXb54FJo8GCNDaE20Ov1Chs4NWkh69BENoC+LFNPDGcBeqDuHAO8v9vtNtLT56//Z5mTaBuR5Y09wiK7JDpByRR+20VyA9yZ1sGdKDobPSCxAjnooNgm4wJlJHRFHroLVQYf4/M7E0K2g31wHO+3yAe602k698g48WoSQdaV7YsBU5ZlxQR5FrJ8Qjmv7ippMCjhOxF1+HzQgbgVFRN1sJ+xniSJLC4u9sUvBrRpmjYa2HDbwl0vbnORSBn10RvZpUGC5IRiSZptwUlMd2jWAQQ6H58PYtI0lfn5eX1YEJyHspDEIWcSoGyd0PX3EOhgMRsq7uJAd3RIsA3vt3RuQn5hG1sHR+MGnTZsCHtgH/tV6OcMa90RW4BjwtFgF9/5GB3PIfh8tivrXgX8of2M+IePMKDtdDqN7nxBJ6E7ZoiDSKQKWwuL7LIk+RXh3NxcX+K2Juc20Ek7oRlC60CCR2IF1qs71Jk7ECRmS+fRBihbdzaWBI8r8V6vJ2k+XX2apn13TzDQcPRzidW+iA9RNoa8WUB3pLAbPnkwou8M1cGDAEc/hbn8bhI6Z9hbyDZNYhB3JjCIFOPgM3QnBn7m9syDTW2fOvj5E9Tboltk18bWwiK7NJ1Op+hgkFh0RzguOAEioSGhWxIckjbWkfit5+sE7OhKWu8bF+jEuHOwdo5cf3QSeoDAHSP2WX0MO6IMflh1UvapAvFa1SHyMdKg7kK+wLm6zhx7WIdtrINX9hEGDVb7Li4u9sUN24DXeZDC7cQCcoOoAZjVhpFdE1sGW8bopGBtUJOEEx/Q36cJEiwnT2vn1wbah/qzilCn0uT8Mpok51HQHQa+W8vm+nNngHW+apdcPl+h1wH5iAm2tQUdS5YymwD9Qm2sTEfX4IFZHV8a9h/vdw0HOEK2cQ0emJ6bm+urix5kMtAPAxFtrzJC9c4aPrg7KiF9Q3pNC/adjJh7VgqTi44pwclHaJQ+S87XyZf1nTZlukw6uQwLOjcdB65BBz4rcCfa5JY91xnbEGeheMM2SwcMGUl+N4g7NYt9Xd4JI5b0YGhU0M6hJ0Ad9XG83wJsh3pgHfK4HOz3Q9z5ABgYWNtfmv/EJsrv+M7ge6/XG9hXhT6Wf8KZBGx33mYd3I0bxIaoeNF229WYXIRMEQ5CbvCTbCBVcJJHYpIZu20JHdHA0dksB7L8bodOvMuh8XNCxbrLr3yt8cvHcZJG/fk7l4F3itQRSvRW+6I8dCChfaPA9eH6cnlsEwncFaqCz0MZuhwNfGcZQOp4DcmrgnXgOICv2Uc4ttvtDjUwQjmh50zGCeql62J9F8o44dhyebvFT2dsu10RW/Zaxnh1hYEGzL9zzwJI9Lhq8BP+aaMMbjicWEOdxSyCBr8cdC2DbY2rUuvgz+U/IaBjgQ9DMuBjbNuxYwdJKocHQmxni825Y9Qdlv4+DNCB64ycAPnYh44CMWNpf5CBgQTLwD7d6Wf5YM3SOUIOZHby96hIg8EROjwJ3CWAfNY1zV8yZoF9rNct+o0K9Nb5yDknO3fupCOnA/wNO6PvYV13Vepb1zKHkwC+J0lifkPmpMCcGEhIs6QbgO1kClc3o8CdLvS3JP5ZArbGvx0woKgDHZfPO1xHnaME7mCxjRYWFortVaAzFdJTt7syEFM4H36B3qOiOyWUg0E+9sEmiBOL7pKfl6Zpn976XO7wUV9n/LeLlsVz51gGR1n+kCouwKCvkGxt6yZto86+kwJl8aDJGr/jBHrBxla/7wo4r6N7SnADuPrqq+XUU0/Vh1SyefNmWbdunUigMQE0jCRJ5JFHHpGrr756oHFPGiReJL6Xv/zl8rznPc9821OGGKicddZZcuGFF+rNQaDbpz71KdmxY4f4/F0QS0tLMjc319dxzSKwK+x86aWXysaNG/VhlUwzRrLAG12dc/L9739fvva1r6mjw2T51dbmzZul1+tJou6she62ZVkmCwsL8ou/+ItKWj+wb6fTkaWlJXnzm98s++23X5+sKrZv3y6XXnppUX5Z2x2FTqcj73rXu/rK6OT/4IL+Qh1FlmXywhe+UF760pcqSYOgns45Oeigg0RUB4+4w3bsc87J448/Lg8++GCfPA1sAb3XrVvXKDc85SlPkV/7tV8TCeRF/s7rf//3fy8PPPBAcVwVLv957rd/+7eL8xGzHLuas88+25yDAPxkIcsy+ed//me59dZb9a6JAhvAvt57OfXUU2XvvfeutA9z3333ybp16/pitY4rr7yycR86cfRkL9Ni3BPLNZnsatLwxGG+RP8qtC3qlmEmlvND6DUr8KRZp5xySt9EaNo2oWWaVNm8al+I/fff3zvnfKfT6atf2WSBL3/5y7WIIKGJ6prqBhlNz6uDJ33Ti5600DlnmkxNL5CDsjKabA55J5R/rrnmmgFZVYtzzt91112NbJSmafD4Mr3Yl3pfCK6rpmy7H8PEclV6zCIW24I4sdwyh0f4wDqKHCdezR0iua6zeEchZMPlAK4UcYUP2y6HeoRsznFiAcdn9FIx/RyUBK7Srb/7QxbraNUN8J2INoE8XGHylaYP3AnIAv+cqAPH8jl6G99VwaelDJaDXOEb/DSEuzL6eFyNa3twXFiuyiEbWHQaB/AZ581ZyaFod1iXIdrHSqQ+ulYIOhno9WlRpo+l4U+LWbDbMCyn51Q0ZXFiIXR8aGDBHaLumC00PV7T5OeEpnCnzyAedAfaJE70YJY7ZG2T0CCoCvgB8vhZFS27itDxdd+tcF1GidM2YF2sNh438BfWZUq2mTVmwzuRSCQSiUR2GeLgIxKJRCKRyESJg49IJBKJRCITJQ4+IpFIJBKJTJQ4+IhEIpFIJDJR4uAjEolEIpHIRImDj0gkEolEIhNl2Q8+9P+l8b94/X/+lQ7sMIn/2fN7DfTLc/R+C6HjQtvapG3b6HjT3+uwvluiqVwpeZeFkA343QNoP03tw2XocurQ8cLn6236c1S4nvyeEWv9Q7aCDetsUbWP8YFX1Yfe01KFtjHDsvS8L3XguCr5GtjHij62zq4rDfhex4G2y3Jj2Q8+vHrrHyfUYRL1cgf1b+uFWnqgkeXzEfR6vSLx8iRSaCCZ8Q2O/FbLjN4EyOeibK7PrPgWOic0c6gM+YIjlw+aMfEU7I11IblNOh/IZZsmNN9Els+winqg47TA7Q5luAaTZ6FMUXqi3tAZOvFnG3D5HMdW+RyX2s6sp/YrjrcCe2T5JH5N2jfXEd+FYqhDM3w3abuS14Htxlj1qwL11Da16rcSgL+xzrl2OTMYMcsMlye6Qw45pJjxE8vc3Fzf95W6CAUigrNJ51QFZK1Zs0bm5uak0+lIkiQyPz9flL+wsFCsd/KZU1//+tebGgcSn/deXvKSl0iST2UOefje7Xb7/LuwsFBMJDhNoCsniHPPPbfQXfuqakES73a7xaAM9nfUiYmIfOYznxk4v2rpdDqyYcMG8fmAJk3TYt17X0wauLS0JIuLi+K9lwsuuGBAjl4QDy5vb7fccov4/IIAulbxyCOPFLKSJCliieXy/iRJ5LLLLhNpMflyxwuZ55xzjnga9FoW2IBtg/X5+fmizaBemNiyboGvvPfyhje8oZCr7RNajjjiiKKO0NHRZIAgoUHHG97wBrN855w86UlPKvKNCwy8RgGxD3lWnVbSsm7duiI3sJ+WO8t+8CGUNNDxwmlwUtUy62h99QJQb6EBSBK4GmkKOlUkPwlc7SFBOEoS1gbCPsOVocuTjD6O6fV6Mj8/37dtWqAOAJ0DbFQF26hsHZ2EV7POWtC2hO+0L1FGkiTFusV/XEfohPMs5zPe+74YgGzoj238vQ1CNrXKho44l+2BOBB1p4o7/TpQX8jHp24fZfAglv2e0V1GfIdMfYemDvYJvlvtVwd8Dnkcp7sSiAHkVatvZpll70Ed6GhU2I71smXW0frqRR+HRINAHRVu5JCHifB0wgGuwcBOJ0XdyIQ6AhyD8hcXFws508JT4vX5VSpi0GoDwLZgmdrX0sDG+lzEByd1bV9uQ3VoPfiOh1U/oVjSkyxKrg/0TfKf/PQxo8ByYBPoUQfqmOSDfejo8kE51w/r+i5BFVxvITtZ697tdgt7sd95YIR9gGPEAt+ZE2O9rEBXbbs2cttyBLZt08bTYtkPPoSCHwuwNtDlTCgpIVlzQhkW7khcfisZz3voBADbY7vF/kj2kp+vZXrqBPGJZDo3N9d37DRwdBUCmzfpIPgYHnBhXyiuRXVmVfBxfDx8CLhsdDyWDljrgNvDWK8Dx8Lv0Itjl+uQZZnMzc31xc0ocOyx33jgYAEDZqGY4DscGf0shzJ1rIdAPaETYsGqW5Y/zwNfQB77xgeeLcrUnZEy2E9Z/nOeGH1vhQdru9qdD8Ql+wdLG/E/TZa9B7kxslOwrHTQaejGzgllFDghIwHiu+4AOfla7Y9juA5cpu6E+Luu8zTQAwYJdMhVoKPHOuThk2XhOGvHIPmxuoMQusOA7/Alx8zS0lKxXobWkWVYfl7g8oHWg23MtmkDzhscv+yXKlB3HJ/kz+jgE3B8e7pDWQfXu9PpNB4U4VjtC/4OXaAXFgscX0n+k13W8IHYKrj+nvIPx8dKBnGJ+GK/tGHfaVIf/TMOEodQoOL7cndOUzg4rcnDSij4OQHoRtE0OXi6UmR/ckeT0dWltXMYN0i8rDOSuIVMDSQ4kUsgpnmbFfaF7uQT+hnDqQ5Rd1ghuN6oO2RYYoB9y2WXxTHae1ttG/LZ3k3iV8c9tunzdUw0KYMps0sZbF/+ru3H7Sy0v4wkcFWuY7cNtCz9faXC/tP2Xe7MTC0Q7GgEwwQXNxhr41kJoK6clHX9ddJqkvggl+Vr/+ikkxh/FgCOBhq6Q9eNDcc2ka91b3KuGGJLJ25tnypCtsL3Mp2bygcsFzL0P1NwzDAxwmVpv4XgOoV00J+S171J/bmu+pPryn6w6F6G1hWfrHMT/UNwGXWgbiH7Yl3vF6OO8LsE2kDok/db5UsgFrW8lUqonmwLHc+A/TKrDN/CWgKdCBo+dzzaoJHRgV2bJFdOnFjXCQe3WyUvAwMJK5z89c8v+jvKttYBdXbq/RFN9AM6LrnO0IttYQHH8qdOKmXlWoBtE7pbxD7Ed7YNfy53UFf9yfu5/kLPFVnhOABcHo5hf1rjd1R4UAVYD6Dblz4nRNmxOnb4ONhFnxNpDseXkA+5rc8qk4n+CqqMFINzdEK3zoexK/9e7fP3OOA77+/Q+xks4Hycg0VUsuZjy75b4MTX5HzdkbDefAzvs9iA68yJAzIyusPDcq0dF47L8p+svHq2gWVW2Xol4ekfKfiO+nY6Hemof4JYqBrc6XW9bZygbuxffBfldx586XioQtdbKgbH2N8kR0Sq4ViC3Xu93kTiaxRsGWwCcIItC9xIc/QDosM+CKYTMl8Z8vY0/6upNbniuCzLigccQ+exPHSooeNC4FxPz5WEBmUhLPbiZM7HWpIrjmc/MXpQxoMRC5n6l4VTAxfWketg0X25gNjXftK+cvlDoXhg1Apk+cC/RkR1xGgb8OW44Tgv86mOp6btS/JjQw+Ao56wP47T/7aKDA9fTLj8X2pN4ndaTF3DjN7pgKVpBxGphhNu06flAXd6CGx0jHo7krglucD3Sf5mTw13GLxNGsYHygl1DlVwQkVdWSfI5WNgB2vn4mlQhDKgq8/fOgrQRqzAFxLocLGO7Xq/Vf9ZR/sdNuYEzT7lbXVw7oIMLQdweRkNCsfJ4uJioRvQfpZcHwwQcNVcVg8NjkV9YFvOGQDHdRr+NBkJowcZ8B9y8ywz9cFHov4+mdF/xWNwtgMnXJePjEMJqAwkE1fyn3MkXGyvSsAa+B5XQtCJz2dd+Zgm8aEbqfVcfcdH15UHGj4f3FkHXkLxrztH7HP5K7v1vjRNTZ0XbAWf83bIQp14kYaDu1nF53cj4Meq+OH4zYzPLHGHjVhAe+FjhOSXlT8OVq1a1fcdunHdXOBfTmynKjh+0U51/LJsHBNpB45Z/uR9s4rzMxAJrIJzTjZs2CCf/vSnJVN/v4sMBxIC7PmKV7xC3vCGN+jDSvHeyznnnCNLS0vi8tegz8/P93XA+BkGdy/m5ubkaU97minR+PwZkvvvv1927NjR9w4KdBgcC9i+1157yQc+8AElrR8dQ3/3d38nGzZsMHcuaZrK+vXrRZQsLZe/X3/99fLVr37VXHfvvVx88cV92zG44GTOZXzrW9+Sq666qrYO6ETSNJV169YV39muWBfVMf7whz8c0KuOW265RY499li9uZQf//jHsu++++rNlVx66aVy2mmn6c2VnHnmmUU90zSV+fl56fV6xRU4/IAB19q1a+WpT31qbQLn2Ny8ebMIdbqwLXfOsLNzTg477DD5zd/8TSWxmkMPPVTuuecevbmU/fbbT84555wiljJ6Bwf73uXtem5uTh588EF5/PHHJQk8qKrx3svc3Jz8xV/8Rd/2Xq/XdyeT6y4i8oUvfEH+8R//Meb3lkCMIRbf/va3F/P6zCpTH3wgKHVwRsYHAtRqc93RirryRuJGA0iSRG688UZ57Wtf23dOHRs2bJDDDjssWJ6OE6vuAGHe5JwQXO8qPfW6lbJzRqk3jt9///3loYce6tMPQHbZdyuzNvgosxe2h+4gee/lIx/5iJx33nl928uArdCZe2oPouIE5XLH34Smgw9RvkQbxXbWBcd8+ctfbtx2uc66XaDOZb6IjAbbu2lunyZTH3bCQLNuqJUEAtVqc93BSuBBNi0TCW4YQuXpOLHqDpBoR4XrXaWnXrdSds4o9QboXNBRMHXflytl9sJ2PfDgfVa0rXSscZxgezLB3+RZP26X3vCArBWn/q2l9/FnpF3Y3joPzzKD2TMSiUQikUhkjMTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSixMFHJBKJRCKRiRIHH5FIJBKJRCbK1Acf+n/njP5eRhaYQ4DR+5r8j53P1XJAaHtoWx04B59N9ARl9gytDyN/uRGyR9PX94fsZT3XSuh9C8PEUBlevfhKAu8CCL3zYlKUvSMipG+bdhE1f88osuHDrOTtucPI5nMyNUlgm/D7IRzNB2RBtzEskwDl+JJ3ltQROrauPxkFbas6yo63nDvrTH3wkSSJLC4uiqjkUtaANVn+RjdH823wRFyQw8GpE1wV0EFP0JTSBG0hPUPbQvCkXwzqZcXT/BI842yok0Q9mshfrqCOnEw7nY4sLS2Z6u8pkSZJUsSW1b8WUppFlWOsrTJQ97m5uaI9oBwuI83npAlN8DcufP5Kc8Q7xyvaNGyDmMXxbcGDLsi1yucYgpyEZnCFL0P5TLf5EDiH23bId6MAO0Nulg9ymtgAMYbYaku3Olh3trsV1JlJVH/SFohfn08WabER2gTaJuo3Dv0mTX32nQDz8/N9AYBAsgDnIEn5fK4B3i9KJg8c6oCzeS4TCUw4xscCS3CgkXODRZBarj5QhqNOA5/cIMWY7FYasA8nUx0jVeikNjc3VzR+i38sdPK5NjiBt+krxCoG+agLxwbahs8HsZO6C8JxnmXZwMCHdeTka80PdUD20tJS0elKgwsUbuM+77jRnoUGD5CHCwPEkBXYheOirRjx+dxKHAtWG2f5XQLYbRz61QE7ooNGn2CF8y7r3MQ/ZbBMjgnkkTrgB33Hy+qfWWYm5nZhnHPy+c9/Xt72treZjZskiWzcuFEOOOAAEeUgTuTcuP75n/9ZXvayl5GUMDg/TVO57rrr5LjjjiuCXCcYUWXu2LFD9tprL5I2CAZNkPGxj31Mfvd3f1cfVor3XtasWSOOprGHLMgWSii9Xk9OP/10+fM///NC1zaBzC9/+cty0kkn6d2VYG6Xtklp/o5f//Vfly996UuSpmlfZ1PFtm3b+mzZpt0ga/Xq1UUc6HgdBZ8nqV6vJ9/73vdk//33LzpIJGnEBtcpyzL51re+Ja9+9av75NXRdG4X733fJGbouFkvn3duPm+Hq1evNvnNCtcd5adpKjt37tSHDgAbOudkn332Kc6F3UXlHckHOp1OR974xjfKZz/72T55IdCRJkkiO3fulF4+5b200EFy3oDOb33rW+UrX/nKQEyESJJEFhYW5JFHHhFR+a/u3LZBrCBu/vt//+/y3ve+Vx/WB+ubJIk89NBDsnr16lZ114PRo48+WjZu3KgPC+K9lwMPPLA4ntvsssfPIFdffbUXEe+c8yJiWjZt2tQnI8uyvu9MlmX+9ttvH5BRtkCPm266qTgfn2XlpGnqt2zZMiBLL865vnpedNFFlXJDsI4sK0mSYHlnn3229zU2GhbIvP766wfKrls2bNigxY1MmqZ939/85jd7KbFN2cJ2KlsfhSzLBsqUhvFftXQ6HS8i/uGHH/bee9/r9bxXtuF17P/mN785IKtuueWWWwo5TUjT1GdZ1qdHyL7c9toAbS3U5vT3EHwux1Sn0+n7zr7sdDreOedPOeUULS4I1xm+GRdpmvqTTz55wK9Vy+rVq4O20m1vHGRZ5peWlvRm7733F1100YCuoQV+SpLE//SnP/Xe6HsL2l9pmvojjzzSS4P2vW7duuJ81msS9h0nMzF8wsgeI1e+6rGA28p8PGTik2+R4zjL6JH1wNUyrsxcYCryJrKF6uzU5GzQu44qG0EG38p2zsnS0lJR5q4C27mJfUM+xnqb9kuSpC9mdDyPAl85Z/R7Pr5jH9oI7ipYbdQGSX7XBzbgZxugF2zOn6PC/tUyLf7F+TgPdcDdD8mftcG63lcHXzUL+aaJjCo8PQvHMWGpO+MCP0Nac+AouPznZtSB62O9O8Y5nX+ybgPogLtViHPcybNQdtwk7DtOpq49BzrWkRytpPkDe9wA+Ldbvu2OBsZBWgUnFSSWtkEgcpBZG45uJAhwoeDk3/C5ge0KwAbwX9OkjWM9DVyw3kROGZCV5T+FCA14tW+HBXoi9tFeECvYzzHHbWacIO61LbkTQPvQtm/DPigXsvBpyQ1C56PTFnUxJfQAPB+DfFVHKN/4/Gcoy/l1OHqmieOuiWzd2eO5FqsNRwGxw3aCnXVMVYF6a9+Nis8Hz/xMjaiL4Sqcc31/IIBf2tJvmgxG9oThRogkgwBo0gDQqfDAhRODqIGHNbFCBhIey+QAYF2bBIaj31zxfZhGy3XKAndnEOxomE1su9xhvw078GIbsq9GJSRLx28bcFwhTrhslIWk3cn/ETRuEJ8M9OQErdsH6zwKXDaXF+r069A5geF2x4OQOrzKhyy/rKwmoG3oOLTqJyq2fP7wqgxpw6YgfmAn6GId3ImSAZ3bsK3ksiGTZVt18/lD7uyPJufPMuOPDiNwNhu1SQAggLCOT+5o9fYmhI5HwOptKEfvC+HpYTocX5XENByIuKIVqivLGSZgQ/XWDYEJ+bEOTlJaHuDtbCsr2kZW/RArIT+VreN7E5oeb4XrGdKROzZ8Iq6tnYcuowk4nttkVbnoWKzo+oJQXGv/NgHnlekGmbB5KHeEcNR5eXVXwhrDVbA86KNjog7W0VqvNoFduJNvogN859RFmhVdlo4hbcemNkJc4Rwtb7lit/AyBU7jQQgCzQKO0506OqQqOVX7mLIrPAs6kDmB6AYEO+DK19IAdENmuVx/HIN9fDenDiQ7LkfflmRZLnC1XIU+Fr7T9gmB41zgipv14Ljg79MGuvr8itSpOzjsS2zT++pgv/E5lvhie/K5Ok71wIRjrwqWH9JT68g+DQ1QNGwv6Mk/ieBT19EbBzmhY3BuaF9TWAbq0Ol0Btp9GZ1Op+9nFvaLxX6jgjaJsoFTP1dUgVj39JfjJvZFfbldQadIObbssszhhIKgwvc60BiRVBCQ6JD0sfxpAbohYQ1zq5vPR90Q/LwNia9JBwkZIKFbxpCt15vi8ofGoCfbWsvkxKD3leHp/QvdbnfADk1J6OFMr97PwUnbqt+kgB304JP15HWLfTiuAMqxxJf2I8pkmYhnxmpbDIIz9dddgLjVnZc0uPpFJ4eckNJzRV7lGi7DIh+6Qw4+QzYZBpYvqn1ZSNNUVq1aJZ4G6ZLLsdRvVLRN0M4lf9DXCs5hf1nsy7ZDuxrm7smuyIq3DncSCCzuIOrgY5FQuaEyOmgtwQu9EMQI4Cb4vANE/VgO68oNzAoPNgDqxdtRNmhiY5+/fwSg0SKhaLA9tC8EfJ40/KeBUHLDGyYl1xf2derJdZZt1W+clHXi2l8hXUPbNBxXQm3EmnhxLCfskC0Btlnl6+PYBtxRJdRx8nYLeMaBz+F2rO2ObaH6hdC6+QaDAwusH+xvle+ckx07dvTVB7Gl716OA+jNn6iD5c4HjmX/4LvFBto32BapZ8VbSXfmCEoOuCqQiPhpZR3wocbqVVKuA+fr0XMdWX5Fh4DHJzc8toEelFjgevDPKdzw8Nnr9foGQhaSJBl4g6O2KSeFprCsJr4XSqT6aXXAdz3Q8SJxhY6fNBxXfHs8VP9RdE7ytzBqn9UBnTqBf7hBR24L3Ob08SFcfvsd7YLPQbuBTHTs3J7qgDy2qVMdL+QKtRmr/sDnFxi4wxny37BAFnwB+RYbeDUQZ3TuHReO7niwDpY7HzgH/mHb6vqEYD+zDGv+3pWpj64VADpoBFO32zW/3hbn9ei9A5xMRAUsE9oWgv+BgaC1NtxE3ZkIJWq+qtR3SOpI87+JoQzohe9edVjdblc6nc5AR1SFVwNCDHDYfvp7U9j3qLtFnrYZJytOvDiWscgfNz7vTLnjgp6cLPHJ+6ydI+yCWIFtLPXn2GL7MtCbdWJdq9Dxq+sOYCf2rT4mBOQldMcA53HOkVxn7E9owF0HbKkHaBb9LEAOXwCwratAnfQ2y7ltwvGA/IHpBKqA/hwXTQYO7BPOeU3y365KfetdQaARi0hxq7AODDQc3erXSUWD4y3JUdTVn6irqTqQrLPA38u4vpwQMJdOVR0AdEIHBlguZHNjw0R8Fji5SqDh6kasy6oDevAAUgJyQ2TqAUL4FPXGMXy81baTwtMABN+RoEO28HnHY7ly1PWEXSy2FaWbq2kzOBb6WeD4ZZ1CevM6+7cK6OLVQFQPFCCLdbB0jqLOZdta9LPAcjBI5brUofWAnyYBbAwdoL+nv/xWAVtCThK4g1cF6orz+TyrjF2Vqc/tAtCwRESuvvpqOfXUU/UhlWzevFnWrVsnomShU+bt3nt54IEH5Pd+7/f6ZITghnXSSSfJAQccUAQVl8NJAYH/+OOPy9/+7d8W54dwdLWXZZmcfvrpcuKJJw406CpOPPHEogHwedAJeib5HB+HHXaYvPKVrzTN7IrGdfzxxxdXtVxXCSSfLMtkw4YN8kd/9Ed920Mk+Uyx3W5XTj31VHnSk54knv7WyvbhcnH36pWvfKUWGQSyPvzhD8stt9wic3NzxWCkjne96119erANYHfYdn5+Xg466CB51rOeVWtbxqLHKDjn5DOf+Yw85SlPKfTGYKTT6fTdbcLdgn/5l3+RP/iDP9CigsAOH/3oR+V5z3ueZOoB7TIWFhbkuOOOE1HtqWw9TVP5/ve/L//+7/9eKxukaSqve93r+uRIoAz253333Sf33HMPSQkDO3Y6HXnta1+rdw/Ei5C9jz32WHn/+9+vT+mDdRIROe6442RhYaG1eNG6Oefkj/7oj2TDhg19g6cyvPeyatUqecc73iE+z3tp/nd2nY/GRYd+UkR5WZbJ97//ffnGN76hju4H9Uf7/e3f/m1ZWFjQh5Wy1157yQtf+MKgn8vq/sIXvlDuuOMOvbmUAw88UO69996B+F326PetTwt+Z/1VV13lJfCO+6pl8+bNQVlt8prXvGag3KplzZo1WsRMYJ3zgJdt27ZpMa1z2GGHDZRbtRx88MFaxFjQ5YYWnqfh/PPP1yJq0fJ2lWWfffbRpigF7fq0004bkFO3NOWCCy4YkDELy913361VHSuWXLp9+/ZCP+t8JZNYTj/9dK1qLWvXrh2QU7WccMIJWkQtRx111ICcquXAAw/03uiL5YT90iwSiUQiuxQr6ko7MlPEwUckEolEIpGJEgcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmyooYfOi3CQK8OEivzxqse6geo6LrXvcSnCqyhm8XrYNl8Uu5mrygqw7WeRj7wk6sE78BUtuRXzRUh/W4WSdkIwvaVvwWVo3lBU4h9LGhGAiV1wZcNmzjjG9PlYDusEETffXxqL/ejnW9vQrtD1/yIizrtpUI29NqV6BjPvTq9yb+miWaZYoZhN/UCCcgqNHIsZ8byKzg1auI+W2GbegJe+gkyEFdBw/ucG4ogQ8DZGX53CDo1DN6M+2ohOrrja/o5nhinUIxFVqvA/XvlLzCfbmAONZxUgcPDL2apCwUn67hrNRC7Yh1W1paKvZzQscxWUtv5+Q6QaZXeaoKXU+cp7eXgeMRZxzD2M6y+HgLkMtwnVEWymC51josZ7T9m9hWqF0hXvmtwT7PYSGZiLFZpp3sPkVg4Lm5ub6GwA2CE3tKU6rPgnOgMwJJVOeDIBp2gXy2B9sAgVu24HgObk9zbIy6IBnqTl1KrlCHAfYVZVvL4Ab2gz1YJ/gHtsEnyrLg6VXnkIUymsiZFmXzZ8DmOp70IjTgxneheXggSyg2eOCg5ekFxyDOII/nreGBEsdJW/bnmIZMR7FTteDYkH6wcdXinCvsxe1MAu1Ll2OR7/NXqnvVvlBnlMFyuZyVDtcT67ANJrmsWiS3GaaDYDn6GPgAn7Nu4/rsO+P4PHn38qncecQNJ4iavE3vmzZosJwYEEw6GJsusA/XWV9dVi04jhMM0GUNsyCJiqo/5LcBdy5CsaCTbxWwh/YRPh0NGlCWtlcdOA+2WQ5wQsQAggckOp70Av/rNskzrALELfY5Y/ziWMBl8aAny+9A6ePbBPZB+VpfveAcT4Nc2BxxXbX4vOPisrCOWHZqUI2LDYt8nA90m+J9WNe+XsmwvVF/xBhm8q5ahGzK7QoDQ/YB/Mi+mWWW/cRyLm9gz3nOc2S33XYrjJ/mkxsl+cCk2+0WE6l1Oh058MAD5dprr9XiKnnta18rN954o95cypo1a2TLli16cx+64/3oRz8qV1xxRd/ttVGBjXyecF71qlfJr/7qr5oD1Dkn//W//lfp9XrS6/X6klYbwF/33HNPMduwpe4HH3xw7eRfXG8RkXPOOUe+9rWvSUpTrXNZXCef3z6+8847i/jENn2eUFLdd999Ze+99w4mWf0det15552S0EAMeujjZw2t56WXXiqHHXZYcbexTv/5+Xk59NBDi4QsJEvHF7Y/8MAD8rOf/azwSRXQ4bTTThOfz+YLm8M/XB4GQj/+8Y/loYceUtKGg+3APn71q18tH/3oR9XRYVDP973vffLII4+Ip1vuVRx88MFyzTXX9G0rsy/qfsYZZ8itt94qXg22y0iSRC677LKiTYka6Oj6p2kqf/VXfyWf/exn++S0zemnny7r16/XmyvZc889a3M2c8IJJ9T2Cbgohk3uu+8+2bp1a5FHqnDOyU9+8hN5//vfL0tLS4UcfGKgiLYwNzcnjz/+uFx00UXyqle9SoubLfRkL9Ni2InlMJGRntBIf0+SxCdJUnw/6qij+sq3MM6J5bIs82ma+jPPPLNPz7YWlvme97zHp2mqVSil1+sVEy4553y32y3WdTlNF8iAfk1kNp1YbufOnf5XfuVX+mzhnKtccBzO4XM5pvTxWNfy9KLrlCSJ73Q6A9uXw5Ikif/GN75R2NsyERbHYej40DZfsT1EmqZ9OopIn43L/KbrN+yiZeH7G9/4Rq1qKVmW+V6v55/znOcMyKlaDj/8cN/r9YL24m1Y7/V6/uSTT24Ug3vssUchp9frmXx61llnmfQfZZmFieW4/r1ez3uKeWsO3rRpU1+ZnU6nsB1ykM5LV111lVn+tKgf1s44GJ3zKBvfeWSfVTz3MG34NidfMViuOupgG+DqEneA6kbdQrei8bux97647duG/eAn6KL9Nipsz/n5efH0bA2uGKoW51zfFQrsAZ3ZhmwPb3wuBnrA167kifZZRbcx2NRyVS4U42gDALekIU+UfXl7FfADgL/YxuwHLquN9qdzk5DssudlNLAD2qEr+Rk0BGKLbYu6sz6g0+lImqbmGHTOyeLiYvE9Uc+V6PhAXdguuwrIv7CJJb4y9XySUN/lKAfhO85pK37HyWxrZ0R3JiE4ueM7N4xp4enJcE+dknVwUAcHKW45wxaW4ESS0PYbF+zDNsrSMkKdThU+v7UplDz0wFUnUk4CuvwyMKhBWRbfzAKc9Pi7tkkZOAa2RczjYTw+BnEMLLYtOybUBlAOtrXR/liGV/98sdhH1CABt9v5gdwqQg/uQgZw9HyIDJEb5+bm+nzkaWANfJ5DXD64btI2ljOhOmp/VJHQP11YFtoXxwa+sy9nmeWR4YzA4HAqO8Di6GnAwYPAkZb1HdUOrNc4gppllq2Pgm60w1J2Naht2rQOOIbla5mzDNeRbR1KvBp9TMg/vC20fxhg35CdQ9vaoiyGLOhOxRJbTWzHvrDIFtXp4TvnC8DfOzP40P80qPMHCB0X6uPwnf0xywzWKhKJRCKRSGSMxMFHJBKJRCKRiRIHH5FIJBKJRCZKHHxEIpFIJBKZKHHwEYlEIpFIZKLEwUckEolEIpGJEgcfkUgkEolEJsqyn9sFHHDAAdLpdIr/kPMbErHwS3ae85znyBe+8AUtZgDW6x3veIfccsstffL4v/f8X/dutyvz8/OycePGPnlloJwzzzyz8XwEBx98sIh6wY/+nze2J0kib3vb2+S8884L/n+8jMMOO0y2b99evKAoVMYwsJwHHnhAFhcX++yJ/ezLLJ+D4pnPfKb8wz/8g5JYTq/Xk3POOUeuv/56kfz/86O+04H9D5785CfLU5/61FZepIRY4nkdRES2bdvW2twjQNt71apV8oxnPEMf1gf7xXsvH/3oR+X5z3++SP4ugrr6d7tdedazniWiYgE+bosyPbBd+/AXfuEXZO+99x7YruFY3bRpU188IL6wDe+2wP7XvOY1cvHFF/fJ07A855y8853vlAcffFDEGL8HHnhgkU9YB/Y129p7L3/8x38s3/72t5WkMC6fT+QLX/hCIV/I91n+8jz2bZqm8pGPfEQ+/elPK2ntYp3bhe1x5JFHyuOPP174qSxuwMte9rKiHtqOZbF8//33y86dOwtfVOG9l5/85Cdy2mmnFd/5PI4P5i//8i/lda97nd48W+j3rU+LUed2ue+++wo5lnfaW45hQsdDZz1/QZqmA9vqwPFnnHHGQB2rFuec96QflxvS2TecWyBN02JOAu+9X1pa6tvXJocffnhRL8wfI/lcBaPMv4F5VLScNhfW6cMf/nCfnUYhy7K+BVx22WUDOgy7dLvdvrki8Hn00Uf36VIFdDvmmGMa+WefffbRogqatqEqdLlYWEfUfW5uzr/vfe8zl492wLarqjtim+fjqFoQvyLiN23aVJRr0W/Dhg2187RoPa677jqTbLB9+/a++pbNm6PLC+1rc7HO7aLzWJO6+3zOllBfoOe4wfcXvehF5ronSeIPOOCAQo7P5XK+5/ys88Qs096lxZTA6JKn9sY2jF49vSJbaCRqfdsgj+h5G8rRo+Ok4euJRwF1g34YCfNoG1dH+lhdpxBJPgsw7MjzUbRVR7xuWQKv2eZ1rXdoxK/BVUKSXyVazmkKyuCrEIttLXCMcVy3ZXuheVSEysuyzDT3CHwD2+rp4i0gLrGudZkEju5khl5nXQZii30CW3CbFIoJzAzNMV4GYopl49Oin6h5c/gzyada0LL069fr0Dqm+SyuEsiTKA82mwU4n/BiBXWVvI6IZUd321F3yefWsvoOtmK/w2+wLZePbegPZ5l2MuQUgVOQKPWcBy5P2tyBwnHstCpCAamDR++fJKgbJzPoh2DFNh2odbBcJBls1zYYFvxUluXzz3Cj5cQAcAz2VQE5OAdLW7CukuuLsiz2rYM7hpQmlGrT/pLrzbpLniTrgA86+WR7+HnISpIP1Dv5vDZt+6cO5AFdpiW2hDobPh910O2RfZkZB3eh9uYDF0NVsG4cPxlNjOjpwgKDIwtcR6E40DYRlUv0edOC2yj8Y607w35C/EOWpwtg7Oe8XAV8hWORJ7GP/cfHNWmD06K+9jOOy39zXFpaKho0OwdBwQ2/KQggOJsDDXBi4O2TgBuNrieCEaNxHK+PKwNycaz+bAPophu/rg8nLE5kdfBVGH+2AcuCToiVNoANkLTY/m3Ug22r7WPpHCU/Hj5M8gGMNfmlgbtebdTLiqOJzoTKtvoPdUWbEiUDfmLbIr6tV6eYuI3lWNHnQR9uZ9gOfZDvLO0roYkqEQdaR3zndi0NbDxOWAeOWWv7gm11rmJ/Iw6QR7HPYl8fuEhGG8O6qHa8XFj2gw/vfXEbS3dacDy28XdrcIm6EkAAcaABBJnePk643qFGkOV3ExDAmbptV4duKDrBjgoaV5ZlMj8/L0KDEZTBNoX9Uec6uKHyTwLW8y1wAujQXZy24gB1FrJ/W7JF2YLlWu58oE1BBseZhbK6Wc8fFc4JfMWKfXXgHLQnHkDp8zGYQ2xYYxD5Dec08T3aOkCOYP2cupPGZdXh8/zLeuFcbmtoE0I5SNtn2kAf/gm/DtgqpZ+z+WcV7IPPs4Y//eJ8nMN3TwBkss8suk+b+uiacWBkntYZDQz7FhcXi2PZkRYHZXQ3xasrPGxrEkzjIqVb/Zw0kvyZDRyDfTjeCo5FvVHWqKBBJvnU0dx42J963dq5Q7ZQUuFEOCrQH8DGbSVXrSfkNvVfGbAnZEHnTqdjuvMBP+H8nTt3Ftv0FVsZWgZ8pus+LlBnHvRa40so+SfqZyv4Sscf6mupH2ThHOgogdgIwXWBHrAv+5p9gEEny0ecYAHOuWJQj/P1MbCP0ECX908brbsl7gFs1KGfvvlOFfZxfpubmxMx9j9Cg1UfaFOe4gt9G3SyxMc0WfaDDwSNHm3C8Vl+RY1gQEOzOoY7Q27AcDq2TwsOcAb140bOx6AedbBNhTpX2H1UuPF0u92+5CrKlwwauwXYAv5D8m0D6MBxwOWNCuuJGEY9rPWvAvZl2UKJrAmeHjh19OBdHTgeuuCzLR9Z4Dgvi7kQ0DN0DncCHAs4rkn9IKOTPxsjxvM5X3FcQl5CryXAceh8WT7sgoXh8wH7FN9FdaRazjTQekK3Jv1DVnLngevnvS8GHRjcaZuFwHmQz5+My2MDOrSZ48bFzGjHQdo0KPkcr0bncASCAdtDDqyiTCfI4DKbwncthpUBuN5CiQZwArKUpY/Rg5xRYb8xbFc0KN5u7dggX9dXdwhVIHb08fiOgZCuQxuw73T5baB11t8tcOyyvS3wOSjbem4b6LL9EIMerTfbkLeh7WCbtYMD3BasfkIZXCfU0Zd0slbZgHOC9qeWhXIRM1aSip+bONfpAVMdoWO0nDqqdOO4Aji27BwN300LfWo7wr+zzsxoiM7ENbgrAeAA7lAQ5NoRfFwT50tJh6W/S0nAlZHS8xiORq9WOInwaJfL5mTF603K0aP1UNAPi8+Tkf4pAevD+AxoXwxzRYC6Qk+2MevNZbVlG/iL24cYY2sSsB4cW6G2EkLXLWTPcaJ9Kg0HBawz4PYM+aJynKgBQRmwAcrBv/ksthU6j0lavjLO1D93WGeQqOc+2C5VwJZZ4Kcb+A118TSY4rKmCWIDOlvbBcPPCgG2IzOM/GnRTvSNAIwX+knAYkQ08E7gQT9ueHyrkpNkHVn+hj5RyQLlMlpf/T1EJ3/YUvKyUvo7pQVOnqg/tnFjZHnYp/UP4fLBIG4Ztg03KPgFdg7px9usNmLYh1aQ3EJ3OLDOuiT5lZD17kwViGfEIMoL2WYa6FjCp7WNoW6IexnD3bUqdDtpknuEBk/cjuF3HatYuL3XAT1gY3REOg7LQD7gOGpSfh0+b6+h9ywxGf0bqMkFFmzJ+Qdy2G/Qg+01TFsfB9x2h9FJv3eG5cDeiAX0AdKSf8dJc0u0jKMHnNCQmzjI5x0tfnfEuRyUSA6irj4sjRdJlDsSbsxtAJ0TejLdKtvTz0yoM851+aCE/7WAOpclCQ1syudJiyNsJAweHOpGw42O0d9DsC2EkiAGEhagE3cqfKWndeYkOypse6YN27cB4gBxy1eqTXREhwTb8TNc48TnFy5cPuyt4zCEo8ET5y1ux9xGfZ6vrHXD8SClvwVbZMA3eBYH57Kuo+DoThXXNZQzoEtocFYGztH/vIJM5A/UjctuY/A/KhxDsBVsb60/chXqyX6vktGWj8fF1LXL1FV1p9MpRtFVhmW89zI/Py9OvXRFlPPQ6fAApA44m0evaBAMy8K6JXmJOg56W8+VvDzoBL34fNiXA9cqHzbVttX1HwX4Ra+Xdd4o26KDp4cg0cFIg2dGpMTniNFOfiWJ/SgD8dYGITlltpk0CQ28uGOUBu0Ln4grTw/nTYI0TYODB0t8ob7we1n7YnmID4sPcazkZST0kLsuo4wsyxrnVCtor1puSDe0CdTBAp/DNkSbRNwAxKNur9MCOiDfoP/hWKkC9UNd2e/6uz4vtH2WmImJ5TIasTrn5Ec/+pF885vfDAZ1CO+9nHzyybJq1aoi+DhI8cnBeO+998r73/9+cwB0Oh15//vfL4cffrhIrnNVAHnvZefOnfK2t71N7+oDjXdpaUnm5ubkiCOOkHXr1hX1sHDNNddIlg/iYMu5uTnZuXNn39+EYd/Xvva18va3v71Ud433Xt72trfJzp07C9si8EcFcjqdjlx//fWybdu2Pp+j0UngDsPee+8tl1xySfE9BBqny++OXXzxxXLbbbeJM/4s4pyTK6+8UlyezNCo0dmk9L977730ej2566675O677zb7rwrWXyiJPfDAA3LHHXeY2sewHHPMMXLrrbfqzUEQFzfffLP8x3/8R1/MVbFq1Sp53eteV8QBf4pxAGOhSk4oxp7znOfIc57zHNMAAXFxzTXXFN/Z9ywfJEkiL3zhC+W9731v33YNbOick507d8pXv/pV2bp1axFzdTG2detWuemmm4rv8EfVedddd52cdNJJenMpvV6vmFiOB+OoM/sS2y+77DK58cYblaQw8N0VV1zR97deyeuTpmmR+zCITNNU7rvvPtmwYYOSNlkQz8jxIiLHH3+8PPnJT9aHlvLYY4/J1772teJuIGzMsZHRiyPn5ubkXe96l7zsZS+rjPupoyd7mTbDTooTmtgnNMkOJuS54447vNCkTVULJkK66aabBuQBXX6WZX7r1q0DsvQi+QRCmIxp/fr1xfllZWlETQ4FufyZJElxzJlnnul9Q1vvvvvuffpyWaMsWk+9Het6si7nnD/00EO1mgNoO77lLW8ZqEPV4tTEfXoSKsDl/OEf/uFAfYZdUHfo0+l0iu34HNdyzDHH6GoOwPUOTW5oQfsI29pE1w1LnQ21P0JLSFZocrVOp9M3qdopp5yi1QzCE4cdfPDBAxPB1S3QpUpfXq677rq+8usI5b6Q/zKaXO3d7353afm84BiXt0PI0euh8i6++OIBX0164brAb3feeWdQ3zLuvfdeLyqmtG2wDcdcddVVWszMUX1ZMiH4qiA0Yq6DR9oY6WFdj/zwnY+rW3BVp68WQnpyeRidVi04B7fi9BWTFdiA70rwJ0bGErBBFXwO5AFsG2URZT9sh2y9XfJbl77BbUX2Nai7Igc4B8fDvtjH6ygHdye4nsMuonyAOy3aPtNCxwNoopsLtNNJAT2duk3PMVO34Dz4RdTPeuxHtFPeXoe2McuwoOOR9W0b2EDbD3DZlvKhLx8PG2Adn2xnfd60FlF3m5x6J5UFn9cFfmTbot64A5Lmzzda7upOG1sGHjPaERxQFuBc3UirQGBY0cHO6y6QPEPbyuAgalp3xqunv/lzWLRtWd6osjUh2fpTGj6vof0FOdaBS4iQ33U54yBkn7YZRndtgyaxX8ao5zeF2w6+W7Gex7Hs1UC+itBxVeXUMUrsh6jyexttJJR7QxcP2I+OeBQbtYmOj5DuVTg14AzlAQy4JM+PTcuYBrOvYSQSiUQikRVFHHxEIpFIJBKZKHHwEYlEIpFIZKLEwUckEolEIpGJEgcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkouwSgw/+/3PoP+d14Fj9Dg39/239//km/zPH/7/5hUBN4f+583e9n+1RB7+bALB8XabePyqh//YP40PtsybnSokdPL1ISMtr+j97tiVvmwRsV1/ycr5xU9V2dFvQx1ahzx0HOi6Bjt1QW7HgAvN3WF77Pgy6DnXodjUJe48DzilNbTAs2qe7Gs1awTIEL2fBm9+EOg1rkCFZ6MmuOCk4ekNils8xYE0QzrliDhbMloqOwEpCb95EnbmOvB9vwLPoxzZCHTOaTMqrOSZgEy5vFLgzhDyUicmyqtCDDZ6SfBhwHgaykKsn7homsfh8AMoz5raBjnPWG/7CnBnoJIe1zzCgXID4xT6tD4616KjrDsq2NwXtQW9jnXkuDrTzpqDOST65Gl9IjQLksr05j9Xh1EytjMU/00bb0DfsG+pgvwHERshmuxT6fesrEcwn0Ov1+ubmKJunQ4P38B9//PFe6F36PN+I/ux0On716tVa1ABZlvXN3XD66ad7Ue/pr1tCcx1ouK44xlJ/6MbzMnh1LusP2dddd93A3AbDLiyHbd7tdgeO1Qv7SkT8Nddc06fnMGg7VM0vYUWUv62+r1t4HpCHH3640JF9xt/TNC3Wb7nllgF5bS977713UI8ysizz73jHO7xUzE0SWjRZyfwjTWHfa33K4rbp3Cx8/F133aVVGAnOjeDEE08cmEupalmzZs2A3+ps++53v3tATt3SlPXr1w/I0AvX0Tnnt23bVqt7E7hdabn6exmY28XqDxHxV155pRYzc+wSQy9cnXTyKamzfI4F68gTo2CcD3A1w+B7kzsLfByXZflZBKBcnI+rFmznq8UmI2/c4dBXAnylxHdBWLa2TRugHKG7DVXgWH0HhPdBpl4Y9rWOIb7K9fnPb/r8Mvi4svVR4Hp7dSdMqO6IwSRJinXt83Gg64lY4qtutq22dR0cpyBrODdKFY5efe3U/DAoE/EC/VE3S/vD8TgWn2yfUYA8+Bzx0DSGdb3bsu+4QR0RV2jXbcFtCTbJ8jvjy8VG46I++pc53NB53dLwRSUtThz4DtAJ4VOMyRHHcHKSBu/nR1C7/PYnGg/qywHP3y26AZwDfdBwtG0AEtg4gFw9ECyD7QOgH7bxMaHj+RgkKB1DsK2jGLDYgMtBbLnAb/yjAF144X3QQceiRf9RwU9MqC9iC7aFn/AJ24uyXRk4j49NaPLFNoA8xEaVXE8/bVl8zPWWkkF0G+BCx+VTsmPdgu5IrefNAog1xLqngXgb8c8yYOMkH+Bb/L+Sqc/eyxwOLDSKJkGFxIdzWB6T5rONckBZOkdRCQk0SU5Cd1q4U0wqBlxW3URd9aOcUJJlG0lLSQj2xzpkYqBVB/uOsdY/lPQRA1l+BSN0xS6BwY0Vfbz+Pgxsv7m5ucJvLh+sAvYnYrHtZ09C4O4VykZscWeodcOsoCG/auArLOxHy/l16LhAeew7tjm+e+OdR+jp8jukw8ZWGdAfHW7W8Mqf68B+49iaZRAT2l/SYvvDp76r14b85Ux99K8AdJJp6nQkDjRMNDjIxX7IxXbLzwJaNs61JhiXJycd2PhkXVl2E7hufBtR66jLalpOCC2DbW5N3kL2xGev1zMlWXQmqDdA+aGrJLZXHdrnKA+fo8Iydu7c2deB8dUXD6jA0tJSsT4udFvCNrY32wJ6W22DjgVLQgNyq4+q0J0vytP6weZC5Vrij+uNgX8begPt94T+cWeB8yH8ltED6bNOQgNG/b0N/WFbtHP2XZt+XI7UZ+9ljqcrDN3omwQXGpRT/3ARlVgAEp0FNGDutEIJLAQfw2XqBqRlNwG66HqyHL3dWvdhgD5NkjfOwWe3222sI9dff8K+ensd8DtAnSx1s8CxPz8/L71er0/XJEn67j6wTfSAaxxwp8d11nZkOzeBfSIqH7RFqLMu03PUTlnboy1gE+Qiq57sN7QPnW9nGQwM+LsP/FQ3LGhTaOdsH4t9VzLttsIZxKmfL+D8LPCzQR1oXGXn6SRnJaFbtU2TC+uiO6y2GpCQLC0PepZtb5OmtmHYvsPK0T7i7Xq/jrsytCzYUduTv+t9VbD8LB9Aa/jvxzgeSXjc8EAgFMvYhjaCbVYbVPk6tG0YWDehOJCAr/TzEcPShgzAsuCP0IAqBMc4/KJtEVpvqr8+PiSXB0GjoMuqo6ydh3R0gYvXUYC/dDvSfphFVvzgAyN5qUkKZSBQ2LlgFpzLOkDHssYwKqHGJKrRcyObFdj/uAIRo44h+6Jx8zoPZtHwQzGjYR04YSBWQ7Hb1MaQyzL0duiP/bpDHRcogztl/Lygy+f9el8Z2idsQ6v96tCyErq4CflKH7/cQQzpump7M03qz3bkjpvL5DxfVua4gL/1gI31ZkLbqtA5wNFD7aEBl/bDrFKfHVcIWeB5Ch0sIdjx2tGhq8hpwEGmB1ujwvXmcqo6Ysn1mJXgDzVMq210HUKyJJBorPKFrjJ10mDb4ztsrMurQuvl8+cHhHxWVua4wSCD2xI/lwKgE+KKB5FVlNmobHtTfOBOKtpgqAwcYxmYLhfm5uYG2r4E2g5I09SUeyXQrmA32JvLBcj1evs4QJwm9JxSqP2gHjrWLeg4QhvFdrZRop5hmWVWTgsogTtJOAVBaQkCOBEJhQPa2oDGiVO39znw2mh8unFzWdwApKSTmzbcMLGuE1oV+jhtU5aty7LSyf+lhHOgI75zRwW7chxXgeP4pxWn/jmBbfAtYmgSHSQPvLQ+oViGnXTsVcE5AFhsZwE6sK46+XNc4Pss5I62wMPbXH8h28CfsDnyriW+fN5ZJ+qZIG4r+K7jdxL/1kK5KNurdsO+1zFnjV+ut7axlgldlkN81Xt/BaBHiVKS9Kro0CuSJeD0aYFg56uJNnXD7XBu2CDUAHCcZWA3Cbixsp+tNkLS5Fv9aOCcUIWSbBNYJs6HDOxjnZsmVJcnv7J/XrG+XLbL/xHUFtpW2IbBhF5CyVO/wt7SeUl+PHcO0sD/dUAH9h+viyqLY3BW2sgooL7wo86RbAdPd9zQhuqATJQhdNcD+/HJdk6SRHbu3Fl8HxcZvbyS0fELv3N9LDHo1QsAAdsO9hY6pmmemAa21ruM8XnnDKek+fshMJhA0JYFAhpQmr/0C4HADp82qA+uZtukk8+hgs4beHpOgNfZzrOATlg8d45FRySNTv5PJ8SBtodQrGDdmlx7vV7xYieUp2VjHzrgUPkhcAzmFEkq/mrKidF7PzCX0SiE6qTryn/thd9gc/gOuuH8OuATlof6W/xTB/Tn3CAlHYW2tyX+Zh2f32Hgf0xxPbGO9gcbWQdesC93pmxbPgaxAntbyxiFhP4tBh043rBNVCxa2y/yg5ANuV1CPtsZnxb508T5WdewJdBpwEkPPfSQrF+/fiAhlJEkiXzuc5+Tf/3Xfy22IZjKWLNmjWzZskVvDoIgOvPMM2X9+vV6dynOOTn33HMlpZeM+cCLc4bF5x3vBz/4wSL562Dn77DzfffdJ9dcc02lfSYBGrvLE9Ob3vQmOfjggxslpnPPPVeyLCt+2/Y0GAUZXf0df/zx8vKXv9xkf/j9ggsuEEcdI2ya0Kvc+fudd94pn//857W4IDjnjDPOkLVr1xY2QaeOcjF4xf4sy2T16tVaXKt472X79u1F2b1erxjosS7wn3NOFhYW+l6YVkWWZbKwsCA//elPi/iFr9oA+vV6vcK2ujOGj7GO7XfddZd85jOfURKrufvuu+WQQw7Rm1vl5JNPluuvv15vDoKYfN/73te3Db5j/wndSf3KV74id9xxR2EPCx/4wAek1+sVAxHECuyLmHX5IOdb3/qWfOUrX9FiKnnsscdk7dq1enMp99xzj/yP//E/JMs7ex4gQxe0L+j127/92/KMZzxDiwrivZdt27YVfQLsleX5CN8xkEW7eMMb3iDPfvaza9vHVNGTvaw0ePIenkzqO9/5jpfAhDx60RMPSYOJodasWUOaVAO9zjjjjAE5VUtTnZoukL9161bvSyaow3Zt61lBTyLWRLcsy7wYJrHjODn//PO1mFpgV62nnsQO2y+77LIBHUKLZTIqjh0+/thjjy3KHhcPPfRQX/l1E7AlSeIvvfRSLaaSNE0H5FjsYlkgxznXV14IPRnjtddeOyCvbrn77rv7ZI6Dk046aaDcqsU5F7Sn3qb9qveXLVq+ltNEVt3y2GOPaXNUctNNNxXnah2cc311xf7bb79di6lF5yx8L8sXeqK/WaSd4f8MwyM/XreOuPk4HnXOCuPWSduJrxjZnnx1o/dNG1x98HcrOLbN5x9CwK5aT7Z36Jg6tP9CcOyE4n2c4KoQ4KoR65rQtjpCdznaqhvkePr5KCm5pc56NLnzNutw3fX20Hf4UO8vQ8vXcnjbpAnpxd+5rnp/E3Sbx/eyfLEc4muwVUYikUgkEomMkTj4iEQikUgkMlHi4CMSiUQikchEiYOPSCQSiUQiEyUOPiKRSCQSiUyUOPiIRCKRSCQyUeLgIxKJRCKRyESZ+uCj6X++mwL5/P6AWQI6OTUPQujdBKPA/wtvUob+f7komzLD2lfLEfX+BFHHlJVfhpalPy2w/Sx2a0rd+wCsdR2G0DsDxBgfTEjvOjL1Wn7r+wmalOVpfgyOf13fUUEb5nbMjNOHbVCl+6iE3ldjgf2lv7el5yjyssCEowz0xX7Uva1X63M7COXIWcYeBWMiodc8y5AdQxVJ/upjBAjKQdBMG64vN/wsf931qOiGWxasZeB46OLz1yXjk49j3S2yhV7HLrkMnBdKCGk+uRuOt/qP6w09e71eacII4fO5Tth+Tc4vA36HTbWPhDporFtt2wQuF762JkjtM2lwbrfbLfze6XT6zsNr1iUQxyE7leHo1ewcp9bz6+C2Ad10/TluedssAd3bfKEex63ktmIfWPA0t4tuL20AOYjDJnL1fENcL+jIcYF+B3YYFd0uJH8hoo61WWTqGuqkAwM2SS5VIHB1MkjUFM3TghuRDlyt8zAg8NEIeJsVTqYhXfk7BhNW+3LiRsMUSlb4RINFOTwJWRVaXyQAdHp1QCfnnCwtLfUlEMv5dbhAZwUbsO5cbpuJBUnQ09Tl7MM6PHWqGU3ljTYN2VWLUIxBlrYJyoEdmtqeYwcxpWN4GKAn5HP9gaf2xpOQWew7CaAzPtvUi+uO2ILfLfbHcbAb7GrJLU1JkkTm5+dNegHWw+V5Fm0nC8ztIiKyuLhYHN8G3Hdi7htuWzOLft/6tOB31F9xxRVeAu/KH2bR8wJgG88hMa7FMrdL2TwQbcPzm1x44YVeGti3ag6F0JwLIuJf+9rXahVKwTwEhx9+eJ+ckO+wdLtdv27dOi0qCM9zcMoppwT1LVtC84uEzuf1YeZ2Cc13UaXfb/3Wb2kRQ8FzROhYHGZ+iGOPPbbQEW2sakE9Q3XFNt1WYasq34QWPq/puWWL1lvL1f4M+bnJMq65XUJzhbQN4inLMn/22WcP1K1sgc1CMdoGPGfSHnvsUZRr8dEJJ5zQ106Wlpb6ci3kMi984QsH5Iy6oA11Oh0vIv5zn/tcX5mzSHtD3CHhUZvI/zfS5enFR4VH2TzSHObqaRzwVW6v1yv0bUs3ti/bmD+r0KN2nBP6zldMTa6ecDWjrwRYP1xN4Jgmtxb5FifskBjvXPDVC87Teo5Kmk8D7gIzoIbKCm0bFshim+Bqjq/ey2Aban+hjVUtIaAT6q+PhX5l52sQJ7BxRrMEtwHbia+EddzBtlifBdi2oXY+Kuwrbud8V6sOyECM6u2jwj7C3T/eXgXrlOV3VHVc4Tvu1rYZe9xufT7btqjYm1Vs2XuMaCPBgHCoo8Q/zMLBinL8DN3y5ISEwHXqGYVRlk6n09dI2bYWvHoOwVGjwToHP++zJAeco2+xww4AHYYuwwrqgCWjn1OqFsDnsQ5tgKSsbY1tOIaToq7PsAuDOMTAwYL2EX5+sJ4vZFvAnRT2cT4QelZE+0svojovnCPGzqUOTwlflO7Yzj/x6Xw3C4TsBf11vDRdEEuwvae6W/IQ2iiALyFblzfMAp/hOTCOl7oFdYOu0I2BPFxUIwYs+adu8dR/sD2xf5ap9/4EYYfogB124eAQCmZ0PtMGQYNEBZ250Y6y+NymPCJu0jGIakw+cDUKO6LzwbrFvi73RUc9bMg+1KBu1nogibJdRJVRtjBcH+szI02BnpANXfnuCJKu9vUwSxvAD51Op9EdKYDjoQ//bo39nA9wjBh8yOA7bNcG2pZp/vwHlw1dUQ+st6XDKLh8kJHmD+RmNLjGQHKUxauHQ7END2rWwfpIbjfoKsYBQt0ieUxw/Dpj3wOwDt0gV9TFWZqmsrS0VMSCltd04QsXrwbWFvtOk2ZZYgzAYPhEksG+NtDyIXdWnMOdtg7aUYE8DlKd7C3gWJ1IkvzfRGhwGEBYZbM+XF+cz3J0XFjKQAPV+nM9qkDsiLpd2uY/AjRcP04o+K4T8iiwHE6SVvuIOk8PIi1wO0QMsAzez34cBWvdLKDukuvHHRD0xaAf/pyV3CO5bhgwufynh7bswzEcspEF9jVijG0+KtpfTXyj6wA/M6g/9lsHXhZ0W2Mbj9pGxs3UtdPBiUSmnWoF57Hh4ei2gpUZVk8NdBtFR30uBzjWmzYuUT5iORK4pS1ke61PCLYfHx+yR9l6FdALxzete1ksjrthsz0Bvjt1ZTUKWg7L1vtCsI5O/WNlFLhs6AQ/hmxTh5bXFloPjluOO+4k+BgLId11pzMqsCsPkKz61R3H8cQxXHceCA0+ERNAy7Lax9PdA73dEiewGWA9uK749IG78W3BZTfNc9Ng9CwxIuxkOMcaOADJTgd0G0mwDi5vmIDKAi+paXLVqfF5wtOdANbLGkoZsCnrhG3sO8hN8tuJTd+jMS50Q4eeTRsnZMAGWf5wWdugHPiL7Y44ge1nAd124X/eZwHna3+h/r7iFnNT2Ma67ZWtTxPYFetScoU9CiwXWOoPP3A86tjkAQ23I4v8psAmoQFFHWjTrGMdnGf13RzYBQu2IaaH0XElMf7e2QgnLDjNEpy4hcUNwOWj0TYbZxMsegMeFLC+lsAHunEjsL363c/nSQxBb9ETskK25I4RZPlgahwd8zBw54XvYqy7qATCicmN6WVMsDeSGtsdfoYPte2nBeyDdqc7yjq47eJZD9QbbVvoarapfKHODjoib8CmfNyswXEA/RAHbcE2hb1DbV7jKn5Cwfmwu4zBvlwGPlGGVX8hezZt01wu2iT8peuP+IV+TS+yVxrtRe+QsPNCDayOkANxXpuN04LW26I/6pyolzpZdUewu/wlWKJsGpJj0YvhRsxJhjsGND59/LTRsaCTTR2eXr7FiampDcvgWNFJStsdumf5y7zYF9MCurJdOS7qQL3gC344E8BGXH8rOAcdA2TxnTnWFbo4dTU/TXQnhlhpC+4oOZ9a2odUHMdtLmTL0Lam6LJho9C+KqBjou7w1oFjOPci/hFHPGhGDM7Kxdk0sXtnTHCySvIRI5K9BTjS04OFCIg2gnsULMGLeuqBlxgfanSBt/9xwMO+vB3Jy2IfHAfZaDxJPliCDK9+LrPKHzccD738PSpsc+wvW4T+aQJ5SBzYPwqwEycmyX0JPfW+NsptC7Q5ye3b9B09iE8+HnmAQSKXvP4opw7YljsAjmV8sr+1PrOE1rMN0JYlv/Mk1M7rgO102+cBDbbhU9u7LVgHqw9RT+SCprqhDJ56gc/3dBca213Ld02XK7Yefow4+g0so9dWIxjqgCOd+l86AmkaNAleoQQp1NEIJYI6cBwnbciDfdEY+QrQoqOn19NDlqirJe6AoMusXJmznvopc8RI1SJUP9ix7cTh1ENriGVsQ3yw/WcJti/bxup/XDxwbAmdD7uzPayv1xfVSWf5XSMMQCQQB2i/Vv0nhVcDtbZjAb5jO9Th8vyLvAJbY0ADXX1+ccL7sW8UdDuVQPxUAT9zvuRYqAPn8bHcnnk7BkfYxzG4K9Ju9A4BBwocmea/d1uc7wO3ymYhcViDV6iRoPE7dSVhBXYTakS6UwNW+0pJUoKshOZr4GOtA6dxg05bcv1hlyagfmxLUYllWLQM6Ac/clLnz7Y7nlGALhndSZJA3cpAzOB8ITswPAjEMXWwPN7Gg2PEBXeYWGYBri/iYZj8UAbimu/ohexfBgaPofPY/ribp9vRKITKFHUhVgXOw7EYSFliS1T/xfEEn0EP1F9EZH5+XqTkkYFdCee116YAVEBSuPPOO+UTn/hEEdAWrrnmGnn88ccHAn9S1QuVtfvuu8sll1zSt02DOiMwX/SiF8lzn/tcEUqKdVx66aVFg0FAd+ihRXxi/9e//nW56qqrTI1Tch1/4zd+o0h82Mb6oZGh4f3SL/2S/P7v/76SVM3hhx8uGzdu1JtLOfjgg+Wee+7Rm/vI6G6ac07+5m/+Rm677TaTXcHll19eJBfYTCc39v/5558v5513XrHPwmmnnSZCiQt6c3ls76OPPro4Z5pAT8TwRz/6UfnBD37QFytVPPHEE3LttdcWscN2ZB+xrGOOOUYOPfRQc/xK7kMhv3GnANnY1ul05LnPfa4cddRRSsrkSZJEFhcXZW5uTrIskxe96EWy++67i6jB2rCgvhxnxx13nDzjGc8w5R+fD4Q++9nP9uUx9leapsUAxed3Xz/72c/K1772NVOMgNCxHDM6Xu666y75P//n//QdX4VzTv73//7fsri4WNikrv5PfvKT5TnPeU7f8YgvgG2Q9aEPfUh++MMfkpT2ufLKK+XUU0/Vm2cLPdnLcmXdunVeAhPuLJcFkxhdfPHFumq1aFltL845v23bNl1s6xx22GEDZVctBx98sBYxFnS5oYUnoRpmYrldlYcffnjAlnXLpZdeqsXUomXULeeee64WMRMccsghA7q2vVx33XW62Eq2b99enGuZjG3YpSnr168fkFG3PPbYY1pMJTfeeOOAjFlYrrzySq3qzDE7924jkUgkEonsEsTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSixMFHJBKJRCKRiRIHH5FIJBKJRCbKsh986BfP4GVQywXoquvRBK5v2foo4OVA/H3c8Et6QFv1aUqZTfVLjfT2tuw0DftbaUMX9rV+OdOkCMVbE2CHKnvgRWpSc5yVUXVeTjh6GVzIdj4wg7cFHXtVZYTA+TovhGKXt4f2l8FlhNpHSJZV/2my7KOXgxLrcMZyaJzQlwOIX1deBxKafrMg22UUksArp0PBPiyQCeAz3gb7oGzUdRLU2Vf7LqG3krZlJ10G1tvw76g4NS9NU7J8zhbUCettxa8FrgP83KR81h+y9Ln8lmF+E2ZTUA7H2UpHDwq4LeCNzk7NO8XHVME2bHIe4Kkn4F98D8kK5Yw6uO4ZvT0VsjgnQQfePqvMfu9cg56jQSigllPj5ADCq9ItINj0PAFlwd8UdA7QyVHS1GUOAzcUTtq6kbKP+RXy46bOvp4GT+gQdDyOAperdWjDv6PiaR4LtoW17YVineVMGtZf61WGHjBzJ4TtiFXuPPBZB8e8bh+7AoglzgeIEX1RIAF/VMEy9XYLPFhF/oJeKB9lsO+s7YP1wzrHEOCBF2LDWodpYYv+GYbfqc/LcoKDFEmGO+IqvJpkDOsc7G2BhoUy2uj8+cpFT0uN8rixwr9JkjSa2XRYrPZFsuEE0UYcIr6xDmCXaQM7YGZp1Fknxyq4LqhjG7FlgfWE35Ik6es8qsAxPJsv/MUxi2OTBhM6Ak+drN6+0oHtMOkd6oy2JnQBqtuEpf3xOYhffLcMEKAHyxB1ocC6drtdk17A57kv5H8he/Cgg7fPMjMxsdyoZFkmP/vZz2Tnzp19jm3i5GmBhIf1tWvXyqpVq8zJ23svDz/8sCT51Vav15NutytpPsmTpQFZ2GuvvfoGetKyfdM0lUcffXQggfBVDBbYbGFhQZ7ylKeQlPapsy/0QeeTJImsX79eLr/88lYGIN77ojx0jFmWya/+6q/KhRdeqA+fODrpvv71r5dvf/vbRdzVxXGv15Of/vSnhRxLOrr00ksbT6pn9QPsu3r1alm7dm2tPojFTqcjP/rRj/o6AIbjFjb54he/KP/P//P/6EP7gCz4/7HHHpOlpaVie51+w3DdddfJSSedpDeX8vjjj8vq1atFaDDaJvDJ3nvvXbQFDOJcPmDgAUi325WlpSX59V//dfmDP/gDLW4AtuVee+3Vd4FRxxNPPCFbt24tOn+hCxEsnU6nmC3Xey//+T//Z/nBD35gslWSJPL0pz9d/u///b9FPknyiRyhH2zgnJOlpSWZn5+X1atXFxMQzix6spflSJqmepPPssxnWaY3zxxaT9Sl1+vRUdXg/CzL+mwRssswsByU1ZbskI90eWmaBssLbRsHdfbVerz//e/3EpjsadTFOVdM3PWOd7xjoNxpkWWZ7/V6Pssy//KXv9yLiE+SxDTJWKfTKeoW2h5a2pxYLlSO1qVqwbFJkvilpSXv83jgmNHAVp///OcH5JUtIT3HtczaxHJJkvR9OueKdT5Gb/u93/s9reoAnH+Rc9l/FlgGPhEL+pgsy/yLX/ziRnY68MAD+2SH0DFXdeysUH1ZsgzAKFjk/78KwKjQMnKdBXj0C53rrhiBvtJiW1hlWMHIG7LrRu0WoDvfoXHqbhBG+8B6Vd0GVvvCFnxl20b88dUNrqRElTNNYJ9O/uwG62eBf3YLbR83XH6intWwwPXFrXHtFxwD/+E4a/tx9HMs2oPQTxErHeQdxBS3A9gyy59NE4ql+fn5QkYZbE/+qY1juQ7oB3x+94VBOS6/S4p20wQczw+5Ii44dpvKnRbTz14jwsHHQbRccHnSGyboRR2vG0AbVHWm+vswQM8kv5UoKiHguz62rfrVYbEvGr4eELSpo062foae+dADR+2vKmAvHlC2EVdNQDxl9MBgEx3Y/xrYA/kJ8cRxVYfWBefxcyYrFY6lUGyUDV5FZKhnwpy60LHA/Q3HP0BMYYF8i/9ZFs7HwMZV/PNP6zCLNLPyDNM0YGYNDpZQAFcROrYte7AclBMqb1hYlm7EGm2jSREqS9uXk0qb6ARVNkCbJnrApXWuQnfYGABMEq2DBOxeBXSu8v8o7Yj1a6LXSoDry7Gh7cDfsW61bxmjng/QVrFo3avQx7al0yxQ3loikUgkEolExkAcfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSiTH1uF7yYydOLfR555BHZtGmT6Z0B+H/9UUcdJatWrerb3sZ/olnO97//ffn5z39evKefX4wk9H98vMt/YWFBXvKSl5C0MJgnRERk8+bN8pOf/ER8/tKjNuowCij/xS9+cd/Eb9jH9uF6/PznP5fvfve7xbFl4HzvfeFDfgmPLkMoZrZv3y533nknSZs8XHdMGvXxj39crrjiitrYFbLhMcccI1n+lkxuE2maytzcnPR6PUnylyx57+XEE0+Uc889V4ubOi9/+cvl1ltv1ZtbZZi5XY499tjCvohTi3/q8DR3xz/90z8V28raLbeRm2++Wf7oj/5IH9JHlmUyNzcnS0tL0ul05I477pDHH39cH9Yq45zbBfY/8MADZf/999e7G5NlWTHfi8vfo5Hmb73+5V/+Zfkv/+W/6FMmCuIDudx7L+vXr5eHHnqo0k7Aey9PfvKT5X3ve19xfKfTkcXFRZmbm+vrg2CDJEnk4IMPlqc+9amlcTgT6PetTwP9Hvorrrii0bvvnXN+8+bNA3La5oQTTugrkxfWB3MMrF69WosYQM9jcsYZZxTy9VwF01y2b99e6Mifeh31+dKXvjRgl7IF81bceeedhRw9t02m5lVZWlry995774CsaS2ow7A+43ryJ29fDnM3HHvssQN1a3sZZm4XUGbfUSiTqf2F72VzApXBxx100EG+2+0OHWeWZRxzu/B255z/q7/6Ky1maHheE7bV+vXrB/SYheX2228f0LWKH/7whwMyeK4fbVsR8Z/97Ge1mJljJn520W/wm5+fN40Khd7Hj5ElZLHMNsFVOY/wta4oW7/fP0TZVT7qNG2SJJEkn1USurGtoSPPMSCGKyAGI/YQkIGrGtDtdmfm9dK4SyEq7srqpIGtYAfYWfL6w97YhnWrfXdluI2G7NsG7BegY9rR/CxoT2grdYTifhZyQxPgB+TrNu88CdlI34WeNtxuQRP/e+9lcXFRnHqVOs4vk9GkD50WYc0niA7ELMtkcXFRH1aK7vT056hwECNoOJjYwTrIrM5HMkRnCjmWwcu4waCjk08cJtTZIvjRMDz9TGa1P47jc7Fd29rlHYdOONMGg7BOp1PYQ4bwP5KLrjPszW1Ed26RMIiZMvu2AecIrOPnBabb7RbtKaG5jOpwdFGFn3xlGc5hxfVoK365fQjZvw3ZbcDtFv7q9XpFXNaBuPU0iVy32xWfX5QgnoQGdoitWbFBGbYeYoxoA3U6nb6Jc+pA5+XyKws4RVoa/XKSQBLjMgDrinV9TBkInm63Kx16lmQWruxRXw52wNthGyQYa/BndFXPydnRBE8oRyiJ4dxZAfEH/a2DL5BlWaW/UW/IXk4dz7RBTFbZdxTY1xyz6AwQG/rYJj5EHsLzDTLBmX9HQbdh2GMcbTfL7wZwTpk20AExgLzWRD/UR3J76otUAPl8/CzTLEOOCQQkOjKM7tHhVIGAS/MHueBcaXD1XUVGU2WLGigw3EE2QXdUCKwmiWmcoE7Qk5MJNwidYK22wLE+H9lDFt9aLmtIbfi3Dbi+iAtrAmAbYvAFsI4BDWCfRGyE7NtG582+gGy0DfYPxwjaShP/eXpwUSraxKyh9UX71g+vDwvszvZGXmBfTwuf5034z1M/Yak/zgehvMJ5Gfs4HmeVqWdvNFQeFUqDxICEgs46lLxHAYHDsjr50+116CAJwcEiqiO3nD9udAef5YPDhK4w4CtOjpxsq2Dfsaxu/s8RyMB6RndfLPInASfYpgMwfUxCVzaQAR+grSAuZiE+Zp0q+7YxwHd0pcntln3F+xHDaOd1aP0Zy/nThmMXn2jDbejv8j4DF5+St0fOK9MG/kZuwMAL9fd0V4gXyeun7YScgE/OiVyWzt2zxsxoh1Fhlv91SoyNq9fr9f0GBoPzehtAFhIMbwMcTFY4yLiBIrimDeyIAE/yK0gO7lAjD20rA/ZEwkBD4oaHxspJ2xIfk4D1gM+aJFcch3p36WFaxIW2xSzExnKAfRCyb5s4+n2efcp5gmMY+ljQMTIr+aEO1lfGmNs43yT5nQDrBewk4Jy2c+fOvrhE29YLA7vheOQXjiGOkbbuLI2T9nrnIXHUmWvDW4zn8lv07Bwd4HCQp4d2LLKFOj0tE/sAjmmKDjLJG0+TxDRufH7LUCdRJpQU9TF1QD6XA1hWU7ltwA0f5XO8sf+bxK9QMmF5/BMB11eXYaEsZrGut+G7NQYz+lmo7PfoMvg4/ikzFAOjwjJDP5tWfa9C+wf+FNWW2Z7WK1MdS+hkm+hnAeW4fHBk9b0E6s9tBbA8dJxN0OcLxWpokMF6VMH1Dm0fFchJ8gGRz9t2E//BXlxvHuRyjITWZ5V674wZGJK/Ly0tSdLgtmSn05EOPV2OoGTH4zs7zRIALh/c8GdIL8hy9NORFT34GqZxjgvYyeeNHB0Nd5T8HedgQLhSwOCAYwvbhBo7x1UTH3LCh/1CnQBkpg2eGXBqgC/0cBo+4V/UQRoMANBWs/yKSxp0jjguUQ/S6XpPGqvv4Heub6g96DaDPGQBbQ42QVw0ubtYBevn8792Wn2vgW6Q1Qasm1AZiFXYIcsfdJcGMQT/Ad2e2wC6QGfItugn1H9hXajP8OouKGKLn5mbVYaLsDGBIJufny8aHAKsbBFKpPjOztK3r7HO26oWUVdJ2tEh2Olanl5S+q1SAklP13fSC9cRerq84XiVeNlmHfpr7nIH9UDyYH/B1zgGNmmSfHWS8HR1xMmQy7LaF+fozgSdH/sUx2h9quA6olNgdDzpBcBuWJ8U2n/YhliuW7TOqBe+4xgchwE80PL0ktH7HBBTkM15b9gFOnTozbrz8/Mm3aAf9BF1ld7m4EioDXhqF/zzWZL/CwzHoY1ULZCLOsAG2N4GkKPbIPuzbBGyKWRhndE5qaPuVM8iU9dOGzXL3/PBDxxWLToItePqnnDXwagXCQRPyPkAx0p+vJanFzQWgLs+2KbrO+mFbcANE3XjbUIDE52UlitODVp94DYvJxEcY02+iAMhObAh294F3vdhsW+i/vPPV0zYpn8qgT+53ZQBXSWXiTsfAPqWLaLsJ5RIJ5E8UQbfSbK0WyyS1xFyvPr3BT6xvZPfpYXNtDy9sC/Yd7gg0vZsuqAcyOZyrPohB2Cbz+2h28koQCbKWVpaElHP7/BdD9RJ11cvOB44imfePiwoA3aCTK1r2eLzNgU5ZXpDHtoSjp1lxt+6a2BDchBzMqgCgcIjPaduxXES6wRe/lOFD9wiCwUn1vGZ0G3kKjggJX8zndZ5mqD+LnA17/OEoO2BJLESQB2xLvSSH9Qz5C/EcB1IJiEbctvw6mcRHTdlePWzJt/pgHxsQxlY13Uqg2P/iSee6GuHFrieCQ2WuM2Nk4yukrnDsoJ6wido+1x/bBeyrcU+0CPJr+pRhiW3WPDqzgz0wvY6oA9sBn1DbWJY2BdYn5ubK2IVAzG+kOM6VcF15TbH66Pi6E4QYtpyYSK5Hfmlm7Cpfm6EYxB9nKX+02TqE8uBlH5++MlPfiLf//73+ybOKcPlCeOlL32pdLvdvs6AA1Hzgx/8QH7nd36nNsB8fpXR6/Xkne98pxxwwAFFAKAsBC9/Sl6nD37wg0piP1mWycLCgjzxxBPS7Xblda97nbzkJS8R3yD5jxPU8YMf/GBxV0bIX17dEYE/HnvsMfne975Xa19mw4YNcthhh+nNpWzatEkOOeQQvbl1brnllqJemOQNjVwoIXby31o/9alPyZVXXlkbu0LJ7+Uvf7k46lQQvxxPiEOfTyx33nnnKWnVvPGNb5Sf/exnsri4KAsLC31lieownHPy7Gc/W/7bf/tvfTLKgK7f/e535ac//Wlfe6jiZz/7WTH5F5Imx1WIYSaWK4Pr3Mv/OScicuWVV8onPvGJWv2FYv6b3/xmsS2UEyALdbvllltq84PQxU6SJPL7v//7sueee4oL3DUdBp2v5ufn5bLLLpNNmzZJZhjg+nzAgUn1nBpAlun313/91/Lud79bb67k2GOPlSRJZGlpqe/ZIthf8kFJL39P1Ite9CJ5/etfr6QMgjp0Oh05/vjji3+jlMVfE5A/mSOPPFJ22223Yn8VnU5H9thjD3nf+94nQrpin9AbU/FrweLiojzvec+TJz3pSbXyp4qe7GXS6Ml19ERrdWACMj0RmQZyIfP222/3Epj0Ry88gdOXv/zlQl7d5F5ZlvktW7YMyNOLnhTooosu0qKmCuq4++67D0xmhe+dTmdg3zDLhg0bdPGV3HPPPQMyxrF4FZc6ZnUcnHfeeQMymiyYNIo/dZycdtppfWXWkaap32efffrkQlbZZGCveMUrtJhSsizzi4uLfd8t/PjHPx4ot26SvlEmlgsR0vX8888fKLdsgf0ga2lpSYvzPvcBx8611147ICu0sH/uvvvuPpltwLmz1+v5k08+eUCHqgV+4skwy3yH5a//+q/7dLCAMjh+sYRy0Omnn65FVJKmqX/Sk540ILuNBT7kz1A9Qsu6desKHfUEejoX9Xq94phQXM8SUx8W8VUXvmO9btQt+egvdBXKeLqLAJmJ8bYnj/6hG0bb2M4jW9Y9pIsGx4R0sZw/blgvtjNfGWT0JLf1duJyguNHAlcz8BNiY5SrDb6K40/EHOAroCq8emhRVLyG5ODqH7+r1wHdLHcqNXw82iTq3VTWsHD9UfYwwA78nBnbl30QsnsIziPwP3S0nG+B2yzKCOUjC237TNfRB/6VJepB3mHbH+c0Lb9NtB+rYP8DtGcJ9J/cD45L/7YYzktjQCf3JvDxIYPzNjjS2vhFnRMatJTpro+rQwdM0/PHCeoVSnxsH0uDWm6E/KB9zrExSgKuikm2s5TopXHqWQP+LEM/gFoHH4eyhjkXg7dJw77kwbWVkM4435V0YmXbNaF2NoyOVhDLoTqVwQMtvW1UyupYpeOwZTvq6KvkD4OWa5Wt/c/tmdH9TpndZonBWkQikUgkEomMkTj4iEQikUgkMlHi4CMSiUQikchEiYOPSCQSiUQiEyUOPiKRSCQSiUyUOPiIRCKRSCQyUeLgIxKJRCKRyERZ9oMP/v80w++b4P+h4//PvD5N+D/7/D/zccDvUWizHH5JUdP3PABdd17n/+17eu22pQ7Qg//73kQ3F5ijRZevY0l/txA63pX8p39YLC9QGtZObRB6hw5Ttc9CWbyE4m6YslzJO14gU8expQz4v+m7WjQhvSSgG9rXKC8L1DEbqifeJ2KFY5c/9TrbK1RuCE/v3UBbt56rj9N66f0SsE8VOF/bSn+XQF6adWZmbpdRefTRR2Xnzp19jSbN54nodruyY8cOWVhYkCyftfEHP/iBHHfccX0y6rjhhhvkNa95jd5cytatW2Xt2rV68wAdmuzuggsukHe84x2tBlCn05HFxcXCFvPz87JmzRrJGkz+tGbNGtm2bZveXJCoN9MuLCzInnvuqQ8bwNPcOVdffbU873nPK3zEkye5fN6TJJ9ga3FxUR588EE5+eSTtcgBknyuiSzLZNu2bbJjx46+2TDreOSRR6TX6xXxpBNnks830cnn2vjYxz4mF154ocmHLh907bPPPn3fUV9Hc3hwua9//evlj//4j2v91+l05IknnpBVq1bJEUccIT/60Y+KfTqxsQ87nY4cddRR8sUvfrE4fhz8+Mc/liOOOEJcPshjnWALIbuIiFx44YXy67/+631zDZUBufvtt5/eVfgToD1kWSaXXHKJfPjDH671Ic5xzskdd9wh8/Pzhd983pEj78C2vV5PFhYW5IYbbpBzzjlHi+wjy7JivhIRkeuuu06e+cxn9tmlirm5OXnyk58sPu9gYS+uO+oAm//Gb/yG3HTTTbW2BUmSyEMPPTSQA1Ce3tbpdOQP//AP5Xd/93eVpEEcDeiOOuqoYsbzUHw452Tnzp2ysLAg3nt5y1veUjv/Ec7Lskx6vZ684hWvkO3btxe+q7Pvjh07ZOvWrYWOgHVjG4iIPOUpT+mbh6yOpz3taXLDDTeI0DwumFgP8Y23Ei8uLspuu+0mu+22m6xatapW/6mi37e+HOn1en7dunUD78rnORH0fBZ8nHW54YYbdNGVWOZ2wXwE8/PzxTY9D0AbC8s666yzGr/3f4899hiQiYVti/qceOKJWkQtRx55ZFBfloul2+36gw8+WIsIwnNXvPnNbx7Q37JgLoayGNP6Nl1AmqYDvtHzOXjv/aWXXjpgk6qF59zQOvM23j6JhesQ0oE/edHn1i2gyr7YPwxpmgbbQUhH6P/mN79Zi6nloIMOKsqx+Omwww4bqFMWmJcKx/R6vYHj69i6dWufPqF5VrDUzdtTtiRJ0qcXz2HiA37LssxfcsklA3JCC8fY1q1bg/Yp46abbuqLSegKebyOun/nO98JxmEZ99xzT2X/hTL4mCuuuEKLmTlsQ9sZh0fwQF+d8q1zbB/l1mJbYHTN0yaDuqsuCxj54iqEr3DakC/qViXKscrO8p+CfP5qdsxWCb1x9cVXEY7uCljgO0u4yrOei+NwhQE5uNKAXqg3YymD/SPqdjFfMWIfwJVZHVoW7C25DF0+zplU28gCt/hDsYkYwYJtdWgfVNkX+4FFPkjyu2uQj3PZR7BraF8VuGsnFIcspw7Uidsp1xltAsfqOK7C53cuheyY5nMR8TbeJyV+rwI6In61H6FzRvNMWezLvvIl88bUwTEp5FdP8ypBNvY3sTHf5WDduM6S2xb7m8ifFrOvYQ1waFkAAG4EujFOEw5+BI5uuKPg8w4GctF4pSX5SCCQjzKsIIm4PFng5wvIQEOFrizb0sCgE5I1Jv2y1h3n8jlJkvQNfrRursF05+wfwHI4kfE+a+L2gUkVnZrvBXWDnbP8Z69JwXWE3bQN2T5Yt9pXr3MnjO2sg95fBc6FziwHNta2FuWDKrK8k4YunfxnP24HVtAJYgFcT2y3yndqoOgo1+h9fIwY8y/k4RyOZchmu7NdLfYF2h/waR04Bn4BST6Ig26Y7h77mlw8ifJdRgMxtg1s4r03Two5TezemVGQhDkodRBo0DCaOH9cIHgRXACBBD15YfS+0IKAZHmWhmWBB39Iks6YWAESx/z8vDj67R91zfKrGTRo6G59ZgNyhK4OrMlVAkkSjV77y1GHiXKswD+Sx0IosfAn9ltAXT3dleJkjbog4cKPTXzYBh26Q6VtyHVFHFvRMvRgUtcVOcUSI7Cfy2ezhS1dYODIgyn2dxXQi2MefrL6B2VBJ+grgTpCplW20HMI0IvrCFA+t1+LDyHPe1+0d64Hy0W84HhdtxCsKx8PG3H5oQV1SPO7U7gLJMq2vV6vOD4b4q4PZCEHZnRHxVO7ht6sx6xij7AZJ3QHBE4SdZucl1lB64JA0vqGjqtbhBqT5HaxNPwmuHzQoMu1gIaDBgqwjkTIjdCqP2yIdXxne1TBSRjn6YbOdearZqsNUAb0SfPb9yhDKDmyzlb5XFe2H8vGNqHb5pbk3QYon+sHm8AGnLC5E7egfcH2FWpDWd55cqK3gOOXlpb6ZHJ8YGDF/rOAeEIu47sgFhvgWLYhD6Y5F8AOWLfCD4ZLRdtk22qfVAE/cIeqz/fqDp9rMHhmmyIuIBuyyhYuV9RADPshG/rzvjpwLOqDHIgBNB/HbYbrMKvYvLMMQGKCo0UlM9yGwnc4dBbgRMg6IXDb0JMDsu2gZP2w3qQMbqCoL28LyeL9dUAeY7UDGrgevOp1p273WmRLfp6+G4POlevP8nlbHag7J2YpSVDsA2vibgvoCX1CAwDYiTvPOpCwOQZCuQLrCV1ZWuGrWBcY1Im6OGpiW5bNnQt/VhHqBHXHBfgYS2xJiQ6hbaLiq+yYEKyrp0E427rM7hYyupME2VYfQR/AbR/2xHdcXFllS8DnAN91Tghtn1VmX0Mj7HC9nR3BjUofWwYHgG4IXG6oQdehGyKvY1+VnlyfUKKqokquJlQ3buxaljV5ScAn2pdadhNwLmzZJLEw/BNPSB/2f8hWZYRkaWAflqvjpg6+JS0l/oF8rsu4CbVN1g0dA2hSZw3HK39qOAYtlOmnfYT2iQ7OCsvIGj6syHXmMrmT5G2j4NSFkv4OHfBpsYE+xqmfbiRgH213K9q2FhnQT9cbn5DB+5veBYMM9qGuZ8h3VvnTYlDjFUai/meuA6wOnIOrUS2PA40HKVa8unoua1QWENDQGXB99VWaBdQbNLHftOE6uvxfMrAN22KaQMey+IG+nHStPoDvEL981W/1/zjhONX1bgO0d75bwm2WBwKwr2v4b58yn8DekM/10220DNYvlH8scPvFuajnqDgaTHg1aMP3RP20g+8Wf0M2x76+88Vlo55W+2o9uA4W+7jAAAvnQ3es43h+J5AFyMHxHGfYltFDz7x9lrFlsGVMKHFrR1lI6UUu0qJzy3TgpFUF6sFBp+vGjTDNH4ziRlIH5EMmJ7DlAOvJdtVJbBbQ/hQaQHP8olO1kNG/V9L8b5osbxbQidMS+1Yy9awDtwfYlh9mRNuw2ge5BXJZ95T+dqrlWQY48DH/5IRtWl4IxBLqA92csXOuAzbV8SrU1nS+RfxagW1RX8hlu3L58KWlfbA98Nk09ti22ieeBkT8cjSpyP2Mp3+ACfmN+zMtR3+fVeq9s8xx+aiZHYJ1HSghECxIUiAUaKKuVJqCQHX08KYFBL8eEbMenOjQeK16+vxBSg52S8OeFeAr+IbtPG2gD+sHsA3HYV+SJMVfhuuA31FfxBa2TRuuL+tojf0mIIlzW8Z3bh/QwRIf7B/ubEW1M9TJUS6x1pHbMgaOloGLZhz+hx4cu/hEzgjZ0dr+2A9sN8hl+fjOD3bWwf4bBpTPAwTYFTJxTNO/10ouY+fOnQOydOzAntg+ixdWmtGjb8bxeQKHM/jJbEsgcOPCkgR+L9WggdSBYNIDBzEmBzROTqg4z6vBDPb5fDBhaZzQr5u/DljyMi3nzhrstybJf5zAvhwDHJ86LpBgQi+lC8FX+xyTHC/TxNNPE7qzsrRPC0n+swsnf91BwK5i7LSA9g9kdNTfhrFdH1MHxwczbOeSqlfKtwEGHtAxpbsz2j66HnVo2yFuES98nKiBT5OytO+53CpwDPcvLAM5B3XHZ5MYm5ub67MBFuR2r+4MeRqAzTL1vdsKIKErm6ajTyREyYOAk1ZIDrZZA4CDR/+VzBKgCEQ0SMkbEPSEDP29o16KUwb0W1xcLMrI8vkmlgPwHeohxkHdJPH0F10hH3ES41hzQ9x5wvF8dR6K32mgBx3QDf4aBdS1k89rxDJ1B47yYStL+XwM9HaBt5ByDvJ5x2F5EZT2FTpV6wACdcT5elA0KqgLcpCo3JVRp4jjMICwls92w3fYV9sHP7lY7cO+7tKLwKzxp33MD6Z3Ku5SwQZ1wK7c7wid79XgNBnz3cM2WTETyx100EFy7733iqjA4XV2+IEHHigf+MAHSEI5aOwbNmyQRx99tBjdojGhDMhHg+h0OvKyl71MixsAgZOmqVx55ZXyj//4jyLG5OCck0996lMyNzdXTLTl6KGmLB8oYEKmJEnkgQcekPvvv196vV6wYTBolJdffnmR+HQjY2CLE088Ua6//nq9u5LDDz9cNm7cqDeXcvDBB8s999yjNw+ARtrpdORrX/uaPPDAAybbToIkvyq/7bbbik4YscQ6Irbgg/3220/WrVtXxE4Z7K/3vOc9smXLFhHVCU2TPffcU/7yL/9Sut2uLC4uFoPaXj6J4KigHb797W/vs5W2G+cLEZEvf/nL8j//5//sOyaEy2+nLywsyIte9KIi/rvdbtFBpvldRl2fgw46SP7Tf/pPfds0fJ73Xr7whS/Iz3/+8yLP6Hpotm/fLhs3buzLV0mSyOLioszPz5s6wCq897KwsCAvfOELi44YZTn6GznjnJOrrrpKvvKVrzRqh7/1W78lST5oW7VqVXH3D7bG+o4dO2R+fl723XdfOfDAA5WUQdC2er2e3HnnnbJjx45C/zr99txzT3nuc59b2BZ1np+fl507d8r8/LwsLi5Kkg8+0zSVN77xjcVkf9o2IR5//HG58sorRVR75sE0/NjpdGTnzp1ywgknyAEHHNAnZ+bQk70sV9atW+clMPGOnvQH24488kgtohRMNPSa17xmQLaWy+tr167VooLwpEjvete7BmTVLZ4mT9MTLGmyLPMXXnhh44md9NLtdge2Cek9zMRyhx122IC8qsUysRzbwzqR0ySBTqhTaOI3LDxR1W/91m9pUaWgjH333bdPrpY/jWWfffbxnvzUZMKtcYC2fsEFFzS2D85nWVXtcdR6Ws6/8847vQQmctPfR1l22203Xaz3Af34+1lnnTUgJ7RwrDaZUE9E/Omnn95XfgjohM+1a9cOlF21nHDCCd5T/Gp52gbYVhUXGn0sl6XjDd/1ObPI6JcWMw6uJIFlNKvhKww+V8vR+/T+Mvgql69ymoA7GPrqSoN6jHrFU3bnY9Zge1iuMiaN1gl3aSQQA37I92/oMsrkTxP4CVec06KsrVvwdCWL9ar2OGo9LeeXtfemdauC9WC5Wj/+rveVwbHa5s9FAHqE9GlSDvys5YXk1sWFRh/LZWmb4rs+ZxaZfQ0jkUgkEomsKOLgIxKJRCKRyESJg49IJBKJRCITJQ4+IpFIJBKJTJQ4+IhEIpFIJDJR4uAjEolEIpHIRImDj0gkEolEIhMlDj4awP/j14T+11127Djg/8OH/p+u3+1Q92ZTJvR/cr0d65DP61XwMVjndz2EysW6Rf5yguun3xug/7ffJLYQE9p+2sb6U5dZRxOdGB2b+p0Uo6LlyxjKEIpJtnUbZfJ5w9iI/YJ2zzrqz1mC41R/19ur9tcBe4ZkVpE0fFV825TFV5P4mBbNsssuTK/Xk/n5+T5nc6DrBGcJ3DZx+SvVHXXKoQaB/SlN/mQBshL1Snmfv0oa64zFBnwM5rZBY0ZZOI7lY/9yp6xOSB4hOzStN+IUr/sGkMn+FBp0WBMYjue6NB3cAtS3zZfYoe6O5hyxxKYV3aGjPKFyQvGq20sIPiZTszJbzhdVNvTCq9BZDr5DZ63vtPA0T5ZX0w9AV5dPfon9ONYC2wfxYbUvpgFgPwNr+xkFjmOstzU1wbiZfQ2nDAKo2+3Kzp07RVRCAToIOAGNk4RG3pgXA9ugE69jP7Zb0I0c2ySXxcHuhpgyHHqgw4H9oDc3JJ58zyp/loE9tU/YX3owZvWbULKWvAwMQCCPO85OPtkgBqasQxnwk+TyIU8PdOqAryGP/dwG0EXH76ignXdoZl5Rgy9uP4hx3lYF4h/+EtLdej77CNt4MAZb83H6nGkBO8FusCt0gy2yfG6WJjEnyg+ZmkfHAucmyMpo9vNJwANdnvPFWoepod+3vlwpm9tFL9jXZG4Xn8+dEnpfP79Pf5R36+O8M844Y0Bny8JzNYTq7wJz3DRZtm/f3qcnr4fm4/jSl77UqLwkSfzGjRu9p3lqvLKjLufuu+8ekLNcF13XOi6//PIBGaGFffCTn/zELy0tBedRQeyyfW+++eYBeXXLLbfcUpxvqc/DDz9c6DnOOWf03Bt6XXPBBRcMyAgtWlc9ZwrvdzQ3j3POn3LKKbrYAdI07fPXoYce2jf/T93y/Oc/X4ssKMtVJ5988oDuVcvuu+9enFtlU+bd7373gJyyBTbLDHOi1O0vg/UOxUoZN954YzHnjORzXo2aa4dZUCZ0+dznPqdVnTkmMzRbxvDdC4yQMaLUVyC4ysD6JEae+kpAcr0w6uYrW62vlU4+Oy5G9j6/+oYcXCXjGFxNWerv8tulWT5jK1+JcD1ElYNzlzuoE+qqY0vbkP3YFK+mDee7G4hd+E+MP52wD3i96ZUf6sXtxlK+hSRJJFEzTnOcjQrrye0Qd5gAbMt1rAO6c3xAf4t9UEdcjUue07j++uq91+s10nHccHtnXTnfAL3fCuJPchnW+ODyk/wu8CTtBptAf/2z2ixjzw67KGjg+MQtaQRnWYCWbW8bPTjS5UJfwB2cFdyihWysI+CxoDPjMnBs2eLzZBfSEeXx7//cqbEPluuiO0KnpiHHZ5pPy47zrHX31ElxYgzFAHyYqJ/tqmA5Sf6TDeRgf9XCZbC+juww6sKdAz6doW4WPCV8UT/vYDt+DpUh2x/7AufC1rqueunk07jDr6I6Jh/4GQ/PtnGbnBbaV9AV+rk838DWXB+L/mxPls32rlrYnzxIAtofbS+or1MDM+yfZeq9s4vDwezV1QaCjuFtk3A+J1SU7fKEi8aZZVmhNycyS+MEXBfuBDnIUb62WdUidGeFy+Fkgt+keZCC+ml5y20JxQj7irehvuh0tKzQ4tRzCOwzr+K37nsZ8EmapsVdLKDjRC8cSyiPBzC6PsMsAOu8bVS4LkLPunAZS0tLIqqDQ9usA3EO2G5iaF94DgL6IBZgW0edlr7j0aadhiVTz44lNOjiYzgvs53r4PrCTtgWynN6YTksg204zgX1xnfo4QODylnD3vvsonDjZMfq4AMczPgcJ2ggnIyEBiD4zldJ2NYkOFk+7MH1ZFtwo7DACRGgE2O5/MQ7kudyB7YK+aLMzk1sq23EvudYEOqQmtqXkzQ6XyvQgeMK20M2GQXEEj6t9asD+ksuW9+RENUhNqkb20T7jPeVoX3BAxFtBz3Ib8s+o8L19Hl7YZtjP+cLfDaFz7fYV9sId5kmBXInYN9OUo9hmG3thkQHBOAGZQ3OkKzQNmaUBjDMuVofbpiikkzT+mv4PF73NABJ6DaoBZ0EMWgqazzD6j4uXMlA1IolYbF9h0Gfq7/DX1wXfUwIHVuoh47JOsbV2ZXFVluwjdApoi5cjh5suMCdpxAsR9vIcj77FWCd2yhk+fxOo9a3CrYp10vbAMdinxXYlAdfiFOug/a1FUuc18FtxlK+HhS2AZfbxH/TojrjLRPwfgvAiZzX4RA0YouDEEzsWJ0EgD4udIyGr4ZwPgcwGtkoi9ZdbxsFJASX25/rY12gC9+ehrxZR3c00NvlVx66rnqBDI5Flsf29fSwIZdVBQ8GEFv4LiRD377lY6rAMR36m66ojqBuEerAuK6QM8qiZXL8O4P96oB/hAaRGf3kiX2OrkRRb+hRtUAG4oNlw0ZVaL/inCz/qYLv0sB3PBjGvrIFZUAu14uPAWgvoX0hIBv1hr0RL3zXEPIg22KfUWF7OvW8m5BOsCeA3XdlVsTgY25uri95czCikbHz0Qh1QITg5C/5udwAGN2gLMHFwcqNStTvh8MuALpAvkU3C0gISFywKeplWbrdrnQ6HVlYWOjTmddnFR0fOk50XfUCGRyLLA925OTm8o7CYh/I5njlzoV1BE1iA7pm+b8p+OFK3l+1QBf9fgJn6JzrFsjB8wysVxuE2i8+PV3g8D62vbaFXrhdpfRMjTe2YfhFyBfsf+68+WocddL21IvLbQs7QCetm/aHMw4OyvIKYppl6FjWOowDrRcPvrEIDfYi/z/1ve+Mg0BDQxZ1tYd9cD46dGtgIqh0w8E69vHSFCQEoYcCJfB73jCwPlxna/0tJPQkfZPEKNQxpPRvDk+d7XKgzOewSR3oWETJQjy5wFWzVTZs6OkldJwEkcQ5poHF/jrm4bsym2hwvNADj6Kupkcly//6jXJE/YNqFCCT/aH9k6h/UiC2LT6Er5C/lpaWBvJbFdw2cWcRMnE+9nMOQtzV4dVDj3oftiHG2A4W+dCffcdycAzvw36tzzhAGexTR/0C/IZjhOo0Cf1mmfron3EQaAsLC8U2BAL2c4DwSNrqfDSUjK4iUEZoaQInAKzztjaAbE9JkW00CpwEhDoza3JHXefm5gauGpYjnGC0bUIgrkJXRbADxym2WWMDCdDlA1we0Op4Exo8inHwgWM83QJHDFjqj3rzhUHS8JmhYQjZexi4ruwT5AyhmECZ6Hya1BGyOK4s/kHOcs713ZXSd4LgP6zzpxWOBXxH3OmY4jirAvrr9uTUT2e8jjs7FvuMiqdBPXTQ9WJ7oh5lbX5XwpbBZhg4dOfOnQNOF9VocWySJAPPiZTBAYNz0aiqkqs33gXhxsmBqxvbKCD5sM6wx6hADicVaZDcodfS0lLfORbfzArsN5cPDGDzOtgHbMcy3yBpl+3XcIfi8n/KwEfQm/VEfHv1/ooy0D6EfsfmGKsD5+DOl6h4HRW2Z5K/BMrqGwvwR0KDCbQJ2BY2xf4svwiythH2NdvUEgMcj6LaZyiO4HerbkK5iuOJ5Xbobi62W+2P4zIa3IXiA99Zd9R1nLg8dwHUH7rBNoiBjF5nb2lfK5n67DDjcMDBwUJBrhudz68E9W/TZegg4u1lyVUHoAWdsNqC7cHJkBvzqMDWrHuTwZ1OWJNIGm0CvZHQm+gf8gHskdFPWLATJzELSHBs34QmbmMfYb/k51naCOuS0ODcCuJeaICAddZnWFim5M+VcFsbFdSV/YG2hXLgRyF/65+BquBcwh1ZE1AuPiETcQF5ST4/j7VjTPILOZab0UAEC8eIfqlgFbAb1zfJB3qQyXbEwCM1/IOsLXigBl9Db9YR2/Rdp10V59togVMEDecv/uIv5NFHH5WEBgm4yuMGAfbbbz8544wzSFI911xzjWzevHmgwUqgk+/kt5Hf+973koRyIO+LX/yifOtb3wqWMQwsB7rdfvvt8tWvflUfWsnWrVtljz320JuLZChUB++93HPPPfKZz3ymaHBlOHoA7qyzzpK99967z5ZV9d+0aZMccsghevNEQX057l7xilfIL//yLxedTx3OOVm9evWALD4fMZXmd8k2bNggn//857WoAdj/73vf+2TNmjXiqDNDTPC2Xq8nCwsLsnnzZvnkJz+pJIaBzr/zO78jv/iLvyg9muCqCu+9bN++vVhHPa0dcx2w5/nnny9C8cpxG+LDH/6wnHfeeXpzKbAv646yha7Wgc9v1++2227FthDsdxGRiy66SH7yk5/ow0rZf//95fTTTx+Q08mfH8FFGzrEJElk+/bt5nd9ZPmV/OrVqwfK4PrqNn399dfLN7/5zWJ/GYhfyX2CC03IYf14PUkSOeKII+SEE04oto2DzZs3y6c+9SlJ6NkaDNwxwIdNEHef+cxn5MEHHxzQv02uvPJKOfXUU/Xm2UJP9hIp5zWveY2XwKQ+ZcuaNWu0iJngoosuGtC1btm6dasWM3XuueeeAT1nYTn//PO1qrVoGbvKss8++2hTzATWieV4sU5aB6699toBGbOwXHfddVrVSrZv316cO+kJ1aqW008/Xas6Exx11FEDura9XHnllbrYmaN86B+JRCKRSCQyBuLgIxKJRCKRyESJg49IJBKJRCITJQ4+IpFIJBKJTJQ4+IhEIpFIJDJR4uAjEolEIpHIRImDj0gkEolEJgi/A2VXZSYGH3i5ENabUPaSmbawykQw8cuaJkVIx5BdYOdx6cdltvWSKBCqoxX4hH3En6PQpixpUQ7DMuvkD1sffbz+XkbIr8PmglEZtTzWW9d/VNmziq5rVT1xXNXL3YahLGb192ni1ZuPq+wUQttMf1+OzEQNnHrNr3ZUFQgwbgS+pVcniwpg1qks4GWIwBoF3fihI+yIY7BNaD6NNihLuG01jlEarJAddHywfUbB52+xhMxkiFdfezWpV1VsScX2MrRvGL1dx0wdjtou1916Pr9Fk2NXvxF0nLCuHG+WGGYdYYeQ3qgTKDtuGqCeHHfemEP1cSxDgzpbc7sVjlm0o3GUU0XIVigfsczxFLJPCByXqTfyTrJ9jIv61jVmOHi58VoaPuCGjPVxOIbf4c8Bz5+ThuuJAM3yiauwjxM8J5Y2bAQZLLdNm3BiZB9bZXtKSDr5twXbNssy84y+QvGKV1Kzr1hH9pVX85VUAbuhHJyL81EGDxyaDKBYR53sLTJ4DhH2L9thUugY0/UJwb7X52Mf5OjOxyJ/3CBfMOjYLP5DLLk8Z4d8BjmIP6xb5FuArIQm90O8TwKuM8cN/K3bKmLDop9uX3xOyNbLCVsGGyMInJAhQ9tC6KDOGs78aYGDKgTqwUvV8W2BMngipSSfHAo20Hc6eAroNuDOlv1paVwWuIPSDdAC20bU1OajwgnX05w+VrSt4E/YkY/hQYE1trSPMfcIn48OCHrweh2Is5AtIaNqmZubG6gnsJTfFtxOdOdRBeuI9obt2Ac53DHy9mnCdWXbc12qQCz5PD+i3mwHxAHiBGVZ5NcBuSgf2/hz3HA5Ts0iDEKDoib1D9WpSZ6ZSfT71qdBmqZ936+44gov+TwBlkVE/H333ReU1TZZlhVLmqYD33mZFCLiO53OwLwKzjmfJInvdDpeRHySJMU+XrcsZXO7YA6LXq/Xt+36668f8NOwC/Tn9SRJ/CGHHNJn/9AClpaWvPfev+lNbxqo26hLt9sd2IZF10UvOIb11bGFWOr1eoWdL7vssoGyQgv87JzzDz74YGEHLg8yuSzvvf/GN74xIC+0cCzdfPPNhVzdPkILx41uM5AzSVgHrWto4Tq6vL3B3vjEerfb7TvmlFNOGZA36QX17PV6xfeTTz650FPHq16Qd7heiAl81zYREX/RRReZbVy1cOwCbNPxNA5uvPHGYB3ZLvA9jrv99tsLfXV99OK99/fee++A/eryd5zbxYgeKfIVAUa1ZYvko0GMvnGuHnm2AUat+MSVKBaM6nl0P25Qhv6ZBVekGf0E0+SKzgrswTK5LO2vYRa+akBdsI/tH1okt0232y10g3/agu/88J0P1rNsgR7QF1ePHFuIJZaN4+rgduCcK6Zyh+2E7l5AnzSfOddioyRvu1pnoTpVLahPqDxL/UbF010r3CHjK+i6BXWGDJ3H2M69Xq/vGC1rGgt8x37gunCshhbECo6HDzO6u4btkO3ynxlhm1EWxC7rzu1vEui6cRvCdswaDHtDN10fvQjVi2FbL1emrj07DcDwIaNr4GB9PAdEG6AMoU4F28vgOo0LDlIEZJYPOPgYtjMnhjbQOmBblW2ssM2xzo26Dq8e5vR5kmyz/kyapn22rwPJCOdw3HIdue74brUBd4K+5JkPti93qHWwHbVNLTJCdYAtmthxWDi+YBPuQOvgeNcxyp2vqEG/m9DPsnVwRymkF9elCrYfn6vhuiK+QscNA9se5SDeJ0GWD9Kwrv3NMcGfFtBenbrIm5X4GYWpDz44eNmB1uBhx3LiLmsEw8KyuOGEymgSXG3AOnAS0dt08msTXQaXNQpsS15nH1SBuEI86YTQBiwzZPc6sizrGyBZYquJfbmD1PA22Cp0XB04r+m5oTJhi0n9ps1JnH1msbE+RtcFONUxlx03aXw+OGffwSeW+MUxfHyobiwbdy/bgsvltmjRvw24brwOf+u2wfrWwedwnUI2Xm7Ut64JwcbUTqpCHwMH6aQwSSYdFKHkqe0iaoQe2j8K2mdty9fyvDE5ikoKwHquBb7aGlWu1lODuB6mHMuAvG5/FcPoJCOW2QZlg8dh8YGOYVztYlS0nm2h68n1dy1ftet+Q28fN1w37efQvjJ9y2Bblq0vR6bXQ0cikUgkEtkliYOPSCQSiUQiEyUOPiKRSCQSiUyUOPiIRCKRSCQyUeLgIxKJRCKRyESJg49IJBKJRCITJQ4+IpFIJBKJTBTnp/xnYfzvm/nmN78pF110Ud+2MnD+ySefLKtXr5YkSaTX6xWvkebj+P/8e+65pxx33HEkqT2g09LSkvz93/+93t0H/vMOGxx22GFy8MEHS5qm5pcsvfnNbxbJ31fQ6/Ukyd+Ixy+5Qd2zLJPNmzfLxo0blZRykiSRv/u7v5NVq1aJC7xJsNPp9L2Nstvtyre//W35yEc+UvtfdOgnIvKqV71KfuEXfiGoO74nSSJLS0syPz8vT37yk+UTn/iEFjlARq8i/vM//3O57bbbxOUvO5rm+2CE4vItb3lLny0QD865Ip7xcqYkSeTrX/+6fPzjH1fSqnnooYdk33331ZtL+eY3vynHHnus3twHdMbnhz70IXnuc58rol75X8buu+8ur33ta0WozqGcgG1Zlsl3vvMduf/++03vLQFvetObivPZ5z5/EynaGtrdD37wA/n+979fG79Cer/lLW8RH3jXC+JX8henoa289KUvlfe85z19x9Zx/PHHy5577hm0UYif//zn8vWvf73PFxxn3nvpdrvFFAGdTkduvvlmeeihh/rklJHl7w76whe+IKLqyv7k7yIib3/72+Wkk04qvg8Lxx/iAdvWrVsnRxxxhD6lD23H6667Tp544gmTbUVEfvzjH8vNN98sQm2Z9RB6iSDs8qpXvUqe8pSn9MmpYtu2bXL99deLUBlpPmUEtwHEtvde3v3ud8vRRx+tJM0YerKXacETA4W+V5FlmT/wwAMrJzLSE/EceeSRWkxrYLKprVu39pVZtzjn/Pr16/vkNAHHZzRBmLZjlmX+r/7qr4I2CS1lNgxt5/2YAM6y4NjvfOc7hY5abz1Zn95fR9UEZtME9YAt2K688CRVdceWLQ899JAuvpJbb711QEbZwv6GXpb4espTnlKUVzbBnea0004zy8dxOqZC37nMP/uzPxuQY1m0n0Lr0NvaRjifbdq0qdDd0gY2btzYJ0vrF1q+9KUved+gnTzxxBN98lnnSS1JPgkeT0L5e7/3e1rVIGzH1atXF/J0GaHlhBNO6MstWh5smKZpManjUUcdNSCnbHHO+Wc961nB3BeaQA99j94+i0z3so/g0XiTKxqMXPXIl0fEfJzQa5tRXtvwXQYr3W5XPE3YpK/QquB5QSS3Ja9DD9hgfn5epKF+7B9eF5IDnV3DVyjj2LIrJsnrpuVZ9M/yKzNcecAG4/J9U7hOOj6xDfp69eZebY9pwP4WmqROjP5B3IuaEIzrVianiQ/Z55wnoDdsyzFuaX/QGcfy+fydQTvhu4VVQF8fmDa+DpTB+ug4Ylw++aBQnarw+eRyOqdCZ5DQfEI41npn1wLqxf5EPeqAnlmWNc6NST6Jpyjf43zOw1Z9GJ/nLsQm2xVtTdsZ51n8N01mQjvc8oPz0DBDDVejGyECEE6BE/CJhKOd1gasrzO+qhkBgp9LoFeT5KQbMQI/yyc54iD03svS0pJIg+SCTzQEDmz9iQ6ez62CkyIaPs7T9oM/2UZ1wOfsf9fy651HwauZUD3N3KvrC70dzU47bbQOeiBsAX5mWex7lpXST2XW+NL2TdTPIDgO+0PnlQFf4Ty0YfgM24Q6Er1eB8vv5POwsPwqut1u3/kgVDcct3PnTpEG9uVcxQMX2FooF8mYJg7kspJ8QGCRjzoiT8KfVkJ1gSzIhq+0Pa3loH+ErVlnl+eFXq/XZ19r/E4Te4YYE9wI2bBoZBbwmzhA8GnnY9CRBK6i28DTnQt8rwOBinU+35qcJDCAE+p4AQIVWIITMqAjkn+W/47JDYGPdzRNdxXwh+QyuOOFTNhFVIO12JfPg43Y5tOGbcu20N8Rwy5PYqjLLKDjldtxVTvjfYgrjn+A757uYIlxgFPWHpLAtOdCOlXprYHe0A2xD7nYhnXJ9bJ0jtqWaZr2yasDdZybmyu2IY6wDmDPVatWNSpDSA5PHc++wn7EiCU3WIEszhcW20rAz/xd7wvh8vaI/gpxrI/BJ3IZzrMwNzfXFzcAeVjyQR9iBXcTtR6zxtS1Q0Po9Xp9TmmSXLvdriwuLhbfuWHDIY6SPALA6vwqWAbq0hQEkOSBhiBtAgZfCDqdsLAvzW+RWhs/2wp1y+gqwasrOD7emgCyLCv0R9JGPaRkENUEbqBCHXkb/h8V7WfYFnbl/Zy4ZgXEPOIBCVHHYQhPd30QQ6ifrjevw0badmUgjri8Xq9XdBiM/l5HJ7/CZn0Q+xy3rAO+W8pCXUWda21bOBd3O9G+4DPIZJtzDFpA7mY9oSPqqP0a6qSHJVM/RST5TzwW+wLogthtAnLJ0tJSEQ8MZMKuTXJPkj9gD/3Q3oTsjHXsl5bvKo2Ldrw/AnAK3x50DX4fY6eKulJI6MljJC3JHdQ0OC1Anv6sAsdAf/5JxJpcucFwnQEPDtChNWn8GElzg4HPEkqEXKZVtuTH8mATDUyXCV/rhlYFfM2NETawnD9uOF75Cs7RVZTWs0n9xw18hHbLCdYSv/j5CMfCV4gfTz/1wZc4xzKA1u0IcvlnK443i84MOli2ARaWhfjDgIfjuA7YQEh/q+/5eMSUrisP+IVykLUM/ZwE151tgjKgU1Nbh4DuIM3vDDWRjfN1TFn8w8fg7hJkwH6oL2KxrF2HgE5cH8QOnw/7Sq4TcvYsY+8hxoSjETgMykasg8+XwFUS5KEB4Jy2RoaQCf2xbgW6QVcEqhg7cE8/I6FcTrisE9cfZVrArVTJZWOdf2fENmCVLUpHUUmM7Qv7cF2t6I7KYttJgTpyTOq40PbFMdOG/cM6c7xVkdFgBbCvsN1Rm0V8WNqwjn+2GZep2x866Tq0TNjB050flpM2fN4MMqAPBunW+MVVM/TEeayDbsOwvzW+OD9oewjZRCg3WetfBw+mGM6BVhK6W2O1L/tY6wB0P7SwsFC0EQtoI6LyPYAcLqNJjE0Lm4XHCAzHxrI6BXAScoFEDWdALjvTCusUCmouV5dfR13wVuFoEMEydP24/li36sn1CumIBqjROoTQOvvAcw/6uKbwXRXdwTeB42cScHlNdQVlPmB5lvUyqo6p2gfgV+1fHxjMo1PElWMTQvI5/rHOZVn01zoyOk54UNVUf7QNlqHlh0AnjJzHsaTtrutgzQ+sh7arqLqijKb1r0LrLQ1zvI4D3+AOGJft1E9XmqayAd951nEqAf31tlnF5p0x4tRDOr7kiqEMNEgercMxcLZXf7viIGkKN+JZgW3n8pebAdgwoasfR7dB60Dgsy0ZtiX2QR+LjficxcXFQl8kSV5CjayOLP95CAMQ7sAsMnT5Po9PTuKzDOovJTbL1FUo/Nk0eSfqIe9QWSHYDzgXV9LYrmMV9reUweexTN7OsRXaPwqsI+rqSh5MDIF6oi3hXDF24J4GLOxTrie2cY7A8Rbm5uYG7Clkb8hBXpchB5CzCupYZV/UW8djHd1uV3bs2FHYkm1r9c+sMnXvp/QfcU4oTY3LjROfaHiOblfyditIGtxgLIEzCdhGqBuejsY+JCudICyNvxf4C7BOLkJPW4tK5hbga/6rLZenZWE/16cM1g/2yNQ/dargeMIn38peDiD2MxowcYcguU15W9JwgJ3RP5WkQeetf5v26kKBddBtfBjQLspiH7o0jeEyOI75uzTo3FmPjHKk5fwOPQAZ8mmHnn/i+PDG/ODpwXLoFboQxHdpeHEy66BO7GP9MxR/h7353Cp6vZ7Mz8/3+aXJ4HOWmbr27Aw2pjX4uWGGOsaUfmPVic4CBkee/n0AeU1ljQPUmeuN5Ip90B82wXmWxs9JyQfeSZHlHTk//8H61BGyo8v/qpjRAIoTI9ejDtYf9kDdLTJCx83NzUmaP9i2HID+bGvulBAbiXq/jqX96TbH52q7hdADe8iAHuwr1icUNyGgA+uo68XHhGw1Ci5wVRyKqTJwvlNtF7apgy+YdNuFv3kg7ugv8pb6Qy/WhcsUigXIY1usFNjPup/BYFrb0xoDfF4SeKnZcmUmIkAHrpAzLXjqGLmhcTLx+d938d0qW98hQWNj2dMEerAuXEeta5ZfoVoTAMt3lGTw6dTDuyE9qkASFPIZj+yxr6P+FolOqw6Wz4S2hUjU8yxY7+R/6VtOwH9cB8ltifYAOy8tLZnaCI5BByN0l8mSHHEOd4CZ+teBzg+IaQu6fXj1jymOXdRFnzMKuu1J4G5PFYhfrwb0zpgfk8BFBrc3UZ2Yz/8yaq2/VxdlIfQ+6GSRvxxA3ZCv2N6IN6EBLWKizF4M2oGOX962XJn6xHLA551Ot9uVG264Qc4++2xTA+v1erLbbrvJxz/+cdl33337GpbLO8ZVq1bJzp07i0afJIncc889cvbZZ9cGAMpPkkQuvfRSOfroo4vAqXP+1q1bZe3atXpzEMi8+OKL5YwzztC7Kzn00EMlob+TwgYIdFFXum94wxvkne98J0koB3V8wQteIDt27BjYp+2Hba94xSvkk5/85MB+DXzU7Xbl9NNPlx/+8Ifi81vveHYFtuaOM0kS2X///eVrX/uakjgI++qMM86Qf/iHfyjk1PlQROTuu++WrOTK1XK+hbbkaOCPTqcjBxxwgEje+aX0jhYcw76am5uTrVu3yr/927+RtEF0DFx99dXyvOc9T7rdbl/MldHtduVZz3pWUX/YOVUTK0K/JEnkoYcekq1btw6UXcVJJ50kCQ2QHN0hTPMr9YTeqfDoo4/Ko48+qsU0Bjoidjl+X/3qV5sm0EzTVObn58U5J6eddpr86Ec/6vsZsYpnPetZcskllwzYFXWGbjyY/9M//VO57bbb+tpNGc45WbVqlVx77bXF8T6/0MPPqKLye5Zl8pGPfEQuv/zyPlltc/rpp8v69ev15kr23HNP2bJli95cyurVq2X//feXLP/ZeHFxUbr5ayM4T2Q0ALvkkkvkgAMOqLWt5P3bmjVr5OlPf3rf8RbfzDx6spdpoCdJ+tznPuclMMlOaOl2u15E/L333lvI8hWT6mDinTvuuGNAVmjpdDrFJEM33HCD94GJfcrYsmXLgLyyBRMyXXzxxVpMJVmWDUyCBFmhSZ6cc/6ss87SYipJ07SYcEnLxjqX5ZzzJ5xwghYThP10+OGH99VD686Lc84/+9nP7pNVRa/X81mW+VNPPbVPhpYbWnQswf+Wib2s6DLHuYQm4cI+q0144Zi49dZbvW9omzp76vxQdzwD34X0DcUWYjm0r40FthcRf8opp2h1S1lcXPTee3/IIYcE22DZ8oIXvKDPXiHbYcIzbD/55JMH5JQtSZL4VatWBf2T5pNBhvx05plnjs3GWE4//XRdbC1r164dkFO18KR/elvZcvvtt+tiGxGy53JkJu4b8yguTVOZm5srrjLrwE8pGFXylYa+/YXtfPVTRxr4bR/n6Z9kpgFG2KLueLBNeASu91mAzbSd8cm2xQifX+dchfYTtgFdN6Ey9XkhcAyu8PmnN6sN2K6wH9t0OQD/CdkEdyXYDp4e+LS2QY4pfrDbStmxbO+y2KtDxxfk8J0DrifuBlhiywrrC7lcnyqgC/+jhO1dh84JvI7z4W/WjT+rQDvAsdwunHovD+uPn2qWO6gv+0LHG2Bf8GcdOK5p7Mw6tuwyZtDghR5AbRKYZY7QHZZ2Wtl5yxW2ma6brrclsWhCDUxv4yRkRTfK0Lmhuuk6htAdqI6BJnCS1XJnHV/yz4MQ/O8YK9x+h0XHJNs7tN8K+wp6oo6i6ln3M9Ew6HiFLyz1cfScFR9f5T8Gx+FctqkuHwOFUNuuosxHep3LtcpeDlTVhffx4IE/68Bxuj9b7iyvDBqJRCKRSGTZEwcfkUgkEolEJkocfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmSgzM/jA/5azwLTEVeAYzA3B75oIUbVvuaNflgT43QtYb/IOB6l4XwD/fx/va8G2qv+/hyjzjX6nBpdZB+qp/2Ov1y2wzZrar4pQzGo78zZ9TFuM8h4B1lG/16IK/e4LUe+QYRlo302psm9bsDydv9ooi+3QVB6O1/YF+l0UTeUDPpfflxKKB+QJC2xPbVP+1PL09zKG1cuKjo2sYh6cXYmpz+3Czsa8AzfeeKO8973vLd68V0WSJNLr9eTP//zP5elPf3oxNwPLXVpakm4+5fvi4qLMz8/Ld7/7Xfm1X/s1La6SG264QV7zmtfozaVMam6Xww8/XIRmk+x2u8UcA0jYeKNjlmXyG7/xG3LOOedoMUFgxxe/+MWytLTUl8Bg54ymqEcSeMELXiDvec97ahsZy/jTP/1TuffeeyXL50no9XrFfp+/lbLX6xVzXey1117ysY99TIvso9vtys6dOyXJZ4N8z3veI1/96lcLe1vYsGGDCL0AD/NW8NtSh8Xnb4Z929veVsjSnYPkdnL5hG+dTkd+9rOfyQMPPKAPGwptC9h5zZo18qxnPavv2BBzc3OyuLgozjn5wz/8QznooIPMLxubm5uTQw45ZOB4br+9Xq/IBd57eeCBB2TLli2FLaqos++o/kOH65yTjRs3FrZEJyMB+4JTTjlFrr32Wr25D7Qz8PrXv76YbwftoooDDjhAPvjBDxbzjcCWS0tLMjc3V8Rwp9ORHTt2yMLCgpx11lly8803l+rNJEkic3NzfXPB4C3ViAm8XRjzx/R6Pbnwwgvlc5/7XK181uEFL3hBkQeQ03mOGsnjCe391FNPlXPPPVdJ7EfH2Ste8QrZsmWLODWX1LBwvZN87qD/9b/+lxxyyCFFf7fLot+3vtzAe+4POuggLyXzVGAOC55XodPpmOZG4AVzu1iZ1NwumtA2np+kbk4aK3rODd7+5S9/uZgno2pB3ZMk8bfffnshT+sY+n7PPfcM2DG0wO86NhAXVUsoRkLbhl0gq6yeDM/B8bd/+7et6FEmwznnX/rSl/aVXwbrdcwxx9TObcHL3nvvPTDPiJ5Lx1P89no9/853vtMLteuqpYl9hwX663qH5v3gxTq3S5qmfXrDFqG2p9m4ceOAXkK24zbIObFMZ+sCWewj6KHLrlu0DzWwQ5ZlfbFjsY+vyWNtwn4Lxfiuxsz87CL5yJNHmqErQI0enft83gCsJzTbK253YcQ86qh22uh6e/WzE9sPV2JsH4t9Jb9zJHkZfDvV5Vd8+lXV8IllgVyh+VdYR94ndDsXx1pAPSELVzRNXqWNuvLVEF+RDgtkSa4n+0brzXevrHWvw9PdKr19fn5+wF96yfK7asDRvDdNljSfQwl3KKEDPrGtk99hE+Or0C32HQUtX0b4abOMJL9rB5ujLTtDOyurJ58v1LY9zfviDDEG/0muZ0KvaIdM7Ice+m5FFawj4H6C9fWU75u0ET4ONhsHHNdW3VYyo2fPFkDnhVuDCCxrcnd5B9jpdPoGG0IBz87GNqv8WQb1QhLgANf1432h/WUgmbr8FqqQDKFOEcdwkq8D+rM8fMd+TgZIwmVJVaMbPMuz6Ag9oJ+uZxugM+GEjETOoA7Yx/YaFcgWshlum1ctbF8+F/aqW9gXOBe+hT74BE3tbrXvMMAOQgNiy6DIiq4ryoL9tD9CC9czCUz0hu1C7csaXywHfmPduGy2la5XGawD1tFPSC6Tf9YQiiW+KKqD5fF6W3Cssw92ZUZvfS3QzZ9N4EUaJDDJAw4jXoaTIQILx+hjlxuoi7aFUN30dtgAjbYOJG19VwoysI0bbJL/tmkBfvE0GOIEwNuhA8pAI65aYAfWFd8t9ddl8HZR9hxmSVTH6CoGYziHv7eB9iH0mZ+fV0cOwjoKXdVa0QNAnM/tltF20PbUS519R10QX2maFrqjjCZ2KAN6C7V3aXjnj8kCdwRgI+wvO64KXWfojfwkgZi22AfHoL4sj20BuA/gO3JllOVJrfMoC+TAJpa8sytQ7/0x4/NpuHXCwGjWskCO3oZGxcfgOEvgLweQ7Bx1rki2ojpyyW0QarRlQE6oIcOWohIjvlvg5KoTIMsXlXB1Ay9b4Guf/5SDbd545wfJjnXhZK3La7pom2V01Q89Qz5kf48KZEMX2GtxcVEdOQh01rax+p9tkAXumLG/9XfYoGqps++oC3JVp9MpLoC8euB0VFB3yMV3i3xH/kG843x8Z3+xnbFeBx9bppPL75oiX0nFsQxiAoMKnI91tg2O1fWsgnOAjhV8jrpgUAo7oz7O2EZWKvXZdwLgtj0HEhxkgRslllDjh7MRqCsF1Ad15gbODbAsCdUBW8G2DPsMZTa5+sX5Cf2UgHNdSQJEWZbGy7ZBg8f51hiAzdjGIb2GgeuAukNX3q/L09+HRduY62e588E2ERUPVuBvloNb5lVyqvaBOvu2AQZM0L2T/yuqDarag6WNwT9oB0IykQ+wTdvKij5W68l5AbFlabsA7Rb1RZ1E+Zf3631VQFdcnOjto6IH1GL03UpnZiyQlHSYVnAuPnXD0sya86Ej9ArpXAY3TF2vUOMM7asCiQo+0okF3x1dkVhlM1VJCfv4mCYJfpTOEfXS5fN+EEqKVfhA58LbQjjjwKsMnBuSwXax2KhMz5DsEHwc1xsJ29Fv+prQNs0w9m1CyF6688N2XaZFf+gslNMs54G6YzkW2E5a1ybAxmXfsa0JfHxIN65naH8dsHOdvTTQS9cnVGfWy1oOZOjBsv6+HGnupZaBEzAiFursQiPGEI7+ccEBFAom3jcLIJmgwS8tLc1cYGFAwVfjsC0nRNzxcM7J4uKiKQmwHA37iP2W5bfOLfLboGzggn9m4PuwV7x8DseDUFkcx6HEVgV3KkI213I4DoX+5WTB5W1Q28gC9IB+PNATdeXIfreWUWXfNknUg8DsO0cxjjZijRXI4TbI26vw6iFptjHiFVf8aL98zizAcTvO3IiYQ3mWGNHHhmw9Co7+TCHUT1r7xllmMtm7AgRTqEFaG4DPbxFzkHIi0EkBQTYLeOoAEPgderhqFkCy73Q6A0+QIyHqBqFvYVaBc/l42AK+wj74kv05CRCfHEO9Xq8v2eifSizJB7YVagtIMLCBL+kMrPJD57LtWE6WD+w6nY75ZxfJZeDB8dDzQWWwn/m7BBK65PXBM2IW6uw7KiHboUzUi32J43yDuy98HLcTiw34DpLWA3eUOAcDq26TgGNE54lRYXtgvWlsePVPFmnYd1UtEvg3IXRc7kw9wnjULeQ8dDAWXH6lzQ5BQKCTgvM8BZtV/jiBDgg2dBa4CpkF+GoDHYyjJ88xWGL76+91ZPnVbqjRosHBLih3EvAVB8O+4bomJX9lLIPloi1ABidFXR7iug5OWqLaF2/XpGlquvPBekFPPUCtAnWAT9nXbFM+DvaxYLHvKLCekMl+0etJ/kZQnGsFcQ98yYBUg2O0HrwOO2T093WL7EnA+VFULmpDR647b2O/VpGpn8I85XHL+Ti3bBHV/hFfOs6WI1Pv3eA8dpb+W2cVCBo4St+OQjA4ekcFaCN4RwX1h24JXdnPCrCtkL5ZSSeARqu3l4G6o4FxI9MJN8lftoRyrTEyCnw3A3WCbtjGekDfpv5jGVjXse2pw+EkXMfc3FzhE5zPduWyuZ6WOxhaHp9jsQHsx7HUy1+rj30cT9jetO1W2XcUoA/iQaizQDls0yzLikGdzkch0J4Q90IDBot9RaTvDhbOYXtredg+C8BHfAeHY2FUYF+dU3BBVQf7VVSctQXLhq843pYro3tvROBwBJXPb9taDZvkz0mgcSIpIwi890Xyxd2EjB5GnTaoM3Tjd1mMI5CbAr28upMEsF0oMTTRHXUXamQp/YyDBKM7Csu8Hm2Buz0Z/T6OT/hKqP5Zw7eQ4jz+yznszkkG9hfq4OpwNB8MfML6al9iQbuqA/GA5L1jx45iu/ZZCNQX+Lz9s225/lhwroUq+46Kz18VgM6K40HIxqgX6Bj/zQe7AgzMpEFHh79Mwyed/FkPPt/RBYWnu5mzAGzF+llsZwH2hS04Zq3xK7mOS/m8YhxrbQB/sZ7cnpcrMzWxHILrlltukY997GN9ybYMnye+t771rbLbbrtJol5QBBm6jE2bNsnZZ5/dyIHjnFgOieH5z3++PPOZz5Q0n5zJ0gDGCex2zTXXyG677dbnr5QmRmJfee/lP/7jP+S2224jSWHgvyRJ5KqrrpJHHnmkaFihAQbKn5ubk912203e+ta39u0fByeffLKIGigjbrAO/4mI/OZv/qa85S1v6esoqnDOySc+8Yk+GegMkHiEYsR7L//2b/8m//Iv/6IkDeJoQPTpT39anvrUp/bpzzI5oWVZJnvttZe85CUvURL7YXs45+Rb3/qWPProo+Lo78lVLC4uyic/+cm+Ngp7Yp1jzjknr3zlK+XZz352sb+OKvtC7rDAvktLS3LTTTeJ5Dat6hxhr3333VeOOuoovbsP6Mg+3GuvvUSobVaxdetW+cY3vjFgzyTvxEN2+NCHPiS33XZboecs0Ol0itzLsTqqfhxbIiKf//znZX5+3tRuRURuv/12+eM//uOirQo9S8Ntd1iyLJP999+/aCOsr9Z92aEne5kGPDFVmqb+6quvNk86hMmKNm3a5D1NBsQTMemJfLIs83fccceArLplHBPL8UROofVZWbZv326aDClNU9NxmjRN/RFHHNFXJttA2yNJEr9u3TotZiygvJAeenHO+T/7sz9rPIGZlsOTgemJwYad/Ovhhx/2vmTCrNBkZaHjytCTc1nPffDBB/smNAtNFqfre/nll/s0Tc1l+Br7jrqEZFXFrpTUM7ToXHDXXXfpqpkps5duryeddNKAHrO0hOw9ygL7Jknif/7znw/Yo4p/+Id/KM7VcttaJpXnJo1teDdm9O/ETUa0fCWDT4yMgVMv1pql0SLqyXVuUv9JkRnuQknuP8txmtBVMttA28OqT1tAN60H0Fcj+o5NU9gWZXYp06UMHB+Kf9iS94WOK8Opn0+s5+IuAXQL3THQ9YXvrWWE0DYdhZCsqtiVknqG0LlglDqXnTvJdtQGIXuPAscV9xUWoEvbOjE6/lcKditHIpFIJBKJtEAcfEQikUgkEpkocfARiUQikUhkosTBRyQSiUQikYkSBx+RSCQSiUQmShx8RCKRSCQSmShx8BGJRCKRSGSizMTgQ/9Huuz/6GXo93gw+j/S/D4GC/o/32Xn6XJWCrBXyG76HQT63QUWW7Dd+F0RZe+MCL2PYlyE9A+Vy28GdTTvSOj8EF5NHBWywUqlrI5l70lBW9exVoV+J4y2L+8bJr5CskP7qo4bFxyD1nfHDGMDZtTzhyHkyybgfJ3frHBdQ/UObbPgKJ+4wBtn2Y/sQ33cLDKcp1oEiYGTCToiC0n+UjLMpOkoeUMOy/M0j0pZgmPg3Pn5+T55kKOdzOXofcsR1AH10rbl72j43FjqcGpKby1fryNeJmFbrT/mHNEJjvX39II7fX4I1E13Bti30tF1hM3wimq93dMcO1YSms/JBV6Rr+MVx1mA75yaHJPjVUgH3mctYxRQT45btq3WF/t1jFfBvmAbaN+OA35BJXwhKpf8v+2df8wlV1nHnzP33vft7pbFQOLWBFu6pRVCEcH1F7akCk3BwiYaIIUELRKjCcGKjUatiQmRaowEKFVMEAUxFKhgYreB5Y+GpgFC0tIVEkob3v4SrduCVdbtsvfemeMfnu/ke597ZubMvXPnvffd55Oc3Jm5M2ee8zzPec4zc+fOaYJ9Ae2GjzSB/at8h+vj9VRYjphM0Lf+jtu0ruz63C5CAwo+P/vZz8pb3vKWpLlNiqKQ4XAoX//61+X5z3++uDCYoUPAKPrzxIkT8tM//dMzMz7GQKAbj8dy7NgxefWrXz3jDEKG1tvPnDlTzsNQhXamdQPt39nZkQMHDkgWJhzb3t4uB13YLQtJJDrYvn37VG31/OzP/qzcf//9MhgMZBAmasKAL9Rxsf3w4cPyla98RdXSjjr947znn39+uQ22HoTJrobD4dwU8u9+97vlxhtvLAelOhA8Dhw4MLMdd1Oa/L8NTzzxhFxwwQV6867y5JNPyuHDh2f6UkFzzcD/eNt73/teeetb3zqXoMSAvX74h39YJPiqC4kCvoPPOudkPB7LaDSS8Xg8Z9cqELv2798/4w9aNsh/9uzZcj9M+pbKgw8+KJdddpneXEme5zKZTEpdoe2FmvwQ/Xo0Gsmv/MqvyOc+9zldVSVZlsl5550346vwX62DrsE5XYj7W1tbUhSF5GEiuhT9wg9ERE6ePCkHDhwo/Y79ksH2u+++W974xjfObAM4xoU3Ho/HYynCrMawgT5Gk2WZXHjhhfKNb3yjjLGYM8rTnFIY7zChnY4na4l+33rf6PkGFpkfwtO++MR8Mbwdy23e3V+Flk2vezW/zKZz/vnne4nMYaDnnsDytddeq6uIAh3FbAKb4Ts9n8cDDzwwI8siRcvOBdt0m/V2npuES+y4phKrp6vyxBNPkHbXA7apti/v48kfrr/+ep9lWZKuYANdD69jG39/8803J9mP/QDy63mlQJ7n5XdFUfh/+qd/mquvqTz44INlfSmcOHGilFPXhfll8Mk+X+X3sbJv3z592tJWfcPnvOWWW+ZkTSlod0xnulx99dVz5/XKt9jm3nt/5MiRuXrqirYFy6VlRCz6+Mc/Xp5/XWl3D2gFOLrSQabM2WwTnJnylRDfjsP3nImmZJ0AVzK8P2f5VfDtyE0Fdino7hS3i+2GddyhwJ2ROlAXMnmh42Az1IerU+he23gR2KZoCwq2sa25nUW4cmRfYp9N8RFRV0ioB23d67DdYWcAvWI7/AFXpGy7KuC3uh5exzbsB9um2g9+wPJJ8BH2lyz81Mvb+4DPORgMynajfehvXs0Wm9p+9lscA130Qax/poL9+RP2TPEv2Br7Q2/sW+x3eZ7PxLcmUC/rFXJh2VGMzMOjAKPRaKaedWTXkw+JBJ0sMslYFTCoqMHeh9upzrkyeUBAgbFSjO+9nxvk0EmrZIQT7gV0p5SKpMKH4Mr7pSZfHPyEjtMBDctt/GMV6IQJcvIgl+JbVcC39ooP1aHtiHXcmoYeWR9Y1nEjBnzFhWnvgfYp1I3YkFK3qOSVYxHXj1vh2M7LqwZxEMuenpnh/ob2QiYd8+pw9CyNHgT7IFPPDLYZ3CGjp8QLbUmBdQo98HlRH/Q6GAzEUQLdBNsIoH7ULWQ37DccDnvxr2VI62ErBAqC0bDeZoAZhN/fYSg4gjaEo987RQWOFGBoODcHKHa4Ns67CbBdEJS4vciyEdQk6DbFfhwIMXizT2C7qAfhuOOtGvgm5IEcLKeQLxctBkchP2T/6qttuw0P9Ow/o9FIvErsoH/07VT/AtpPdd2ywKDJ/ujpooTlRZ9h/+XlVaIHLbSdB+g8PB8BnUuLxIhjA/cDDLJ9wH7DNkg9P2yFfsd+0QTOw3ZFXUI6ycIzNRJiaJs+PhqNyvq4T0BWrMOug/B8SYr8u8muS8dB3NMAhO9SYOcTNTByIGFHaOOcDAcTHaRi59p00Ca0WT+E58IVJdrLD9ul2I/t7ekWIncw+AdsDHtrWVYBByOWj4Mztgv5LMudgt5f+9ZehYNnzBegVz3AtRm8uV6sS0WcaDtoslxYhn+wX2BQwDGc/KySmE/pJF5UP9b+XQe3EWh9rxq0BTHdq3GkCdiK0f2xCpyH/Yc/hXSMJEInOXVklLRwnTpGCtkavpZS/26S1ntXDJwdSuQOm4IOJtwZsKwDlV6vQnesWN2xdf3dOqA7WYpzopOwfYSOZT1q/afUL5EAxusIJAxk0ttXiafbsoX6TRffS4srRk2qrhaB+0fsPJAZbWuDV8/HtEXLhHXdf9AGtnuqrOy7sWNwPi1HKhgI+Oo7i/wECV1p3+kbxFug+94y4PgqffN66rmgN94/dqweB1KJXbim2gm+w8dJpJ3YDl9JlZH9p+puCepmneh4vY40a7cH8NchCQpkhRvLA33qgJjinOgo+jYiOhyuotDBsFzVUTQFPRDo1G1E3YHwHXf2VeNpUIldveqrER2EmkBbqkoXQI9sk5x+XuCg3XZgZzkd2S/1woHtj3Us8zbg6BmuVAb0Ew3HGQC50Q7fMgkrwt/90W62G/cNbdM251gUbucg3NWB77Is7AtdyoX6tK+xvpvQuuM2dQF8lZ+TgJ4YbT9RF1+QEz5d0N9q+Xu2QSrcn9ifN5ldTz58+BkDHR7GaRsAjDg+8iwFd5gmXLgdCxtxx9edTWhQxvdNcMdEfdimBwrd8fvyD75NzQlITrdQoYcqWatAu6vKsnDA5n7GA5EEXXKAa+Mjut0uPJORkoDweeBH8FdHya2QH7R5GFLIfjF/gYyIOVhOtZ9QQsS+j3PBjqifddVm8FkG9l20DckndC1qUHOJP5s2AZtCn2h/qm/DdtPpdMZWbexTB9oIG9a1uUpuvY3rwruq2L/YHm2ArTgGbTLVmu4JOBE7OzorlL3KAvT2vVK4k3LHwvdNFOFBNAQR4OlnCOzHxyBAaHliRahjYZ1l42XdiXEeXXj/ZUsWBi4M2BwEhfwVMmFbnQyp6ONSC2BdYfDBNg62WeSNv7HBWuMjPzHAjvCPulKof6DpZIAHc2zjNul264L9ICeD+iEDb5fE+lE39s/Dw5t8Lixjf9fjxRV8Vyi5YHlZBuge8nYhH+riuqEHSYi78KHhcDhzUdP27lcV7LNYh98AbXMUHIeCbc65uYeM2SfY33WduqDNbCtHMWiT2fXkQ8gxoVyt6FUWoLfvlQK9Yrnt1QMHUbaP0F0ArHNgRafR8sSK0ECIdZZNy8n76GCFAvT2RUpB/xDwKlmCLFjmQF8nQyr6uNQCHP0zBNs5oEuwI77zC94hQ5CViO3qSkZvbRQ6pyfdcuDmetGmuoL9uC4cj22QA9/zvro+XXh/p96jgfOLuspFEqjbtCq4v/I2LbuoBAXblsGTz2Ed23D+usL74xihqQ66gG0mJCPar23OMsGOju4mAcSNmP96ugtWVzh54WP3Av14fw1eDVRQrFa4sRiebvkiWcD2ReHOlNOVHjoTtqfgw1WMDiaeBkEOAvq4VVMXuIEOkghEkHu3gd35pzPWJYInr6eC45DQCA0qbXxA//0Q+oX/YpvWdRN8vERsxfXo/VLth3OwzPq86HecpPXhvz70IySaODfLyp9sg1Qdp6J1kuJnTt0l4WNS7dMEYhj7MvykCdjaR979BFm1T2M9pf2INfBHHNP2p8d1pLn1K4YNo50pxTh7mSbnb/peKIg6uoWHAJNyPEAdAB2JAwOv6+0xEIw4+UQCg45Wdbz3vnFenrboNgq1k79nX0Xg4XZAZmzXdfYJZMjDHB+QJRbEuV38Qq46oJ9Y/4U+6oB8Xg0s7BMsM3w3a/EisAH9LRt1sf1wfsiAK9gq39Mg8YK/aptzXRn9RNXXAOLUixaxDTKyrrkNXYC28rJrkZiK0h+O5365LOwLou4EpsD6Yp9EHWx7ofib0gbsw+0X9eK6TWXXJ5ZjwxXhCvr++++Xj370o8nBZRl08/s2qIskAbweG4B5PUVeODoC3itf+Uo5evRosn6LopAPf/jD8swzz5R18GDDbYA9z549K0888URZh5ZT7++ckxtvvFGe97znldvYN3gZV/JPP/20fOxjH5upt+o8TdQd9653vWvOTno9o7shr3/96+UXfuEXooFIo8+rqTquCl2fp6uyxx57rAxaLvjEgF5MpD8vvvhieec73zlTXwz0W++9/NVf/ZU8/PDD5Xm1PJqDBw/Kn/zJn5S60sfodRGR48ePywMPPDCzrQq08zvf+c7cnRUMurAbEg/nnDz3uc+VZz3rWTN1xUD9IiKPPfaYZOEnJL6TB19ByULi9NBDD8mxY8dUjfW0nVjue9/7nvzDP/xD2W6WD33YqTt1H/7wh+WBBx5I9r39+/fL6dOnRSL2wrre/s///M9y9913z9lWA9myLJP3ve99IjV1am699dYk/0VdIiJ//ud/LltbW5LRT8gS6Yc475kzZ+TJJ58sdQn7TqfTueTbh7tQF154YTkBXp384Lvf/a685z3vmZGBZYtx2223yXXXXac3rxd6spd14JOf/KSXyAQ7Vropv/3bv61V3hmYPOnOO++cO29Tuf/++3V1a4GWM1Z4gqf3vOc9uoq14IILLpiTu65cccUVuopGrrzyyrnJrurKoUOHdBUrQZ+3qfzhH/6hrqKRugm/uiptJ5ZbhGuvvXbuvHVl//795bF6grUYRVH43/md35mrp6m05YMf/OBcHU3lf/7nf3Q1tXz+85+fq6Op3HvvvbqaWnZ2dry09KnbbrtNV7N2pF36GoZhGIZhdIQlH4ZhGIZh9IolH4ZhGIZh9IolH4ZhGIZh9IolH4ZhGIZh9IolH4ZhGIZh9IolH4ZhGIZh9MraJB91L0xpIvailti2vUqsrbFtoO673SAmD17c1LRtL7CM77eBX8oU07nUbG9D1+2petGTXm+Lbqteb4ujt4YuW9cq8OqtrbFl9pEu0fWn2k7LknpcKlx/G7kYLSPQ/oDlNufAvlq2qhdE4hybECvjLdgg2PB4K52ssBOtI+ygmwjk5w7DbwzlN1Dq/fYCbDe0jYM141u89hvE9BXzGbylFKyLP3EAb9t2vX/srbNaByCmtyr0K9nbHLtK2I/0ABjTp6O3nXZhf61jF94IWzV4anA89o/J3AWov639Y/0FdcAfdL/i2NYE64vtoY/nc0ri1Aa7TZoHrDG6w7Ozr8JJ1xF2PF7uInj0ie4wHBBgS27jXoB9NBaUtR8vMihAf6iL62B9IqDpOWrWBcgOOVP0wPvwsTE4lriWs84OBgMZhAnJQIp8q4Zl4D7En7wf+0cX9ke9rHdsa6OfIkwPIRV1Lgr8H2MH6uR+UQfrCZ+cLLDPsf/qhKQKT5Musm9qtH7Zl9eVZu1uAOzMOgM814CDY7KrTYInm8Ky7nD4bDMx1aaAgFRlNw6OWG9CByX2Cx3EWbexALcbaD+QBD1pCjXvBmIEt5F1o5OxJiDHdDqdOT5Vvj5wlFBwX3I06ZwEmQdqdtZlYZ1IOC8Ppk1AXm2XlOQgBW5r2zrZh9i3kMygjfiO9ZvSx6CrjJIZ7r8ogPtGSv27STtNrynee9nZ2ZGiKGQymZTKP1cKZ9rYhsnBNgF0kiNHjpTt2N7eFhcGBO5kLiSY29vbcumll+qqNg6nbqsOBgMZDodlsGIdDAYD2draEuecvO1tb0sKLhlNyf3v//7vcvbs2dJnOEDCZ7Atz3O55557dHW9MwgT3cH23nu5/vrrZTAYzATkujIajcTTVScGGx+COLcf+rr55ptlOBzO1RUrbB8cL2pg2i3+9V//dUZWtIn71b59+8SFfjUcDuWOO+7Q1SwM9K51/YEPfGDG9+oKEpXpdFr2FdTXFdDHwYMHS12k+Nd73/veUs7JZFI5/vB3b3/722U0Gs3VVVWuueYamUwmkud5qQvoRW/DOd785jd3rqOu2fjkAwYC2RpedfSBzt6zMEPnJgBbsc30FS/s6kIgw0CxF0AwRdvYlgzaLS2u0PQVFq7uWddYR1/CYL8u6La2nYqekw0kdgDtdGFAxuCG/VPAfkje9PZ1AO1k+bANdz7YD/j7ZYBP8yeWU/UDObTtugB161gJGZtgHSHuyi7d+fD0fAnbcV3p1pK7ABsYBpcWzrMXYOdzdHW37s6n0TbTCYeENm7KHZ0UuL0IHrxepZNU30bQEjUQaJ8RGpjWUb/o52hDavu57RIGWr4zwX6F7fhsM9BBZ9zn2hy/KupiAOuQ92Pf6AK2QSz5SYFju3Qom+5zQn6ht8fQPiRBVk4WOPnFOpKEJnyLZz5Yz236yG7RrN01hzsKB1oY+lxg3Z2sDt1hAK4ORA08ErkrssloH40FEaYuAFWh62D4XFmLp/D7xKkrvDbUtT2mS15uowv2SdTR5vhVAX/Sba2Kj67hodxFwLkRo9nHU8BxjF5fBu0jWE/RAx+LNvEFAmTn/dr0M9iDxzaJyMbnxHobHe8G3Vlwl9COg23rrvhVwfqI6Wbd4MDE6NugEtlnr1Klk6bvqqgaXGN0GdTXiTp9sU7r9kulizq6ghMPIdmqti8rOyc3epsenFPRx3fNsm2vkstRwszLbc5TZa8qHVbJso7EW2AYhmEYhrEiLPkwDMMwDKNXLPkwDMMwDKNXLPkwDMMwDKNXLPkwDMMwDKNXLPkwDMMwDKNXLPkwDMMwDKNXnG/zp+MV4undHJ/61Kfkuuuu07vU8u1vf1suueQSEVUXlvn/0iIiTz31lHzqU5+iGnYHF14iA7muuOIK+Ymf+AkR1Y46UvZhbrjhBnn/+9+vN1fivZePfOQj8oMf/EB8ZOIp/i87tp8+fVq+853vlPssigsTXw2Hw5n/42dhHorDhw/rQ2ZgeZ1z8prXvEYuueSS8sU9KdTpF77FLw46evSo/OIv/qKMRqO5lwHFcM7JAw88UL6MiOuD/PocP/dzPyfXXXddchtWCfvp+973PtnZ2Zl7sVIVg8FAXvCCF5Tt436K10oXRSHD4bD0g//4j/+Qp59+WkajUfR9MBrvvfz1X/91pTw4h6M3Uh45ckR+6qd+Kultr5Dv1ltvLe3DtloW9rE//uM/luc85zll2+t8U0RkMpnIzs5OWQe3EbjwgjnUd+zYMXn00Udn6qkCx37gAx8obcbyVum8S3AuoUkRsyyTu+++W26//Xa9exTY6zd+4zdke3tbJPJujRj79u2Tiy66qPQfAB1DB7y+s7Mj4/G40XZC+r3sssvKc6AeAFti3+l0Kr/0S78kl1xySdI5dg2/JhRFUS5/8pOf9CLSqnz729+O1oX1PM9nvrv33nvn6tit4pwrP9///vfPyJ2Crq+p3HDDDbqKSiDDgQMHSjlZbr0N5XWve52uamlYH+Px2O/s7MydVxeWL8sy/+lPf7r0hVR0nVVlMBiU56nSS6w453xRFGXx3s/JmOf5TPtTfWPVQI7JZDK3LUXGkydPzuiOdeKcm9meZZkXEf+Rj3zEe+/9dDrV1VWCOrke3uacm9l+00036SpqmU6nUVm7KDHd6H2qykte8pIZPcVswt/nee6PHj3qZcE2tJGti6Jl1OtNheV1zvnvf//7M7po4vjx4zP16Hijzyci/mtf+5quppZHHnmk8hxY522DwcD/4z/+o65m7dj9y6YVg2wRmaILV9IpVzR9gOyar25ljaY1r5IBGT1kxmRf2L+rqz6A+vA5Go1kPB6rveJkYVInviptuqJZBH7Fdmr9fHXl1BsRsR1XOrjq0VdZ6wBP9pbadoavWIV0CJ2i7dzutn2Y9an159Xs0NgvBfRftCEm6zLw3R2WL4XhcFjqyVe8+h2xR0L96Fep7Y/Jw1fmq0TLWBRF2d4UGbjd7B+Ia024MCEhjuW+DNmgH9gOE/ml3LUT1Ub4F84rKt7AD9v2jd2gWbsbTkazu8JAfAt/XeBkA8FsnWRkWbhjSegc0+l0prN2PcCjw3ESkTK7qafp49ExVwEPCqmBi8GxPNhy0EKAyWjmzHUAvqAHyDaDL3QHW+lgje+kZWIH2B58LnwXC+SpyT+OFzVjcFcxhnUhoa/B/1P8AHaZTqdz/hnTZZ7nMhwOk/pWFfCJvoCPwIbwoTYyYF8cm2J7CXrlpBOwX4BCJTUpCQLilpBvso8yTs2Au+40e+8egA2BrHNd8DRLKzuWVFxR9E2sA0M+BCgMiNy5UoN3EzFdILDEZNNwYELHjAWGZdGBJUU2iSSaOunk9nOdOvDsJlmWyUA9B5SKp9lkGbQ31h8QZFPQAxHqFBq8vbrD4kKSm+IjLpLIiBrslwF1ox0Szon+1gTkQ19FPaxTln8wGMh0Om0lPydBbK+U5Kgr2IaQIeX8sDPaOhgMktstYX+ddArpFfEmJgv0VEeWZfKDH/xAhPwfdpKaBCbP8yT/2E3mNbLHKOjhHOdc6RxdDY5dwIF0MBiUg/c6kIUHmPSgiO2irsaEAngXcD08QGT0U08dCAo4djQazXTiLuD2enqoLxXIpoMF6kIbONBUBZ2+Yd0i0GJZtycGJ97op2g3cHRrG9uRTDYBP8UgI2QvyMffcZKSIj/bCInN1taW3m0pIB/7QIpsAG2dTCalXdhHtb+ORiORxP4BO3CMlRb27wKWH8mAJOoINkNbOYFJQfsJfA3HF+HOBT6xTVRsqwP+BB0Lycl9AN8X4QFo3n8dWW/pOgCOAGfA52g0SnawPsBAit9b12VwgSNPJpOZTs4djmXNQuLU1R0mth0PVKnn4A4+GAxkPB6XASe189eBQUHUbfe2vuXUc0nQN9Zd5G5PyuC7alxIDLROfcXVnoafvyqKIjrwwd5C9uRgXkcefkYo6CIE9mG98jrOnSI/YPuhD7f1gSogH/pWG9/lgQ665cFRlD60jzXB+mWZ2si4DGw/6IeT4RQySj4xLqTaDsfBFyEPGA6HcxcXOglpArLk6rkogHUdD/T6upFmnQ0HHYE/29xWXCWQAQPp1tZW6WypHWCVIFDxwArQEXL6nREdqqurP6fuKmBbysAj6hjIycGmK7z6DTa1ft02oIOgV897wCbrAGQDGIh0m2LALtADrs49DV6sS/iXDsBVIDHS59HyYR3fZ4lX7i7y8xDskipjHSxv0eLv4QD7o30xmzjqY7x/Co4eoET9defqGvY99g3oqwm2X5ZlcvbsWXEhrqXIj/3Q97UPcHKN7xzFohQgG86FdsFGsT6Rb8BDp2mt33B0B0RnS3GuVcMOKRS4edtuwjriIIXvIC86sISON5lMyv2WYVkbVeky9aoA/iIVg0mVfFXbNdr+jNa3qCvZlOAq6gqL241za1lT643BA6SWPQb0y3pAHTHdOHqXQSpcV9UnQNvbDvTcBgwsbCtOSNokJywn14n1NsCfWOeon+vFvovSRR1tQHukRdIYo6A7b6lwEsH9lRNdlge+yD7ZBMdWwP4G+Dx96X4Z2nmvcc6BDpWH270c9ODg6AT8PE3bTlyFPoen39ZTgq8PD4EV6mo85VhRnRx1cKDrGg4oPvJzA86ZOjhCT7Af7gSgLawXnAv16uAWw6s7FFnLxICPxd01IV1jMMnUlV/K8z4xcD69jPMOwgOH/F0dbAfuF6iPdQt983ITWeR5FGxLOR5ysC0hE9oJH+HvU+oWlWjAXqISvlXCuhbyG92mKvjYQXh+hdvUBPunD/ERd3217re2tqQoivIFYyn153ku29vb4ulCj+23yTRbxzinQYdC8BcKuNzBB+EpeSyn3lloAwc4HXSqcOG2MAckXm8L9IFBfFky+qcI6hYKohiQ9blc4gCB/TCoSjgn7Idt0Ks+tgm9T0GJQaoPoN053SrGz05oI/SD/VPaLpTAwWcgLyc6+E6CzGyHJnjQERoMPfUNfPK2VNBu2C9r+TdmUQmiqH/8IRGCTl3L9yBBp2gz6mgr46JANz5cZEAW6CkF2AT+hzpSwH44V0bvSRHqH7x93759pa6aGIS7yOxDqbKtO+16gnHOgeCCgAJ4UHDq93S+eliWug7a5hy8Lz8Elgp0ANqcu44iXAljAOQBC4EG2znw8L51FCFRrBpU2a5YrtN5DK4TMqUOYD4MFOw7Ep794MDNtHmS36kHYtE29ld8x8dA36mgLj6Gz8nnci0GN/gd7Mf9LkW/3A7Ynwdp1MFtRv9I0TH7FA+Qbdq4LPCZtn0asL9Pp9NS/pR+gH3ZvkJ3gb1KhFx4mBzbU+A+ifPwOTeVtNYb5ywcuHiQYMfnIIhO11XHQAflzl2El5ql3HpHMOV1odvrqXCQTQ1MqSBQc7DmoMaBBzKnBnbsHxvguf2oLwt3RRYJ5DwwpthG6IFQbg/bnAM3fLDtv0mqbMU6xrlEBfgmUIdQQsB9gO2Vhb+Hsx81Ab9g+2E5xUZ8Dl6OJV/cFmxvIrZ/G/0tiwvJpVN9KNU3mCzLZn4uTpGfEy4sZ+qnR+iFv88Sk1vvvYxGo5nzoK0p9lln9vzEchp897WvfU1+8id/Un+9a8ChbrnlFnnnO9+pv66lqq1VtJlYDvo6depUGaSG4a+3wzDZF5IPdIbBYCB33XWX/Nqv/VpSB6uDj8ftVQSc06dPly/gqWJAPwE552R7e3vmH0VNuvPey+nTp2c6OmzFdS8Kzv+sZz1rJoBi0OWgI/SA26/+6q/KBz/4wUb5QZ7n8sIXvlBOnjw5UycGTKee6znvvPPk5S9/uXzhC1/QVdXy2te+Vr785S9LoZ6PqcJ7L//7v/8703YsM6jHey8HDhxIuupnTp06Vdbt6KFWyInzwafhJ03yC/nDI488UvoE/1uJ6yjCQ43T6VTuuOMOeetb3zpTVx3OObnvvvvk4osvnukLdXzjG9+Qa6+9diYxQPu1/V34yeXjH/+4vOpVr5rxvyqKopCzZ8/KoUOHREgXMRv2Ae7aeO/lt37rt+Qv/uIv9C5RnHMyHo/l8ssvl1OnTpX6aCLPczl9+rTeLEI+m6lkft++fTKgl5PVAVudOnWqXPcJsee2225rPYb2jp7sZbdY5cRyDL6777775urYzYKJgW655RYtciO6rqbSZmI5TcqkYUVR+DvvvHPuvIsUTM6kJ1NapPBET4PBoFWdOHY0Gs19t2ypkkNv5wnrfv3Xf12rvZFDhw7N1akLT2J25ZVX6ioqwaR4V155pRcRPxwO5+puU6DvruxfdTwm5eLvsVw1MVisOOdm9FE3KRm+u/322+fq0UXr4cEHH9TV1XLixIm5OrnumF6OHTumq6mkKAp/5syZ8ljuV7G6uy7sH2yvLMv8O97xDi3uHDqeHTx4cCH7QwYtBxfoW/tbSml73G233aZaun7Up7XGOQ8yc3wiE+erAlzhgZQrhlT4ig3gaiz1PNgPV2SOrvKbwLGQg59F6ApcyQhdmQKsQ+/aHk3E9ovJD53m9NBn7NgY0KtQ3Yv844XX4WP6zkRs/yZwi5uP4yt61K39CjZvQsuHu1PYxvX4Fr/1S40MVds12i68Hf7E36EtbernK/C6q/FVwHIWdKdGx6gqWD/QRcxudbjQP32Ig1Xnhr5RUkA92B+fsfo3jfReYJyTxIKXDp7ofNJiwGqLDjLS4lzccdt0fKk4R2zbsiBos3ws76LnjA0ssbpYv20HEB3A26KP4fbXfZ9KzF/0Nq8e5myDllP/JML9ZdFBQ8uk+2AVWrYY/B3kTq1fIm1CHXXn7BqcS+upDYvK7CN9Sq8virZNbHlTSfcwwzAMwzCMDrDkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkw0ii6j/m/E4I/n+//u//MlTV1eZdBIsSe1dDFVpOvV6FfheHXtbnXvR9BJsIdMB6aftq9VUSs1eM2Psn2tpQ2z3leOyj3zUS2w5i2+pw9J4fHOvpZWoxG9bpqglt/2XqAlqXberU+oodq3UQ26cOrV99zk3E5nZZExAQ1m1uFwk6u+uuuyTP8zKI4pyDwWBuinrnnOzs7Mi//Mu/zNSzKLCZbuf3v/99+fKXvzyzrWucc3LNNdeUb0/kt1fiswjzY0A3Dz/8sDz66KPJb/kcDody1VVXlZOOufDWyExN8obzOefk1a9+tdx44426qlp+5Ed+RP7zP/9Tb67kiiuukHvuuUdvruWVr3xl62PqgM3Zty6//HI5dOiQjEaj6KDeJ5BrMBjIDTfcIEWYVI/foJuFieDgK6PRSCaTiTz88MNyxx13qBpngd9PJhMZjUbytre9Tc4//3xxNFtvHf/1X/8lH/3oR0t/lVAn/Bm+m4f5aCaTifzyL/+yXHzxxbVxFLgwHwzmGYLfcpwowhs/cZ4sy+Sb3/ym/Nu//Vupoyacc3L11VfP6NvTC/h4vino68iRI3LVVVfpquaAXEVRyIc+9CE5e/ZsZczRfPe735X77rtPhGK4UJ1aF957ecUrXiHPfvazJafJ/ep45pln5J577pmZz4XrjWFzu7TA5nb5/3f2r9vcLpiHYnt720vF3A38iXkNXv/61+uqFobtiTlE8jz3Ozs7c21bRcF5p9PpjDw8fwfL+Ad/8AdeEue2wD4gz/OyXj6n975yOZULLrhg7vx15YorrtBVNIK5Xboq2sdExP/t3/6t9w3zp/RNURRzcqIv8Dw3WHbO+Te84Q26mlqKovCHDx9uNcfHS17ykvJY3+A3k8nEF0Xhjx49OldPXdm3b1+tr2ryPPe/+7u/m9wG6EzXEVufTCbeh/beeuutc3U1lWeeeWam3ia+8IUvlMdiXiSOg0LzQWHbV7/61Tn5q8jz3D/22GNlXbB9k+5sbhdj40GGvbW1JULzE+AqHFcgIv9/FYhsHNOedwFfHeBqJMsymUwmM/utAr5axF0IXO3hO3wvQQfD4bDUTxOsOwnn43Oyfvl2s771vFdhX4OOsc76301wZY8rW7YNfIWXed8mPL262zlX9sNUoDN84upZnzvP8/KuAfoujmkiC3d20G7cTdG+jfiAfqRliMF9zXtf6hK2h37w/XA4nNmeCvrdmTNnWh0H26NNkAM6yEKcwl2qLMtaxYcsy2Q8Hs+0N9V31p316L3GWoOEA06PjuBoUikdcBEElkUHLt6WGhyXAUGMbx1L+KlEy4TEhPdPQQ+iOCe3nb8714COWU/rGIB5EHKRidvgP/APbfcY2ofG43GrdvNgLJQY6HoxGPrQv1MHR6H4wMdzu7Ed+sExWoY6cDzHGU7qWFboNlV+CXUU4ScxhtvVVLA/4AQLcRLtRnuqQJ15mOgRfYCX647fBJq93zjniQUwBJwsXPVwEuJbzIrZBAduzv6bOm9XoM0cnLltnIhxYGgDB2K0C0UqBl0OcucK0E2f9m8CfYD7BtD2Q58BbXwF+w6Hw5lng5qYTCYz+7IsjPY3/X0V3D/5E+2EflwY3FHv1tZWkg9zPUJJggRdYJ3biM+Uu4PYF/EL29jH6gr0ybGJz6vthBjRpF9dP7bxcyIp+ltnLPkwakGnhKOjY3FAYXSwQCdepuhz4NzcMVcFggAvO7py8eHqxFOSonVWB98h0vt7us3MsEznAtCRHmSkI/9aprAsRbjihl/ge/ivvmpFol5XsC8SAkc/4+C7urK1tVXKI6Qv1Iftoq7KU+rGvvypfxZhMrqjEvPrKlxEx6wfofPhZy3sq+XVhesAaAuftwr81IKkAMuD8JOLqP4KnccSI7Y7CnTKd2Rgv01n81tgrBQOkI7ucPA2fEroXLGOt0zhAMHLfLWyKnA+fHJAQ7sRSLQ8LiF44fdsrlcoAOq7Tkxs215ED2ja73azAEcJAvcHyCt0t8FR0qrr04XhdR6A64p+9gr1enXHButYxj5NBbJgf9yVkcgdPa471r4qcKxQu3U7oFudzDcVxtE/cyRydyjGcDicSYhwfE7/DMS5IK/WCWC9sH4Gg8HcHSyWc1PZ88kHDMwOIBWZ+W4BpxTqXHog222408eCFtbR8ZYhpdP3TcxvdOfnu0ISCS5V8H48QPF3ep23LYOug9dT+khVG1OOlYrzxa4KRemmTfDFcexX7L+Ar8YX8UEco/sH0NtS5QccJ1Llg06rzhX7ns+TAtvFV8RY3eZU+TVsdz4Xb1ukbsjKx6b4cJ1vSYUutR+komNP2+PXjWbtbjjcIbiD8e253QZONBgMZDwei1vi+YFVwI4e69yxTuAjVxYx9D6ersA4mAOWJSU4bAJoM7dd64V/2gHaDoug6+S+kpJEat9g26X0LxwLfx/Quwyq0H25CdZtEXk+ADLwXaY29UNeJE1ohzGfmLCute/FYDtJRWLP/uLUQ7+pQDb4QJMPpsJ9Qsh3i8QHjkUlbCk62xTSWr/BsME8DZwISOsA37bXP3OsA5BLIkGAYZ0OIk/Ux0BHZHTSgXpQN2y6LvZbljpfRNuhTw7iMRu0xYVEF3WLSkBSwH6O/koqkcQmBvZFsGdfiwFdpdQNeCDiNsX6mR4sm/Dh9/s8z2dk72rw2nS4D7P/6j5fBeyDY2ATthv8l+us8yEN6mc/4OVlQV9lf2vTd3UiVRcvNol0DWwomXpvApbbGH/VwLliZR1AQiTU6Tlzj3WENsE3U28BROfKI1f70iKx2RS47QA6xvcIXNA/f78MWs/Qf5urLN4Xtkv9qzUfh3Zp34FeuM0uMTkQGohYd0IDoqiEt41vQQ4cxzZJ1cFeRvsobIDPFLSPSCRpxfdC59TnrgL1e0qKUmVrIuan2uea0P9uYn1sMpstfQLa8BL+fsaBZzfhAdzTS7vaBP9VAhnQyTkRKSgB4cDLwb4J7kjcGR1dkWMfbS89SG0ydcEU32uf7SL4uJBscGDTdqzD08DL9k79NwPOD39HHfrBQewrwe+0LprgurGukyYtQ2r9LAv0IS10sJfJ6EFMUTZkezQB+6B/uJCk4q6TkI2h/xT/Zf9ne2t/Xha0n/WR0n+5zb7iLt2m0tz6DYeNBWcajUaVV9V9U4S5IMB0Oi07UGrwWyUcLIQGR3RadCKWlfdpgm2AzsjBSiI2RNne3i63bypaRxwwOWCJGsy6Sryga+gUDIfDpMHThXk0sOzpb4S6bTH4vDEfAi7yO3nb/ovAL2rQwTYehNoMjtpOeqA9l/H0MwN0mud5+RfgFDjODCIv3MIFEdsScbQJ7f861iwL9wf8Mwb/cEupP8syGY1GM7GRv9tk9vzEcnBaOBky5fF4LN/61rdmBrndIg+TOnnv5aKLLpLnPve5ZVafQmonBotMLPf1r399JnhgcNre3pYzZ86UHQSvEj548KAcPnw4qYNMp1MZDofyxje+UR599FERsiHOiUFBqL2nTp2SBx98cKauVZDSRdjnbrrpJrn55pv1LrUcOXJEcppMDv/tL8ILiXhgy7JMjh49KjfddFOSfkFsYjkEdsCD78GDB+XSSy+d2V+D/SeTiWRZJr/3e78nL3jBC0r/aPLNp59+Wq6++upSDuzv6QFRnQg9//nPl2c/+9lln2nCey/33nvvTN1oo6ikIQsPK37sYx+TD33oQ0n1Szj2/vvvL9f5iryKN7zhDXL77bfrzbX82I/9mDz00EN6cyUvfelL5cSJE3rzjL9qXve618mdd96pN1eyf/9+OX36tEhFvRx7weOPPy5PPfXUzH4xkGB47+Xtb3+7bG1tzVzcwI4uPG+0tbVV2vWqq66SN7/5zarGWby62/yyl70sOe6KiBw/flxe85rX6M0ljn5iwrle9KIXyWg0Ks9bR5Zl8vTTT8sjjzwiOb1BGZ9V2MRyLVjlxHKxCcD0PrtNbLKyVLQumkqbieU8TebmST6tP96nDWyPl7/85XOyipqsq2p5lSUFbvsf/dEfzdWxTIm1+frrr585fwpNE8vxZFi83FRYvnvuucf7iH9UcfLkybn6hM4fa7terivYD1TJpbf/2Z/92VxddYXlSdVd24nlvPf+sssum6unrrz0pXi0b1oAAAyySURBVC/VVXgfaS9z7bXXztVTV/bv318eq+vV61XbquC4Ah3HbO/UZG5Zlvl3vOMduroofA6WLUXOz3/+83OypJZYO2KFJ6xLPd4mllsT+OoQWbnOzncbyNPmSrYvcIUhJJ/WH+/TBrZH1ZUiZ/hVy3uZWJsX0XUTfAeEl5tYRr4qG+L8sbr1ch16vyq59HZ9XBO8fxvd7XW0Xqu2VcFxBTqO2carn2r5LloTfA4+JvX4RYm1Iwbiot5fr28a6zfSGYZhGIaxp7HkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXrHkwzAMwzCMXtkTyYejt735hLe/7VX6/I961+8ywBsQ+2xDW5reM8HbupId9ej3q8TOX0VMrq7lw7sSYu/nqIPl4HfctHnLZBN8DsjH75RhX65618xehtuP+NnGP2J9tk1fScE3TDkRez9S1b590qV/r0N7umTeYhuGo9fWwqHxGtpzAQQLgAG8beduogiv+Ua9WeLcBE1wfTyvTVf1L4vWZR7mBILOoRMEbOzbleyou+2gzvCAgPq03yyKbi+CamrdhZodGcd1lQRoP8rCK9v59eexQaHr5HqdQfvxYq7UeVGEjkW/wHFsf7Ypf596Dh+mdOC+JirxZXstMrCvCl8x8WIepqhoYjQalct8/Dq1cVH2zNwuX/ziF+XCCy8UHxKRPM/LOUP2Opdccsmcczt1Jcq0mdsFg8Pjjz9edn4Eb0yQtAzD4VDOnDkj5513nrz2ta+Vb33rWyILDrKrYmdnpwwiQoO4976cf2UymZTzSvzd3/2dfOITn5ABTYK1KDjHeDwuk7I8z+Waa66R3//932/Ukwtvjh0Oh/IzP/Mz8uSTT+pdloIHLhGRT3/60/LjP/7j5Vw/Te3/7//+b3nTm940k1whWGMwXAbEg+PHj5d1QWfoM5CzCPPIFEUhf/M3fyN/+Zd/2ajfZViXuV2gZ+jjN3/zN+Wuu+5Karv3Xs477zz55je/WW5DzODjWffOOXnqqafk9OnTjf4B+znn5FWvelXZ72AznAf7FWEW2OFwKG95y1vk3e9+t66yU5rmdtE45+R5z3uebG9vJ8XPoihkPB7LE088Id77uXmOqrC5XVrA79FfZG4XLnjnfeocC5te2s55scjcLvv37y+Px1wDXZVF5i7oq8RkwDbWA7fhT//0T7UKl2I6nZbLmIfi7//+7+fkqiosJ/eNLu2YZVlZ93A4nPu+qhw6dCg6n0bKvBpt0OdF4RhR5YerKus0twvPKZXn+cx8J6ngOCxr+Lt3vetdc7I2Fa6DZdOy90nT3C5ZlpU+hs977723lZwPP/zwTJ0p/mlzu/SEC1M2S7gS44x+08EVSV3RV3Ki9LAMuFLhurq6JS50ZQ74SiDlymvVoP2AdYGf97gNvH9X8utbrNoeTbB+2Ve6sKO+8yFhlmLI2FS0fnEV2xW41Q85tS5Zbr774iimnAtk4WdPLLMP1xWG/ZJ1h7tK/B33nbqi6wIu/DyEux84B9qxLrFf+xePU6nALtCJ7jObSroG1hQYAwGGjb0XDKQ7e6zAkREMurjdD6Bfncy06Tx1QGach4PUusCd3YWfA7j9PtzyFQrcfMwy8IAodP4i/ETQFsid5/ncQLwIbC/Wg/bRqgJ59MDXhe6EnoGCHjHoCQVz3X+w3FUf2gTwU4V+3gM6qio4FvvCrkL6zMLPhaAIP9tqX4gVroeB//NgnoWfYHj7boMxCfK19SkffnaFbkXF5E1ms6WngcHTswg6AdnLRWgAyLKsfN7FqWdAFgV1j8fjme3cEZYpEgYIrwYu1L3bQE7IVBRF+WyHRGQtwnMxHDiXKQiorAsesLU+dZHwXA3gvtE2ENbhnCt9D+v4rCuTyUSEZIRMrN9lC+MocON7HS/w2UVytu5AP2jrcDgst0FXdQXHst2hQ65fyKa8j/YHXVAH5MO2qoSRl3l9t+AxSccM3JWrKy7EdSzjWFfxPN8msfHJhwRjwhnzPJ9xzL1emCI8bNVlRgzHH41Gc+eTDnQsdOWkBy58v5toGRwlYhwgkQgADhjLFJxHIsmCSxgcXLg9reuSSNsWAfX58I8E3obtdYUTOSG9wYe1PhYpwFHw1m3n/US1Zy/D7ea7T9CP1qUuQgMsYN2yzrG/Cz7JCWBVwf55npf20PXzMvZl+XYTyAN/zuhhatyVqysiIuPxeKYtrJtNprtRagm8+p0cy22uPFZ1RbcpsDMW6i+xMdo4rx4cVk0b2fqA5dHL7K/4hP67Dn7QfRv/hrz6sytigTC2rYpYssyxoAt0213kZzG9z6rgtqb4B9s6pqsmdLtQn4tcOfMdshTZgJZJ9wetbwy8+vxVQHa+M1pnpzbjRhdoXbE+YvrPWr5KwIVEBPtzYq6J+fS60s6TVwCc0ocrDVbeuXDlsWqqOrhLfOCQr2o4YPk98JtjV+jAjiuaLjo/6xvL0HsX9e82PCChfTxALktBz6Ton/X60h8GD1FtSzl/Fh7O9OGnh8lkIq7Fw7D6HBk9d5BaRxeg/YvEDdiN5e7CN7qgiFzoIcGAjEg0sI7natq0geMwltm2Mf22qX83aOcFK8DRbTIolAOGsRzQKy8X4eeZlCuEjF7+xc7e5splr8PBdBB+/9aJ9KJwINlLSYcmo3eY8AC5LPBfURczizysuyhINND/sJ5qRwxkPjxMiRiZAnTJAx8Gw9Q6lqWgxBLrqf0D4wP8Q1Qivttk4Tk7UXc1OCnRyULbixP4DusM7cc66nL0k866s+vJh9ADh+gk6BzG8nj67RrLg8GglXPq/TkgGLOBAHrhYLMMPGAioDn1m/Amg0DNzxt07VvD4XDOf6fTaas+sAzwD/Q/HoSagL1FXai1sX2WZXMP9voF7kAsAs6Dc0HuqmfIYvCFzjqOEeijeEEdJwJoN/s0j3VNeEo40Wa2v64D52Y51pXVe18DUBAbB5mbVqzRHtahDlro0ClgcMCg6iK/GZ+LxAJ4yqCSCurSVzr6L5GbCq7E8TdPR3dAu2gf9IZBmwctTuxWBfyDE3j0QyQEqWDAaqMb9Fs92Mf8dhXAX3kwRIKZgg8JWxZ5o+k6jA/wKSFdQzYfkgz+Jxe2p+rfhURZVAyALrGN/148CG+fXgf91JGmgRUCBemHnXCFgI5qZbHi6W9qEjoGgl5qBxDaF0EcHUif71wrnIBxQEi9smkCASxT7wnY2toSoYFsUwv7pv4pxHWgP/Zx6BL1allWUTj5wSCKwZPn7ajC0SDG/Y2/ryvb29sz7YaP4nPVIOmA7Eg6isR/ezhqK3SHbakJzKpBWyTICD2jzyJ5gNz45NhRB/sJYgDiOvx7Gl6sBh13eQG0KtJHnxXBBmBnglLRUa0sVlivWIczY70ODlrcsfCdPt+5VuCn/Ok7vCpz6uFC1OtpENnkEhtAUoNyW3ZDd1KR5ONOTxM++BIPOqgX39cV6JfjKSdgqwYxA+Cu1iA8G6Xl1UWC3QqV0Ls1eQ8LD/hYh9zQNdBti/mFxkf+wg5/yMNke0jisD9i0LqzFhPLeRWsH3/8cfnSl77UWwfZ6zhKGJxzcumll8rLXvayJP3CNp/5zGfk7NmzZTApIpNHnYv4EEj5Z6nLL79cXvziF+tdlwL6xvJjjz0mX/3qV/VuG8e+ffvk6NGjIpE7HdzmRUEdn/jEJ8Q5N/PzTh9gYMrogVqc+0d/9Efl53/+5/UhUdAPjx8/Lt/73vdkNBrJZDJp1M8P/dAPlROfsT45HvQB5Md5T5w4IQ899FBj/Chosj9MlNaFX3TFyZMn5a677irlYXsj8UC7kXBdc8018pznPGdu3IvhvZfTp0/LsWPHynWv7jojOUH9IiKveMUr5KKLLpqpa91Yi+TDMAzDMIxzh/VIHw3DMAzDOGew5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF6x5MMwDMMwjF75P/0ZSaHYdwnOAAAAAElFTkSuQmCC
-"""
+# NumPy and concurrent.futures are imported where they are first used: together
+# they cost more startup time than everything else here
+np = None  # Set by load_numpy(); grouping similar images is disabled without NumPy
+
+SUPPORTED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp")
+MASTER_THUMB_SIZE = 160  # Thumbnails are generated once at the slider maximum
+ATLAS_CELL = 80  # Atlas cells fit the default thumbnail size
+THUMB_FORMAT = 3  # Bumped when stored thumbnails change; 2 = rotated by EXIF orientation, 3 = alpha kept
+TILE_SIZE = 256  # Screen pixels per tile of the zoomed view
+MAX_ZOOM_STEP = 3  # Zoom goes up to 2**3 = 800%
+# load_region rewrites Pillow's tile list and size; only done on the versions
+# it was checked against, newer ones decode whole images instead
+REGION_LOADS = (9, 1) <= tuple(int(part) for part in PIL.__version__.split(".")[:2]) < (13, 0)
+SCORE_SIZE = 96  # Side of the grayscale patch sharpness and noise are measured on
+SCORE_FIELDS = ("score", "sharpness", "brightness", "clipped", "noise")
+ABOUT_QR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "about_qr.png")
+
+
+class Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns() - self.start)
+
+
+class Profiler:
+    # Low-overhead stage timers: a bounded window of durations per stage for the
+    # HUD percentiles, and a bounded event list that can be saved as a Chrome
+    # trace (chrome://tracing, Perfetto). Appends to deques are thread-safe.
+    def __init__(self, keep=512, trace_limit=200000):
+        self.keep = keep
+        self.samples = {}  # stage -> recent durations in ns
+        self.counters = {}
+        self.trace = deque(maxlen=trace_limit)  # (name, start_ns, dur_ns, pid, tid)
+        self.origin = time.perf_counter_ns()
+
+    def span(self, name):
+        return Span(self, name)
+
+    def record(self, name, start, duration, pid=None, tid=None):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples.setdefault(name, deque(maxlen=self.keep))
+        samples.append(duration)
+        self.trace.append((name, start, duration, pid or os.getpid(), tid or threading.get_ident()))
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def drain(self):
+        # Used in worker processes to ship their events back with the result
+        events = list(self.trace)
+        self.trace.clear()
+        return events
+
+    def merge(self, events):
+        for event in events:
+            self.record(*event)
+
+    def percentiles(self, name):
+        ordered = sorted(self.samples.get(name, ()))
+        if not ordered:
+            return 0, 0.0, 0.0
+        p50 = ordered[len(ordered) // 2] / 1e6
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] / 1e6
+        return len(ordered), p50, p95
+
+    def export_trace(self, path):
+        events = [
+            {"name": name, "ph": "X", "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+             "pid": pid, "tid": tid}
+            for name, start, duration, pid, tid in list(self.trace)
+        ]
+        now = (time.perf_counter_ns() - self.origin) / 1000
+        for name, value in self.counters.items():
+            events.append({"name": name, "ph": "C", "ts": now, "pid": os.getpid(), "args": {name: value}})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+PROFILER = Profiler()
+
+
+def profiled(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with PROFILER.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def process_memory_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1048576
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def get_cache_dir():
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base, "image_rating_app")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+@profiled("encode")
+def encode_thumbnail(img):
+    buf = io.BytesIO()
+    if img.mode in ("RGBA", "LA", "P"):
+        img.save(buf, format="PNG")
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+
+EXIF_ORIENTATION = 0x0112
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def exif_orientation(img):
+    # Read from the header of an opened image, before it is decoded
+    try:
+        return img.getexif().get(EXIF_ORIENTATION, 1)
+    except Exception:
+        return 1
+
+
+def apply_orientation(img, orientation):
+    method = ORIENTATION_TRANSPOSE.get(orientation)
+    return img if method is None else img.transpose(method)
+
+
+def decode_thumbnail(path, size):
+    with PROFILER.span("open"):
+        img = Image.open(path)
+    orientation = exif_orientation(img)
+    if img.format == "JPEG":
+        # Let libjpeg decode at 1/2..1/8 scale instead of full resolution
+        img.draft("RGB", (size, size))
+    with PROFILER.span("decode"):
+        img.load()
+    with PROFILER.span("thumbnail"):
+        img.thumbnail((size, size))
+        img = apply_orientation(display_mode(img), orientation)
+    return img
+
+
+def derive_thumbnail(master, size):
+    w, h = master.size
+    scale = min(size / w, size / h, 1.0)
+    if scale >= 1.0:
+        return master
+    with PROFILER.span("derive"):
+        return master.resize((max(1, round(w * scale)), max(1, round(h * scale))), Image.BILINEAR)
+
+
+def list_directory(folder, extensions):
+    # One level of a folder: sorted image files as (path, (size, mtime_ns, inode))
+    # and sorted subdirectories, or (None, None) when it cannot be listed
+    files = []
+    dirs = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        st = entry.stat()
+                        files.append((entry.path, (st.st_size, st.st_mtime_ns, st.st_ino)))
+                except OSError:
+                    continue
+    except OSError:
+        return None, None
+    files.sort()
+    dirs.sort()
+    return files, dirs
+
+
+def fit_image(path, w, h):
+    with PROFILER.span("open"):
+        img = Image.open(path)
+    orientation = exif_orientation(img)
+    if orientation >= 5:
+        w, h = h, w  # Fit the stored (unrotated) pixels to the rotated box
+    if img.format == "JPEG":
+        img.draft("RGB", (w, h))
+    with PROFILER.span("decode"):
+        img.load()
+    with PROFILER.span("thumbnail"):
+        img.thumbnail((w, h))
+        img = apply_orientation(img, orientation)
+    return img
+
+
+def display_mode(img):
+    # Tk shows RGB and RGBA; transparency is kept where the image has it
+    if img.mode in ("RGB", "RGBA"):
+        return img
+    return img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "PA") else "RGB")
+
+
+def build_pyramid(path, max_w, max_h, min_edge=128):
+    # One decode at (at most) screen size, then power-of-two reductions of it;
+    # any canvas size can be served by resampling the nearest level.
+    levels = [display_mode(fit_image(path, max_w, max_h))]
+    with PROFILER.span("pyramid"):
+        while min(levels[-1].size) >= 2 * min_edge:
+            levels.append(levels[-1].reduce(2))
+    return levels
+
+
+def pyramid_nbytes(levels):
+    return sum(level.width * level.height * len(level.getbands()) for level in levels)
+
+
+def render_from_pyramid(levels, w, h):
+    base_w, base_h = levels[0].size
+    scale = min(w / base_w, h / base_h, 1.0)  # Fit, never upscale
+    target = (max(1, round(base_w * scale)), max(1, round(base_h * scale)))
+    # Smallest level that is still at least as big as the target
+    source = levels[0]
+    for level in levels:
+        if level.width >= target[0] and level.height >= target[1]:
+            source = level
+    if source.size == target:
+        return source
+    with PROFILER.span("resample"):
+        return source.resize(target, Image.BILINEAR)
+
+
+def stored_box(box, orientation, w, h):
+    # The pixels of `box` in the upright image, as a box of the stored image of size (w, h)
+    x0, y0, x1, y1 = box
+    return {
+        2: (w - x1, y0, w - x0, y1),
+        3: (w - x1, h - y1, w - x0, h - y0),
+        4: (x0, h - y1, x1, h - y0),
+        5: (y0, x0, y1, x1),
+        6: (y0, h - x1, y1, h - x0),
+        7: (w - y1, h - x1, w - y0, h - x0),
+        8: (w - y1, x0, w - y0, x1),
+    }.get(orientation, box)
+
+
+def moved_tile(tile, extents, offset):
+    # Pillow 11+ tile entries are named tuples, older ones plain tuples
+    if hasattr(tile, "_replace"):
+        return tile._replace(extents=extents, offset=offset)
+    return (tile[0], extents, offset, tile[3])
+
+
+def load_region(img, box):
+    # Decodes only `box` of an opened image when its file stores the pixels as
+    # independent strips or tiles (uncompressed TIFF) or as one uncompressed
+    # block with a known row stride (BMP): just the pieces the box intersects
+    # are read. Returns None for formats that can only be decoded whole.
+    x0, y0, x1, y1 = box
+    tiles = img.tile
+    if len(tiles) == 1 and tiles[0][0] == "raw" and isinstance(tiles[0][3], tuple):
+        # Cut the block down to the rows of the box; bottom-up files store the last row first
+        extents, offset, args = tiles[0][1:]
+        stride = args[1]
+        if not stride and args[0] == img.mode:
+            stride = len(Image.new(img.mode, (extents[2] - extents[0], 1)).tobytes())
+        if not stride:
+            return None
+        skip = y0 if len(args) < 3 or args[2] > 0 else extents[3] - y1
+        tiles = [moved_tile(tiles[0], (extents[0], y0, extents[2], y1), offset + skip * stride)]
+    elif len(tiles) < 2:
+        return None
+    picked = [t for t in tiles if t[1][0] < x1 and t[1][2] > x0 and t[1][1] < y1 and t[1][3] > y0]
+    if not picked:
+        return None
+    left = min(t[1][0] for t in picked)
+    top = min(t[1][1] for t in picked)
+    right = max(t[1][2] for t in picked)
+    bottom = max(t[1][3] for t in picked)
+    img.tile = [moved_tile(t, (t[1][0] - left, t[1][1] - top, t[1][2] - left, t[1][3] - top), t[2])
+                for t in picked]
+    img._size = (right - left, bottom - top)
+    img.load()
+    return img.crop((x0 - left, y0 - top, x1 - left, y1 - top))
+
+
+def decode_level(img, reduce):
+    # The whole image at 1/reduce scale; JPEGs decode straight at a DCT scale
+    w, h = img.size
+    if img.format == "JPEG" and reduce > 1:
+        img.draft("RGB", (-(-w // reduce), -(-h // reduce)))
+    with PROFILER.span("decode"):
+        img.load()
+    # Palette and 1-bit images can't be reduced, convert them first
+    img = display_mode(img)
+    factor = reduce // max(1, round(w / img.width))
+    if factor > 1:
+        img = img.reduce(factor)
+    return img
+
+
+class TileSource:
+    # Tiles of one image for the zoomed view: tile (tx, ty) at zoom step s covers
+    # TILE_SIZE screen pixels of the upright image shown at 2**s. Formats with
+    # region loads decode just the tile. The rest are decoded whole once per
+    # scale a tile needs, and kept in a byte-bounded cache that never drops
+    # the scale in use, so panning only crops. Scales that would not fit the
+    # cache are upsampled from the largest one that does.
+    def __init__(self, path, level_bytes=512 * 1024 * 1024):
+        self.path = path
+        with Image.open(path) as img:
+            self.orientation = exif_orientation(img)
+            self.stored_size = img.size
+        w, h = self.stored_size
+        self.size = (h, w) if self.orientation >= 5 else (w, h)
+        self.lock = threading.Lock()
+        self.levels = LRUSegment(level_bytes)  # reduce factor -> whole image at that scale
+        self.regions = REGION_LOADS  # Cleared once the format turns out to need whole decodes
+
+    def tile(self, step, tx, ty):
+        w, h = self.size
+        if step >= 0:
+            span, reduce = TILE_SIZE >> step, 1
+        else:
+            span, reduce = TILE_SIZE << -step, 1 << -step
+        box = (tx * span, ty * span, min(w, (tx + 1) * span), min(h, (ty + 1) * span))
+        with PROFILER.span("tile"):
+            part = self.region(stored_box(box, self.orientation, *self.stored_size), reduce)
+            part = display_mode(apply_orientation(part, self.orientation))
+            if step > 0:
+                # Past 100% every image pixel becomes a block, for checking focus
+                part = part.resize(((box[2] - box[0]) << step, (box[3] - box[1]) << step), Image.NEAREST)
+        return part
+
+    def region(self, box, reduce):
+        if self.regions:
+            try:
+                with Image.open(self.path) as img:
+                    part = load_region(img, box)
+            except Exception:
+                part = None
+            if part is not None:
+                part = display_mode(part)
+                return part.reduce(reduce) if reduce > 1 else part
+            self.regions = False
+        # A scale too big for the cache is served from the largest one that fits
+        w, h = self.stored_size
+        level_reduce = reduce
+        while -(-w // level_reduce) * -(-h // level_reduce) * 4 > self.levels.max_bytes:
+            level_reduce *= 2
+        with self.lock:
+            entry = self.levels.entries.get(level_reduce)
+            if entry is None:
+                with Image.open(self.path) as img:
+                    level = decode_level(img, level_reduce)
+                entry = (level, level.width * level.height * len(level.getbands()))
+                self.levels.entries[level_reduce] = entry
+                self.levels.total_bytes += entry[1]
+            else:
+                self.levels.entries.move_to_end(level_reduce)
+            self.levels.evict({level_reduce})
+        x0, y0, x1, y1 = box
+        size = (-(-x1 // reduce) - x0 // reduce, -(-y1 // reduce) - y0 // reduce)
+        r = level_reduce
+        part = entry[0].crop((x0 // r, y0 // r, -(-x1 // r), -(-y1 // r)))
+        return part if r == reduce else part.resize(size, Image.BILINEAR)
+
+
+def process_pool(workers):
+    # Workers are spawned rather than forked: a fork from this threaded process
+    # copies any import lock another thread holds at that moment (Pillow imports
+    # its plugins lazily), and the worker then hangs on it forever. Spawned
+    # workers also start without the parent's profiler events.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def thumbnail_job(args):
+    # Runs in a worker process; only plain bytes travel back to the Tk process,
+    # along with the worker's profiler events when it is a separate process
+    path, size, remote = args
+    try:
+        img = decode_thumbnail(path, size)
+        encoded = encode_thumbnail(img)
+    except Exception:
+        return path, None, None, None, None, PROFILER.drain() if remote else []
+    return path, img.mode, img.size, img.tobytes(), encoded, PROFILER.drain() if remote else []
+
+
+def dhash_sample(img):
+    # 9x8 grayscale bitmap for a difference hash; JPEG thumbnails decode at 1/8 scale
+    img.draft("L", (18, 16))
+    return img.convert("L").resize((9, 8), Image.BILINEAR).tobytes()
+
+
+def load_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def dhash(samples):
+    # One 64-bit hash per sample: bit set where a pixel is brighter than its left neighbour
+    pixels = np.frombuffer(b"".join(samples), dtype=np.uint8).reshape(-1, 8, 9)
+    bits = pixels[:, :, 1:] > pixels[:, :, :-1]
+    return np.packbits(bits.reshape(-1, 64), axis=1).view(">u8").ravel().astype(np.uint64)
+
+
+def hamming(a, b):
+    x = np.ascontiguousarray(a ^ b)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x)
+    popcount = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return popcount[x.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def group_similar(hashes, threshold=10, window=8, index_threshold=3, max_run=32):
+    # Returns the group of each hash as the index of its first member.
+    # Bursts are consecutive frames, so each image is compared with the next
+    # `window` images at the full threshold. Across the rest of the folder a
+    # multi-index lookup finds pairs within `index_threshold` bits: split into
+    # four 16-bit chunks, two such hashes agree exactly on at least one chunk,
+    # so only neighbours in each chunk's sort order need comparing.
+    n = len(hashes)
+    pairs = []
+    for k in range(1, min(window, n - 1) + 1):
+        close = np.nonzero(hamming(hashes[:-k], hashes[k:]) <= threshold)[0]
+        pairs.append((close, close + k))
+    for shift in (0, 16, 32, 48):
+        chunk = (hashes >> np.uint64(shift)) & np.uint64(0xFFFF)
+        order = np.argsort(chunk, kind="stable")
+        ordered = chunk[order]
+        for k in range(1, min(max_run, n - 1) + 1):
+            same = np.nonzero(ordered[:-k] == ordered[k:])[0]
+            if not len(same):
+                break
+            a, b = order[same], order[same + k]
+            close = hamming(hashes[a], hashes[b]) <= index_threshold
+            pairs.append((a[close], b[close]))
+
+    # Union-find; the root of every set is its smallest index
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for left, right in pairs:
+        for a, b in zip(left.tolist(), right.tolist()):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+    return [find(i) for i in range(n)]
+
+
+def score_sample(img):
+    # Luminance histogram of the whole thumbnail and its centre as a
+    # SCORE_SIZE square at thumbnail resolution, scaled up only when smaller
+    gray = img.convert("L")
+    w, h = gray.size
+    if min(w, h) >= SCORE_SIZE:
+        left, top = (w - SCORE_SIZE) // 2, (h - SCORE_SIZE) // 2
+        patch = gray.crop((left, top, left + SCORE_SIZE, top + SCORE_SIZE))
+    else:
+        side = min(w, h)
+        box = ((w - side) // 2, (h - side) // 2, (w + side) // 2, (h + side) // 2)
+        patch = gray.resize((SCORE_SIZE, SCORE_SIZE), Image.BILINEAR, box=box)
+    return patch.tobytes(), gray.histogram()
+
+
+def quality_scores(patches, hists):
+    # One row per image: (score, sharpness, brightness, clipped, noise).
+    # Sharpness is the variance of the Laplacian, brightness and the share of
+    # clipped pixels come from the histogram, and noise is Immerkaer's
+    # estimate: the mean response to a kernel that cancels edges and
+    # gradients. The 0-100 score is how sharp, well exposed and clean it is.
+    x = patches.astype(np.float32)
+    centre = x[:, 1:-1, 1:-1]
+    cross = x[:, :-2, 1:-1] + x[:, 2:, 1:-1] + x[:, 1:-1, :-2] + x[:, 1:-1, 2:]
+    diagonal = x[:, :-2, :-2] + x[:, :-2, 2:] + x[:, 2:, :-2] + x[:, 2:, 2:]
+    sharpness = (cross - 4 * centre).var(axis=(1, 2))
+    noise = np.abs(diagonal - 2 * cross + 4 * centre).mean(axis=(1, 2)) * (math.sqrt(math.pi / 2) / 6)
+    total = hists.sum(axis=1)
+    brightness = hists @ np.arange(256, dtype=np.float32) / total
+    clipped = (hists[:, :3].sum(axis=1) + hists[:, -3:].sum(axis=1)) / total
+    sharp = np.clip(np.log10(1 + sharpness) / 2.5, 0, 1)
+    exposure = np.clip(1.25 - np.abs(brightness - 118) / 80, 0, 1) * np.clip(1 - 3 * clipped, 0, 1)
+    clean = np.clip(1.2 - noise / 15, 0.5, 1)
+    return np.stack([100 * sharp * exposure * clean, sharpness, brightness, clipped, noise], axis=1)
+
+
+def score_job(items):
+    # Runs in a worker process over a batch of (path, stored master thumbnail
+    # or None). Thumbnails that had to be decoded here are sent back to be
+    # stored. Returns ([(path, quality_scores row)], [(path, encoded thumbnail)]).
+    if load_numpy() is None:
+        return [], []
+    scored = []
+    patches = []
+    hists = []
+    thumbs = []
+    for path, data in items:
+        try:
+            if data is None:
+                img = decode_thumbnail(path, MASTER_THUMB_SIZE)
+                thumbs.append((path, encode_thumbnail(img)))
+            else:
+                img = Image.open(io.BytesIO(data))
+            patch, hist = score_sample(img)
+        except Exception:
+            continue
+        scored.append(path)
+        patches.append(patch)
+        hists.append(hist)
+    if not scored:
+        return [], thumbs
+    pixels = np.frombuffer(b"".join(patches), dtype=np.uint8).reshape(-1, SCORE_SIZE, SCORE_SIZE)
+    values = quality_scores(pixels, np.array(hists, dtype=np.float32))
+    return list(zip(scored, values.tolist())), thumbs
+
+
+class ThumbnailStore:
+    # Persistent thumbnail cache shared by all folders. Entries are keyed on
+    # (path, size) and validated against the file's mtime and byte size, so an
+    # edited or replaced file is re-thumbnailed instead of served stale.
+    def __init__(self, db_path, max_bytes=512 * 1024 * 1024, commit_every=64):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS thumbs ("
+            "path TEXT NOT NULL, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, file_size INTEGER NOT NULL, "
+            "data BLOB NOT NULL, nbytes INTEGER NOT NULL, atime REAL NOT NULL, "
+            "PRIMARY KEY (path, size))"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS thumbs_atime ON thumbs (atime)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+            "file_size INTEGER NOT NULL, hash INTEGER NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, file_size INTEGER NOT NULL, "
+            "score REAL NOT NULL, sharpness REAL NOT NULL, brightness REAL NOT NULL, "
+            "clipped REAL NOT NULL, noise REAL NOT NULL)"
+        )
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < THUMB_FORMAT:
+            self.conn.execute("DELETE FROM thumbs")
+            self.conn.execute("DELETE FROM hashes")
+            self.conn.execute("DELETE FROM scores")
+            self.conn.execute(f"PRAGMA user_version = {THUMB_FORMAT}")
+        self.conn.commit()
+        # Kept up to date by every write, so eviction needs no table scan
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM thumbs").fetchone()[0]
+
+    @profiled("store_read")
+    def get(self, path, size):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT mtime_ns, file_size, data FROM thumbs WHERE path = ? AND size = ?",
+                (path, size),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] != st.st_mtime_ns or row[1] != st.st_size:
+                self.conn.execute("DELETE FROM thumbs WHERE path = ? AND size = ?", (path, size))
+                self.total_bytes -= len(row[2])
+                self._touch()
+                return None
+            self.conn.execute(
+                "UPDATE thumbs SET atime = ? WHERE path = ? AND size = ?",
+                (time.time(), path, size),
+            )
+            self._touch()
+            return row[2]
+
+    def has(self, path, size):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT mtime_ns, file_size FROM thumbs WHERE path = ? AND size = ?",
+                (path, size),
+            ).fetchone()
+        return row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size
+
+    def put(self, path, size, data):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        with self.lock:
+            old = self.conn.execute(
+                "SELECT nbytes FROM thumbs WHERE path = ? AND size = ?", (path, size)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO thumbs "
+                "(path, size, mtime_ns, file_size, data, nbytes, atime) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, size, st.st_mtime_ns, st.st_size, sqlite3.Binary(data), len(data), time.time()),
+            )
+            self.total_bytes += len(data) - (old[0] if old else 0)
+            self._touch()
+
+    def get_hashes(self, paths):
+        # Perceptual hashes (signed 64-bit) of the paths whose file is unchanged
+        return {path: values[0] for path, values in self._get_unchanged("hashes", ("hash",), paths).items()}
+
+    def put_hashes(self, items):
+        self._put_current("hashes", ("hash",), ((path, (value,)) for path, value in items))
+
+    def get_scores(self, paths):
+        # quality_scores rows of the paths whose file is unchanged
+        return self._get_unchanged("scores", SCORE_FIELDS, paths)
+
+    def put_scores(self, items):
+        self._put_current("scores", SCORE_FIELDS, items)
+
+    def _get_unchanged(self, table, columns, paths):
+        rows = []
+        with self.lock:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                rows.extend(self.conn.execute(
+                    f"SELECT path, mtime_ns, file_size, {', '.join(columns)} FROM {table} "
+                    f"WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ))
+        found = {}
+        for path, mtime_ns, file_size, *values in rows:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if st.st_mtime_ns == mtime_ns and st.st_size == file_size:
+                found[path] = tuple(values)
+        return found
+
+    def _put_current(self, table, columns, items):
+        # Rows are tagged with the file's current mtime and size
+        rows = []
+        for path, values in items:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rows.append((path, st.st_mtime_ns, st.st_size, *values))
+        with self.lock:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (path, mtime_ns, file_size, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * (len(columns) + 3))})",
+                rows,
+            )
+            self.conn.commit()
+            self.pending = 0
+
+    def discard(self, paths):
+        rows = [(path,) for path in paths]
+        with self.lock:
+            self._delete_thumbs(rows)
+            self.conn.executemany("DELETE FROM hashes WHERE path = ?", rows)
+            self.conn.executemany("DELETE FROM scores WHERE path = ?", rows)
+            self.conn.commit()
+            self.pending = 0
+
+    def _delete_thumbs(self, rows):
+        # Callers hold the lock
+        for row in rows:
+            self.total_bytes -= self.conn.execute(
+                "SELECT COALESCE(SUM(nbytes), 0) FROM thumbs WHERE path = ?", row
+            ).fetchone()[0]
+        self.conn.executemany("DELETE FROM thumbs WHERE path = ?", rows)
+
+    def _touch(self):
+        # Group writes into one transaction instead of committing per thumbnail
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.conn.commit()
+            self.pending = 0
+
+    def flush(self):
+        with self.lock:
+            self.conn.commit()
+            self.pending = 0
+        self.evict()
+
+    def evict(self):
+        with self.lock:
+            if self.total_bytes <= self.max_bytes:
+                return
+            # Drop least recently used entries until we are back under 80% of the cap
+            excess = self.total_bytes - int(self.max_bytes * 0.8)
+            victims = []
+            for rowid, nbytes in self.conn.execute("SELECT rowid, nbytes FROM thumbs ORDER BY atime"):
+                victims.append((rowid,))
+                self.total_bytes -= nbytes
+                excess -= nbytes
+                if excess <= 0:
+                    break
+            self.conn.executemany("DELETE FROM thumbs WHERE rowid = ?", victims)
+            self.conn.commit()
+
+    def prune_missing(self, folder):
+        # Drops the entries of files under `folder` that no longer exist; the
+        # primary keys make the prefix range an index scan
+        prefix = os.path.join(folder, "")
+        bounds = (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        with self.lock:
+            paths = set()
+            for table in ("thumbs", "hashes", "scores"):
+                paths.update(row[0] for row in self.conn.execute(
+                    f"SELECT DISTINCT path FROM {table} WHERE path >= ? AND path < ?", bounds))
+        missing = [path for path in paths if not os.path.exists(path)]
+        if missing:
+            self.discard(missing)
+        return len(missing)
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.conn.close()
+
+
+def file_fingerprint(path, st=None):
+    # Size plus a hash of the first 64 KiB (JPEG headers carry EXIF timestamps),
+    # enough to recognise a renamed file without reading all of it.
+    try:
+        if st is None:
+            st = os.stat(path)
+        with open(path, "rb") as f:
+            head = f.read(65536)
+    except OSError:
+        return ""
+    return f"{st.st_size}:{hashlib.blake2b(head, digest_size=8).hexdigest()}"
+
+
+class RatingStore:
+    # Append-only journal of ratings for one folder, one line per change:
+    # "<path relative to the folder>\t<stars>\t<fingerprint>", stars 0 = unrated,
+    # and a lone "X" for "clear all". A writer thread groups pending changes
+    # into one write + fsync so rating never waits on the disk.
+    def __init__(self, journal_path, folder, group_delay=0.2):
+        self.journal_path = journal_path
+        self.folder = folder
+        self.prefix = os.path.join(folder, "")
+        self.group_delay = group_delay
+        self.records = {}  # relative path -> "<stars>\t<fingerprint>", parsed lazily
+        self.lines = 0
+        self.compaction_pending = False
+        self.queue = queue.Queue()
+        self.load()
+        self.file = open(journal_path, "a", encoding="utf-8", newline="\n")
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def load(self):
+        try:
+            with open(self.journal_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return
+        end = raw.rfind(b"\n") + 1
+        if end < len(raw):
+            # A crash tore the last line; cut it off so the next append starts clean
+            raw = raw[:end]
+            try:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(end)
+            except OSError:
+                pass
+        data = raw.decode("utf-8", "replace")
+        self.lines = data.count("\n")
+        # Everything before the last "clear all" marker is dead
+        cut = data.rfind("\nX\n")
+        if cut != -1:
+            data = data[cut + 3:]
+        elif data.startswith("X\n"):
+            data = data[2:]
+        lines = data.split("\n")
+        lines.pop()
+        try:
+            # Later lines overwrite earlier ones; this keeps a million-line journal
+            # to a single pass at C speed
+            self.records = dict(line.split("\t", 1) for line in lines)
+        except ValueError:
+            self.records = dict(line.split("\t", 1) for line in lines if "\t" in line)
+
+    def relpath(self, path):
+        return path[len(self.prefix):] if path.startswith(self.prefix) else path
+
+    def abspath(self, rel):
+        return os.path.join(self.folder, rel)
+
+    def saved_stars(self, path):
+        value = self.records.get(self.relpath(path))
+        return int(value[0]) if value and value[0].isdigit() else 0
+
+    def orphans(self, present):
+        # fingerprint -> (stars, absolute path) for rated paths not in `present`
+        result = {}
+        for rel, value in list(self.records.items()):
+            stars, _, fingerprint = value.partition("\t")
+            if stars not in ("", "0") and fingerprint and rel not in present:
+                result[fingerprint] = (int(stars), self.abspath(rel))
+        return result
+
+    def record(self, path, stars):
+        self.queue.put(("rate", path, stars))
+
+    def record_clear(self):
+        self.queue.put(("clear",))
+
+    def needs_compaction(self):
+        return not self.compaction_pending and self.lines > 2 * len(self.records) + 1024
+
+    def compact(self):
+        self.compaction_pending = True
+        self.queue.put(("compact",))
+
+    def close(self):
+        self.queue.put(("close",))
+        self.thread.join(timeout=5)
+
+    def run(self):
+        while True:
+            items = [self.queue.get()]
+            time.sleep(self.group_delay)
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            closing = False
+            out = []
+            for item in items:
+                if item[0] == "rate":
+                    _, path, stars = item
+                    rel = self.relpath(path)
+                    value = f"{stars}\t{file_fingerprint(path) if stars else ''}"
+                    self.records[rel] = value
+                    out.append(f"{rel}\t{value}\n")
+                elif item[0] == "clear":
+                    self.records.clear()
+                    out.append("X\n")
+                elif item[0] == "compact":
+                    self.write_out(out)
+                    out = []
+                    self.rewrite()
+                elif item[0] == "close":
+                    closing = True
+            self.write_out(out)
+            if closing:
+                self.file.close()
+                return
+
+    def write_out(self, lines):
+        if not lines:
+            return
+        try:
+            self.file.write("".join(lines))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        except OSError:
+            return
+        self.lines += len(lines)
+
+    def rewrite(self):
+        self.records = {rel: value for rel, value in self.records.items() if not value.startswith("0")}
+        tmp_path = self.journal_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+                f.write("".join(f"{rel}\t{value}\n" for rel, value in self.records.items()))
+                f.flush()
+                os.fsync(f.fileno())
+            self.file.close()
+            os.replace(tmp_path, self.journal_path)
+            self.lines = len(self.records)
+        except OSError:
+            pass
+        finally:
+            if self.file.closed:
+                self.file = open(self.journal_path, "a", encoding="utf-8", newline="\n")
+            self.compaction_pending = False
+
+
+def folder_cache_path(folder, kind, suffix):
+    # Per-folder state lives in the cache directory under a hash of the folder path
+    key = os.path.normcase(os.path.abspath(folder))
+    kind_dir = os.path.join(get_cache_dir(), kind)
+    os.makedirs(kind_dir, exist_ok=True)
+    return os.path.join(kind_dir, hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + suffix)
+
+
+def rating_journal_path(folder):
+    return folder_cache_path(folder, "ratings", ".journal")
+
+
+class FolderSnapshot:
+    # What an imported folder looked like at the last scan: the image files of
+    # each directory as path -> (size, mtime_ns, inode), and each directory's
+    # mtime. A rescan re-lists directories and reports only the difference.
+    # Adding, removing or renaming a file changes its directory's mtime, so
+    # watching for new files only has to stat the directories.
+    def __init__(self, snapshot_path, folder, recursive):
+        self.snapshot_path = snapshot_path
+        self.folder = folder
+        self.prefix = os.path.join(folder, "")
+        self.recursive = recursive
+        self.files = {}  # directory -> {path: (size, mtime_ns, inode)}
+        self.dirs = {}  # directory -> mtime_ns
+        self.load()
+
+    def load(self):
+        # "D\t<relative dir>\t<mtime_ns>" starts a directory, followed by one
+        # "F\t<name>\t<size>\t<mtime_ns>\t<inode>" line per image in it
+        try:
+            f = open(self.snapshot_path, "r", encoding="utf-8", newline="\n")
+        except OSError:
+            return
+        with f:
+            if f.readline() != f"{int(self.recursive)}\n":
+                return  # Taken with the other recursion setting
+            files = None
+            current = None
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                try:
+                    if fields[0] == "D":
+                        current = os.path.join(self.folder, fields[1]) if fields[1] else self.folder
+                        self.dirs[current] = int(fields[2])
+                        files = self.files[current] = {}
+                    elif files is not None:
+                        files[os.path.join(current, fields[1])] = (int(fields[2]), int(fields[3]), int(fields[4]))
+                except (IndexError, ValueError):
+                    continue
+
+    def save(self):
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(f"{int(self.recursive)}\n")
+            for current, files in self.files.items():
+                rel = "" if current == self.folder else current[len(self.prefix):]
+                f.write(f"D\t{rel}\t{self.dirs.get(current, 0)}\n")
+                for path, (size, mtime_ns, inode) in files.items():
+                    f.write(f"F\t{os.path.basename(path)}\t{size}\t{mtime_ns}\t{inode}\n")
+        os.replace(tmp_path, self.snapshot_path)
+
+    def signature(self, path):
+        return self.files.get(os.path.dirname(path), {}).get(path)
+
+    def changed_dirs(self):
+        changed = []
+        for current, mtime_ns in list(self.dirs.items()):
+            try:
+                if os.stat(current).st_mtime_ns == mtime_ns:
+                    continue
+            except OSError:
+                pass
+            changed.append(current)
+        return changed
+
+    def scan(self, dirs, extensions, full=True, batch_size=500):
+        # Re-lists `dirs`, updates the snapshot and yields sorted batches of
+        # (paths, added, changed, removed) per directory, where paths is every
+        # image listed and removed maps each vanished path to its old signature.
+        # Subdirectories are walked when `full`, otherwise only new ones are.
+        children = {}
+        for current in self.dirs:
+            children.setdefault(os.path.dirname(current), []).append(current)
+        stack = sorted(dirs, reverse=True)
+        while stack:
+            current = stack.pop()
+            old = self.files.pop(current, {})
+            try:
+                mtime_ns = os.stat(current).st_mtime_ns
+                files, subdirs = list_directory(current, extensions)
+            except OSError:
+                files = None
+            if files is None:
+                # The directory is gone along with everything below it
+                self.dirs.pop(current, None)
+                stack.extend(children.get(current, ()))
+                if old:
+                    yield [], [], [], old
+                continue
+
+            self.dirs[current] = mtime_ns
+            listed = self.files[current] = dict(files)
+            removed = {path: sig for path, sig in old.items() if path not in listed}
+            for i in range(0, len(files), batch_size):
+                batch = files[i:i + batch_size]
+                added = [path for path, sig in batch if path not in old]
+                changed = [path for path, sig in batch if path in old and old[path] != sig]
+                last = i + batch_size >= len(files)
+                yield [path for path, sig in batch], added, changed, removed if last else {}
+            if not files and removed:
+                yield [], [], [], removed
+
+            if self.recursive:
+                listed_dirs = set(subdirs)
+                walk = [d for d in subdirs if full or d not in self.dirs]
+                gone = [d for d in children.get(current, ()) if d not in listed_dirs]
+                stack.extend(sorted(walk + gone, reverse=True))
+
+
+def folder_snapshot_path(folder):
+    return folder_cache_path(folder, "snapshots", ".tsv")
+
+
+def session_path():
+    return os.path.join(get_cache_dir(), "session.json")
+
+
+def session_view_path():
+    # PPM, which Tk reads natively and without inflating anything
+    return os.path.join(get_cache_dir(), "session.ppm")
+
+
+def load_session():
+    try:
+        with open(session_path(), "r", encoding="utf-8") as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return session if isinstance(session, dict) and session.get("folder") else None
+
+
+class ThumbAtlas:
+    # Per-folder sprite sheet of raw RGB thumbnails in fixed-size cells, read
+    # through mmap: a page of thumbnails is sliced out of the mapping with no
+    # decoding or per-file opens, and the OS page cache rather than the Python
+    # heap holds whatever has been scrolled through. The index is a log of
+    # "<cell>\t<width>\t<height>\t<path>" lines, "-\t<path>" frees a cell,
+    # after a "#<THUMB_FORMAT>" header.
+    def __init__(self, atlas_path, cell=ATLAS_CELL):
+        self.atlas_path = atlas_path
+        self.index_path = atlas_path + ".index"
+        self.cell = cell
+        self.cell_bytes = cell * cell * 3
+        self.lock = threading.Lock()
+        self.entries = {}  # path -> (cell, width, height)
+        self.free = []
+        self.released = []  # freed cells whose "-" line is not flushed yet
+        self.cells = 0
+        self.lines = 0
+        self.map = None
+        self.load()
+        self.file = os.fdopen(os.open(atlas_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)), "r+b")
+        if not self.lines:
+            # New or outdated atlas: start over
+            self.file.truncate(0)
+            self.cells = 0
+            self.free = []
+            self.released = []
+            self.rewrite_index()
+        self.index = open(self.index_path, "a", encoding="utf-8", newline="\n")
+
+    def load(self):
+        try:
+            f = open(self.index_path, "r", encoding="utf-8", newline="\n")
+        except OSError:
+            return
+        with f:
+            if f.readline() != f"#{THUMB_FORMAT}\n":
+                return
+            self.lines = 1
+            for line in f:
+                self.lines += 1
+                fields = line.rstrip("\n").split("\t", 3)
+                if len(fields) == 2 and fields[0] == "-":
+                    self.entries.pop(fields[1], None)
+                elif len(fields) == 4:
+                    try:
+                        self.entries[fields[3]] = (int(fields[0]), int(fields[1]), int(fields[2]))
+                    except ValueError:
+                        continue
+        try:
+            self.cells = os.path.getsize(self.atlas_path) // self.cell_bytes
+        except OSError:
+            self.cells = 0
+        # Cells past the end were indexed but never written
+        self.entries = {path: entry for path, entry in self.entries.items() if entry[0] < self.cells}
+        used = {entry[0] for entry in self.entries.values()}
+        self.free = [cell for cell in range(self.cells) if cell not in used]
+        if self.lines > 2 * len(self.entries) + 1000:
+            self.rewrite_index()
+
+    def rewrite_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(f"#{THUMB_FORMAT}\n")
+            for path, (cell, w, h) in self.entries.items():
+                f.write(f"{cell}\t{w}\t{h}\t{path}\n")
+        os.replace(tmp_path, self.index_path)
+        self.lines = len(self.entries) + 1
+
+    def __contains__(self, path):
+        return path in self.entries
+
+    def get(self, path):
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        cell, w, h = entry
+        offset = cell * self.cell_bytes
+        with self.lock:
+            if self.map is None or offset + self.cell_bytes > len(self.map):
+                # The atlas grew since it was mapped
+                size = os.fstat(self.file.fileno()).st_size
+                if offset + self.cell_bytes > size:
+                    return None
+                if self.map is not None:
+                    self.map.close()
+                self.map = mmap.mmap(self.file.fileno(), size, access=mmap.ACCESS_READ)
+            data = self.map[offset:offset + w * h * 3]
+        return Image.frombuffer("RGB", (w, h), data, "raw", "RGB", 0, 1)
+
+    def put(self, path, img):
+        if path in self.entries or img.mode != "RGB":
+            return  # Transparent thumbnails are served from the masters
+        img = derive_thumbnail(img, self.cell)
+        data = img.tobytes()
+        with self.lock:
+            if path in self.entries:
+                return  # Put by another thread meanwhile
+            if self.free:
+                cell = self.free.pop()
+            else:
+                cell = self.cells
+                self.cells += 1
+            self.file.seek(cell * self.cell_bytes)
+            self.file.write(data.ljust(self.cell_bytes, b"\0"))
+            self.file.flush()
+            self.entries[path] = (cell, img.width, img.height)
+            self.index.write(f"{cell}\t{img.width}\t{img.height}\t{path}\n")
+            self.lines += 1
+
+    def discard(self, paths):
+        with self.lock:
+            for path in paths:
+                entry = self.entries.pop(path, None)
+                if entry is not None:
+                    self.released.append(entry[0])
+                    self.index.write(f"-\t{path}\n")
+                    self.lines += 1
+
+    def flush(self):
+        with self.lock:
+            self.index.flush()
+            # Only reuse a cell once the index no longer points the old path at
+            # it, or a crash could show another image's pixels for that path
+            self.free.extend(self.released)
+            self.released.clear()
+
+    def close(self):
+        with self.lock:
+            self.index.close()
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+            self.file.close()
+
+
+def thumb_atlas_path(folder):
+    return folder_cache_path(folder, "atlas", ".rgb")
+
+
+FILTER_COLUMNS = ("width", "height", "size", "mtime", "captured", "orientation", "score")
+# Saved with the folder's metadata; quality scores are kept in the ThumbnailStore
+INDEX_COLUMNS = ("width", "height", "size", "mtime", "captured", "orientation", "camera", "mtime_ns")
+FILTER_ALIASES = {"w": "width", "h": "height", "date": "mtime", "taken": "captured"}
+DATE_COLUMNS = ("mtime", "captured")
+SIZE_UNITS = {"kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3}
+
+
+def parse_filter_query(text):
+    # "img_2 width>=4000 size>2mb date>=2024-01-31 camera=canon" ->
+    # (["img_2"], [("width", 4000, None), ...], ["canon"])
+    # Plain words must all appear in the filename; columns take >=, <=, >, < or =
+    # and camera= matches part of the camera make and model.
+    terms = []
+    ranges = []
+    cameras = []
+    for token in text.lower().split():
+        if token.startswith("camera="):
+            cameras.append(token[len("camera="):])
+            continue
+        for op in (">=", "<=", ">", "<", "="):
+            column, sep, value = token.partition(op)
+            if sep and FILTER_ALIASES.get(column, column) in FILTER_COLUMNS:
+                break
+        else:
+            terms.append(token)
+            continue
+        column = FILTER_ALIASES.get(column, column)
+        try:
+            if column in DATE_COLUMNS:
+                day = datetime.strptime(value, "%Y-%m-%d")
+                low = int(day.timestamp())
+                high = int((day + timedelta(days=1)).timestamp()) - 1
+            else:
+                unit = SIZE_UNITS.get(value[-2:], 1)
+                number = float(value[:-2] if unit > 1 else value) * unit
+                low = high = int(number)
+        except ValueError:
+            raise ValueError(f"Bad value in '{token}'")
+        if op == ">=":
+            ranges.append((column, low, None))
+        elif op == ">":
+            ranges.append((column, high + 1, None))
+        elif op == "<=":
+            ranges.append((column, None, high))
+        elif op == "<":
+            ranges.append((column, None, low - 1))
+        else:
+            ranges.append((column, low, high))
+    return terms, ranges, cameras
+
+
+def split_path(path):
+    # (directory with its trailing separator, basename); concatenating the two
+    # gives back exactly the same string
+    cut = path.rfind(os.sep)
+    if os.altsep:
+        cut = max(cut, path.rfind(os.altsep))
+    return path[:cut + 1], path[cut + 1:]
+
+
+class ImageRecord:
+    # Read-only view of one image of an ImageCollection
+    __slots__ = ("images", "id")
+
+    def __init__(self, images, image_id):
+        self.images = images
+        self.id = image_id
+
+    @property
+    def path(self):
+        return self.images.path_of(self.id)
+
+    @property
+    def name(self):
+        return self.images.name_of(self.id)
+
+    @property
+    def folder(self):
+        return self.images.dirs[self.images.dir_of[self.id]]
+
+    @property
+    def rating(self):
+        return self.images.ratings[self.id]
+
+
+class ImageCollection:
+    # Compact model of the open images, sized for folders of a million files.
+    # Every path gets a stable id the first time it is seen. It is stored as an
+    # interned directory plus its UTF-8 basename in one shared buffer, and
+    # found through an open-addressing table of ids keyed by the hash of the
+    # path, so an image costs about 50 bytes instead of a string, a list slot
+    # and dict entries. `order` holds the ids in display order and `position`
+    # maps an id back into it (-1 when not shown), so a collection indexes and
+    # iterates like the list of paths it replaces. A removed path keeps its id
+    # and table slot, so a file that comes back gets its old id again.
+    __slots__ = ("dirs", "dir_ids", "dir_of", "names", "name_offsets", "hashes", "table", "used",
+                 "order", "position", "ratings", "rated", "buckets")
+
+    def __init__(self):
+        self.dirs = []  # directories, each with its trailing separator
+        self.dir_ids = {}  # directory -> index in dirs
+        self.dir_of = array("I")  # directory index per id
+        self.names = bytearray()  # basenames of all ids, back to back
+        self.name_offsets = array("I", [0])  # id -> start of its name, plus the end
+        self.hashes = array("q")  # hash of the path per id
+        self.table = array("i", [-1]) * 1024  # slot -> id, -1 empty
+        self.used = 0  # slots that are not empty
+        self.order = array("I")  # ids in display order
+        self.position = array("i")  # id -> index in order
+        self.ratings = array("b")  # stars per id, 0 when unrated
+        self.rated = {}  # rated ids in the order they were first rated
+        self.buckets = {star: {} for star in range(1, 6)}  # star -> ids in rating order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        return self.path_of(self.order[index])
+
+    def __iter__(self):
+        for i in self.order:
+            yield self.path_of(i)
+
+    def __contains__(self, path):
+        return self.index(path) is not None
+
+    def name_of(self, i):
+        return self.names[self.name_offsets[i]:self.name_offsets[i + 1]].decode("utf-8", "surrogatepass")
+
+    def path_of(self, i):
+        return self.dirs[self.dir_of[i]] + self.name_of(i)
+
+    def record(self, index):
+        return ImageRecord(self, self.order[index])
+
+    def probe(self, path, h):
+        # (id of the path or -1, slot where the search stopped)
+        table = self.table
+        mask = len(table) - 1
+        slot = h & mask
+        while True:
+            i = table[slot]
+            if i == -1 or (self.hashes[i] == h and self.path_of(i) == path):
+                return i, slot
+            slot = (slot + 1) & mask
+
+    def id_of(self, path):
+        i = self.probe(path, hash(path))[0]
+        return i if i >= 0 else None
+
+    def index(self, path):
+        # Display position of the path, None when it is not shown
+        i = self.id_of(path)
+        if i is None or self.position[i] < 0:
+            return None
+        return self.position[i]
+
+    def add(self, path):
+        h = hash(path)
+        i, slot = self.probe(path, h)
+        if i >= 0:
+            return i
+        folder, name = split_path(path)
+        d = self.dir_ids.get(folder)
+        if d is None:
+            d = self.dir_ids[folder] = len(self.dirs)
+            self.dirs.append(folder)
+        i = len(self.dir_of)
+        self.dir_of.append(d)
+        self.names += name.encode("utf-8", "surrogatepass")
+        self.name_offsets.append(len(self.names))
+        self.hashes.append(h)
+        self.position.append(-1)
+        self.ratings.append(0)
+        self.table[slot] = i
+        self.used += 1
+        if self.used * 2 > len(self.table):
+            self.rehash()
+        return i
+
+    def rehash(self):
+        # Keeps the table at most half full
+        live = [i for i in self.table if i >= 0]
+        size = len(self.table)
+        while len(live) * 4 > size:
+            size *= 2
+        table = array("i", [-1]) * size
+        mask = size - 1
+        hashes = self.hashes
+        for i in live:
+            slot = hashes[i] & mask
+            while table[slot] != -1:
+                slot = (slot + 1) & mask
+            table[slot] = i
+        self.table = table
+        self.used = len(live)
+
+    def extend(self, paths):
+        # Appends the paths not shown yet; returns their display positions
+        start = len(self.order)
+        for path in paths:
+            i = self.add(path)
+            if self.position[i] < 0:
+                self.position[i] = len(self.order)
+                self.order.append(i)
+        return range(start, len(self.order))
+
+    def set_order(self, ids):
+        for i in self.order:
+            self.position[i] = -1
+        self.order = array("I", ids)
+        for pos, i in enumerate(self.order):
+            self.position[i] = pos
+
+    def remove(self, paths):
+        # Only leaves the display order; the id stays for when the path returns
+        gone = set()
+        for path in paths:
+            i = self.id_of(path)
+            if i is not None:
+                self.remove_rating(path)
+                gone.add(i)
+        if gone:
+            self.set_order([i for i in self.order if i not in gone])
+
+    def rating(self, path):
+        i = self.id_of(path)
+        return 0 if i is None else self.ratings[i]
+
+    def set_rating(self, path, stars):
+        i = self.add(path)
+        old = self.ratings[i]
+        if old:
+            del self.buckets[old][i]
+        else:
+            self.rated[i] = None
+        self.ratings[i] = stars
+        self.buckets[stars][i] = None
+
+    def remove_rating(self, path):
+        # Returns the stars the path had, 0 when it was not rated
+        i = self.id_of(path)
+        old = self.ratings[i] if i is not None else 0
+        if old:
+            self.ratings[i] = 0
+            del self.rated[i]
+            del self.buckets[old][i]
+        return old
+
+    def clear_ratings(self):
+        for i in self.rated:
+            self.ratings[i] = 0
+        self.rated.clear()
+        for bucket in self.buckets.values():
+            bucket.clear()
+
+    def rated_ids(self, stars=None):
+        # Rated ids in rating order, optionally only those with one of `stars`
+        if stars is None:
+            return self.rated
+        if len(stars) == 1:
+            return self.buckets[next(iter(stars))]
+        return [i for i in self.rated if self.ratings[i] in stars]
+
+
+class FilterIndex:
+    # Columnar index over every imported image, used by the filter query and
+    # for sorting: trigram posting lists over the lowercased filenames for
+    # substring search, and one array per metadata column with a sorted copy
+    # built on demand for range lookups and sorting. Images are numbered by
+    # their id in the ImageCollection; -1 is a value not read yet, which no
+    # range matches. Cameras are stored as ids into a list of names.
+    def __init__(self, images):
+        self.images = images
+        self.names = []  # lowercased filename per id
+        self.trigrams = {}  # trigram -> array of ids, ascending
+        self.columns = {column: array("q") for column in INDEX_COLUMNS + ("score",)}
+        self.cameras = []
+        self.camera_ids = {}  # camera name -> index in cameras
+        self.sorted = {}  # column -> (sorted values, ids in the same order)
+
+    def sync(self):
+        # Indexes the images added to the collection since the last call
+        count = len(self.images.dir_of)
+        if len(self.names) == count:
+            return
+        for i in range(len(self.names), count):
+            name = self.images.name_of(i).lower()
+            self.names.append(name)
+            for gram in {name[j:j + 3] for j in range(len(name) - 2)}:
+                postings = self.trigrams.get(gram)
+                if postings is None:
+                    postings = self.trigrams[gram] = array("I")
+                postings.append(i)
+            for values in self.columns.values():
+                values.append(-1)
+        self.sorted.clear()
+
+    def set_metadata(self, path, values, camera):
+        i = self.images.id_of(path)
+        if i is None or i >= len(self.names):
+            return
+        if camera:
+            values = dict(values, camera=self.camera_ids.setdefault(camera, len(self.cameras)))
+            if values["camera"] == len(self.cameras):
+                self.cameras.append(camera)
+        for column, value in values.items():
+            self.columns[column][i] = value
+            self.sorted.pop(column, None)
+
+    def sorted_column(self, column):
+        entry = self.sorted.get(column)
+        if entry is None:
+            values = self.columns[column]
+            if column == "camera":
+                # Camera ids are in order of discovery, sort them by name
+                rank = {camera_id: r for r, camera_id in enumerate(sorted(range(len(self.cameras)), key=self.cameras.__getitem__))}
+                keys = [rank.get(value, -1) for value in values]
+            else:
+                keys = values
+            ids = sorted(range(len(values)), key=keys.__getitem__)
+            entry = self.sorted[column] = ([keys[i] for i in ids], ids)
+        return entry
+
+    def sort_ids(self, ids, column):
+        # `ids` in ascending order of the column, unknown values first
+        present = set(ids)
+        return [i for i in self.sorted_column(column)[1] if i in present]
+
+    def name_matches(self, text):
+        grams = {text[j:j + 3] for j in range(len(text) - 2)}
+        if not grams:
+            return {i for i, name in enumerate(self.names) if text in name}
+        # Every trigram of the text has to be in the name; confirm the rest by substring
+        postings = sorted((self.trigrams.get(gram, ()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(other)
+        return {i for i in candidates if text in self.names[i]}
+
+    def range_matches(self, column, low, high):
+        values, ids = self.sorted_column(column)
+        start = bisect.bisect_left(values, max(0, low) if low is not None else 0)
+        end = bisect.bisect_right(values, high) if high is not None else len(values)
+        return set(ids[start:end])
+
+    def camera_matches(self, text):
+        wanted = {i for i, camera in enumerate(self.cameras) if text in camera.lower()}
+        return {i for i, value in enumerate(self.columns["camera"]) if value in wanted}
+
+    def query(self, terms, ranges, cameras):
+        # Ids matching every criterion, intersecting the smallest sets first
+        sets = [self.name_matches(term) for term in terms]
+        sets += [self.range_matches(*criterion) for criterion in ranges]
+        sets += [self.camera_matches(camera) for camera in cameras]
+        sets.sort(key=len)
+        result = sets[0]
+        for other in sets[1:]:
+            result = result & other
+        return result
+
+    def matches(self, path, terms, ranges, cameras):
+        i = self.images.id_of(path)
+        if i is None or i >= len(self.names):
+            return False
+        name = self.names[i]
+        if any(term not in name for term in terms):
+            return False
+        for column, low, high in ranges:
+            value = self.columns[column][i]
+            if value < 0 or (low is not None and value < low) or (high is not None and value > high):
+                return False
+        if cameras:
+            value = self.columns["camera"][i]
+            camera = self.cameras[value].lower() if value >= 0 else ""
+            if any(text not in camera for text in cameras):
+                return False
+        return True
+
+    def save(self, index_path, ids):
+        # Columnar file: a JSON header line, the paths joined by newlines, then
+        # each column as raw 64-bit integers in the header's order
+        mtimes = self.columns["mtime_ns"]
+        rows = [i for i in ids if mtimes[i] >= 0]
+        data = "\n".join(self.images.path_of(i) for i in rows).encode("utf-8")
+        header = {"version": 1, "count": len(rows), "columns": list(INDEX_COLUMNS),
+                  "cameras": self.cameras, "paths_bytes": len(data)}
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(data)
+            for column in INDEX_COLUMNS:
+                values = self.columns[column]
+                array("q", [values[i] for i in rows]).tofile(f)
+        os.replace(tmp_path, index_path)
+
+
+def load_metadata_index(index_path):
+    # path -> (values, camera) from a file written by FilterIndex.save
+    try:
+        with open(index_path, "rb") as f:
+            header = json.loads(f.readline())
+            paths = f.read(header["paths_bytes"]).decode("utf-8").split("\n")
+            columns = {}
+            for column in header["columns"]:
+                values = array("q")
+                values.fromfile(f, header["count"])
+                columns[column] = values
+    except (OSError, ValueError, KeyError, EOFError):
+        return {}
+    if header.get("version") != 1 or len(paths) != header["count"] or "camera" not in columns:
+        return {}
+    cameras = header.get("cameras", [])
+    camera_ids = columns.pop("camera")
+    names = list(columns)
+    saved = {}
+    for path, camera_id, row in zip(paths, camera_ids, zip(*columns.values())):
+        saved[path] = (dict(zip(names, row)), cameras[camera_id] if 0 <= camera_id < len(cameras) else "")
+    return saved
+
+
+def metadata_index_path(folder):
+    return folder_cache_path(folder, "metadata", ".bin")
+
+
+def read_metadata(args):
+    # Runs in a worker process and only parses the header and EXIF: Image.open
+    # is lazy and nothing here calls load(). Returns (path, values, camera).
+    path, sig = args
+    if sig is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return path, None, ""
+        sig = (st.st_size, st.st_mtime_ns)
+    values = {"size": sig[0], "mtime": sig[1] // 1000000000, "mtime_ns": sig[1], "orientation": 1}
+    camera = ""
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+            exif = img.getexif()
+            orientation = exif.get(EXIF_ORIENTATION, 1)
+            if orientation >= 5:
+                width, height = height, width  # Dimensions as displayed
+            values.update(width=width, height=height, orientation=orientation)
+            # DateTimeOriginal lives in the Exif sub-IFD, DateTime in the main one
+            taken = exif.get_ifd(0x8769).get(0x9003) or exif.get(0x0132)
+            if taken:
+                values["captured"] = int(datetime.strptime(str(taken).strip("\x00 ")[:19], "%Y:%m:%d %H:%M:%S").timestamp())
+            make = str(exif.get(0x010F, "")).strip("\x00 ")
+            model = str(exif.get(0x0110, "")).strip("\x00 ")
+            camera = model if model.startswith(make) else f"{make} {model}".strip()
+    except Exception:
+        pass
+    return path, values, camera
+
+
+EXPORT_MANIFEST = ".image_rating_export.tsv"
+FICLONE = 0x40049409  # Linux ioctl for a copy-on-write clone (btrfs, xfs, ...)
+
+
+def reflink_or_copy(src, dst):
+    # Try a copy-on-write clone, then an in-kernel copy_file_range, then a plain copy
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                    remaining = 0
+                except OSError:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except (OSError, AttributeError):
+            pass
+    shutil.copy2(src, dst)
+
+
+TRANSFER_MODES = {
+    "copy": shutil.copy2,
+    "reflink": reflink_or_copy,
+    "hardlink": os.link,
+    "symlink": lambda src, dst: os.symlink(os.path.abspath(src), dst),
+    "move": shutil.move,
+}
+
+
+def unique_name(name, taken):
+    if name not in taken:
+        return name
+    stem, ext = os.path.splitext(name)
+    n = 1
+    while f"{stem} ({n}){ext}" in taken:
+        n += 1
+    return f"{stem} ({n}){ext}"
+
+
+class ExportJob:
+    # Transfers files into target_dir on a bounded thread pool. Every finished
+    # file is appended to a manifest in the target folder, so running the same
+    # export again skips what is already there instead of duplicating it.
+    def __init__(self, paths, target_dir, mode="copy", workers=8):
+        self.paths = paths
+        self.target_dir = target_dir
+        self.mode = mode
+        self.workers = workers
+        self.total = len(paths)
+        self.done = 0
+        self.skipped = 0
+        self.bytes_done = 0
+        self.errors = []
+        self.transferred = []  # source paths handled in this run
+        self.cancelled = False
+        self.finished = False
+        self.started = time.monotonic()
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def load_manifest(self, manifest_path):
+        done = {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    src, sep, name = line.rstrip("\n").partition("\t")
+                    if sep:
+                        done[src] = name
+        except FileNotFoundError:
+            pass
+        return done
+
+    def run(self):
+        try:
+            self.export()
+        except Exception as e:
+            self.errors.append((self.target_dir, str(e) or type(e).__name__))
+        finally:
+            self.finished = True
+
+    def export(self):
+        manifest_path = os.path.join(self.target_dir, EXPORT_MANIFEST)
+        previous = self.load_manifest(manifest_path)
+        taken = set(os.listdir(self.target_dir))
+        plan = []
+        for src in self.paths:
+            name = previous.get(src)
+            if name is not None and os.path.lexists(os.path.join(self.target_dir, name)):
+                self.skipped += 1
+                self.done += 1
+                continue
+            # Same-named files from different folders get " (1)", " (2)", ...
+            name = unique_name(os.path.basename(src), taken)
+            taken.add(name)
+            plan.append((src, name))
+
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        with open(manifest_path, "a", encoding="utf-8") as manifest, \
+                ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = set()
+            for src, name in plan:
+                if self.cancelled:
+                    break
+                # Keep the queue bounded so cancelling stops quickly
+                if len(pending) >= self.workers * 4:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self.record(finished, manifest)
+                pending.add(pool.submit(self.transfer, src, name))
+            finished, _ = wait(pending)
+            self.record(finished, manifest)
+
+    def transfer(self, src, name):
+        try:
+            size = os.path.getsize(src)
+            TRANSFER_MODES[self.mode](src, os.path.join(self.target_dir, name))
+        except Exception as e:
+            return src, name, 0, str(e)
+        return src, name, size, None
+
+    def record(self, futures, manifest):
+        for future in futures:
+            src, name, size, error = future.result()
+            self.done += 1
+            if error:
+                self.errors.append((src, error))
+                continue
+            self.bytes_done += size
+            self.transferred.append(src)
+            manifest.write(f"{src}\t{name}\n")
+        manifest.flush()
+
+    def progress_text(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        moved = self.done - self.skipped
+        return (f"{self.done}/{self.total} files  |  "
+                f"{self.bytes_done / 1048576 / elapsed:.1f} MB/s  |  {moved / elapsed:.1f} files/s")
+
+
+ARCHIVE_FORMATS = {"JPEG": ".jpg", "WebP": ".webp", "Original": None}  # None stores the file as it is
+
+
+def encode_export(args):
+    # Runs in a worker process: one decode (reduced by libjpeg when shrinking),
+    # upright pixels, and a re-encode to bytes. Returns (data, mtime, error).
+    path, fmt, max_edge, quality, strip = args
+    try:
+        mtime = os.stat(path).st_mtime
+        with Image.open(path) as img:
+            orientation = exif_orientation(img)
+            options = {"quality": quality}
+            if img.info.get("icc_profile"):
+                options["icc_profile"] = img.info["icc_profile"]  # Colour, kept even when stripping
+            if strip:
+                options["comment"] = b""
+            else:
+                exif = img.getexif()
+                if EXIF_ORIENTATION in exif:
+                    exif[EXIF_ORIENTATION] = 1  # The pixels are turned upright below
+                options["exif"] = exif.tobytes()
+                if img.info.get("xmp"):
+                    options["xmp"] = img.info["xmp"]
+            if max_edge:
+                if img.format == "JPEG":
+                    img.draft("RGB", (max_edge, max_edge))
+                img.thumbnail((max_edge, max_edge))
+            img = display_mode(apply_orientation(img, orientation))
+            if fmt == "JPEG" and img.mode == "RGBA":
+                flat = Image.new("RGB", img.size, (255, 255, 255))
+                flat.paste(img, mask=img.getchannel("A"))
+                img = flat
+            buf = io.BytesIO()
+            img.save(buf, format=fmt, **options)
+    except Exception as e:
+        return None, 0, str(e)
+    return buf.getvalue(), mtime, None
+
+
+class ArchiveWriter:
+    # Appends entries to a zip or tar file as they arrive; nothing is staged on
+    # disk. Zip entries are stored, since JPEG and WebP do not deflate.
+    def __init__(self, path, kind):
+        self.kind = kind
+        if kind == "tar":
+            import tarfile
+            self.archive = tarfile.open(path, "w", format=tarfile.PAX_FORMAT, dereference=True)
+        else:
+            import zipfile
+            self.archive = zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True)
+
+    def add(self, name, data, mtime):
+        if self.kind == "tar":
+            import tarfile
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(mtime)
+            info.mode = 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+        else:
+            import zipfile
+            info = zipfile.ZipInfo(name, max(time.localtime(mtime)[:6], (1980, 1, 1, 0, 0, 0)))
+            info.external_attr = 0o644 << 16
+            self.archive.writestr(info, data)
+
+    def add_file(self, name, path):
+        # Streamed from the file in chunks
+        if self.kind == "tar":
+            self.archive.add(path, arcname=name, recursive=False)
+        else:
+            self.archive.write(path, name)
+
+    def close(self):
+        self.archive.close()
+
+
+class ArchiveExportJob(ExportJob):
+    # Resizes and re-encodes the files on a process pool and streams them into
+    # one zip or tar archive in a single pass over the originals. Results are
+    # written in input order; only a couple of files per worker are in flight,
+    # so memory stays bounded for any number of files. The archive is written
+    # next to its final name and only moved into place once complete.
+    def __init__(self, paths, archive_path, fmt="JPEG", max_edge=None, quality=90, strip=True, workers=None):
+        super().__init__(paths, os.path.dirname(archive_path), "archive", workers or os.cpu_count() or 1)
+        self.archive_path = archive_path
+        self.kind = "tar" if archive_path.lower().endswith(".tar") else "zip"
+        self.format = fmt
+        self.max_edge = max_edge
+        self.quality = quality
+        self.strip = strip
+
+    def run(self):
+        part_path = self.archive_path + ".part"
+        try:
+            archive = ArchiveWriter(part_path, self.kind)
+            try:
+                self.export(archive)
+            finally:
+                archive.close()
+            if not self.cancelled:
+                os.replace(part_path, self.archive_path)
+        except Exception as e:
+            # Also a worker killed mid-decode (BrokenProcessPool) or a zip/tar error
+            self.errors.append((self.archive_path, str(e) or type(e).__name__))
+        finally:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            self.finished = True
+
+    def entry_names(self):
+        ext = ARCHIVE_FORMATS[self.format]
+        taken = set()
+        for src in self.paths:
+            name = os.path.basename(src)
+            if ext:
+                name = os.path.splitext(name)[0] + ext
+            name = unique_name(name, taken)
+            taken.add(name)
+            yield src, name
+
+    def export(self, archive):
+        if ARCHIVE_FORMATS[self.format] is None:
+            for src, name in self.entry_names():
+                if self.cancelled:
+                    return
+                try:
+                    size = os.path.getsize(src)
+                    archive.add_file(name, src)
+                except OSError as e:
+                    self.errors.append((src, str(e)))
+                else:
+                    self.bytes_done += size
+                    self.transferred.append(src)
+                self.done += 1
+            return
+
+        with process_pool(self.workers) as pool:
+            entries = self.entry_names()
+            pending = deque()
+            while not self.cancelled:
+                while len(pending) < self.workers * 2:
+                    entry = next(entries, None)
+                    if entry is None:
+                        break
+                    args = (entry[0], self.format, self.max_edge, self.quality, self.strip)
+                    pending.append((*entry, pool.submit(encode_export, args)))
+                if not pending:
+                    break
+                src, name, future = pending.popleft()
+                data, mtime, error = future.result()
+                if error:
+                    self.errors.append((src, error))
+                else:
+                    archive.add(name, data, mtime)
+                    self.bytes_done += len(data)
+                    self.transferred.append(src)
+                self.done += 1
+            for _, _, future in pending:
+                future.cancel()
+
+
+class LRUSegment:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (image, nbytes), oldest first
+        self.total_bytes = 0
+
+    def evict(self, pinned):
+        evicted = 0
+        if self.total_bytes <= self.max_bytes:
+            return evicted
+        for key in list(self.entries):
+            if key in pinned:
+                continue
+            _, nbytes = self.entries.pop(key)
+            self.total_bytes -= nbytes
+            evicted += 1
+            if self.total_bytes <= self.max_bytes:
+                break
+        return evicted
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+
+class ImageCache:
+    # Replaces the old unbounded dict of PhotoImages. Thumbnails and full-view
+    # renders get separate byte budgets so browsing big images cannot push the
+    # visible thumbnails out, and pinned keys are never evicted.
+    def __init__(self, thumb_bytes=256 * 1024 * 1024, full_bytes=384 * 1024 * 1024):
+        self.segments = {"thumb": LRUSegment(thumb_bytes), "full": LRUSegment(full_bytes)}
+        self.pins = {}  # pin group name -> set of keys
+        self.pinned = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def segment_for(self, key):
+        return self.segments["full" if key[1] == 'full' else "thumb"]
+
+    def __contains__(self, key):
+        return key in self.segment_for(key).entries
+
+    def get(self, key):
+        segment = self.segment_for(key)
+        entry = segment.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        segment.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, image):
+        segment = self.segment_for(key)
+        # Tk keeps photo images as 32-bit pixels
+        nbytes = image.width() * image.height() * 4
+        old = segment.entries.pop(key, None)
+        if old is not None:
+            segment.total_bytes -= old[1]
+        segment.entries[key] = (image, nbytes)
+        segment.total_bytes += nbytes
+        self.evictions += segment.evict(self.pinned)
+
+    def pin(self, group, keys):
+        self.pins[group] = set(keys)
+        self.pinned = set().union(*self.pins.values())
+
+    def clear(self):
+        for segment in self.segments.values():
+            segment.entries.clear()
+            segment.total_bytes = 0
+
+    def discard_paths(self, paths):
+        for segment in self.segments.values():
+            for key in [key for key in segment.entries if key[0] in paths]:
+                segment.discard(key)
+
+    def stats_text(self):
+        parts = []
+        for name, segment in self.segments.items():
+            parts.append(f"{name} {len(segment.entries)} ({segment.total_bytes / 1048576:.0f}/{segment.max_bytes / 1048576:.0f} MB)")
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0
+        parts.append(f"hits {self.hits} ({hit_rate:.0f}%) | misses {self.misses} | evictions {self.evictions}")
+        return "Cache: " + " | ".join(parts)
+
+
+class CancelToken:
+    # Shared by the jobs of one import (or one prefetch); once cancelled, the
+    # scheduler drops their queued steps and the results they posted
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class JobScheduler:
+    # Runs all background work on a few worker threads in priority order:
+    # what the view is waiting for, then prefetching for the main view, then
+    # everything else (metadata, hashing, rescans). A job is a callable, or a
+    # generator that is stepped and requeued after every yield so that more
+    # urgent work gets in between its chunks. Jobs never touch Tk; they post()
+    # callbacks, and pump() runs those on the Tk thread until the frame's time
+    # budget is spent, leaving the rest for the next frame.
+    VISIBLE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+
+    def __init__(self, workers=4):
+        self.jobs = queue.PriorityQueue()
+        self.results = deque()
+        self.order = itertools.count()  # FIFO within a priority
+        self.threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self.run, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, job, priority=BACKGROUND, token=None):
+        self.jobs.put((priority, next(self.order), job, token))
+
+    def post(self, token, callback, *args):
+        self.results.append((token, callback, args))
+
+    def pending(self):
+        return self.jobs.qsize()
+
+    def run(self):
+        while True:
+            priority, _, job, token = self.jobs.get()
+            if job is None:
+                return
+            if token is not None and token.cancelled:
+                continue
+            try:
+                if not isinstance(job, types.GeneratorType):
+                    job()
+                    continue
+                next(job)
+            except StopIteration:
+                continue
+            except Exception:
+                traceback.print_exc()
+                continue
+            self.submit(job, priority, token)
+
+    def pump(self, budget):
+        deadline = time.perf_counter() + budget
+        while self.results:
+            token, callback, args = self.results.popleft()
+            if token is None or not token.cancelled:
+                try:
+                    callback(*args)
+                except Exception:
+                    traceback.print_exc()
+            if time.perf_counter() > deadline:
+                break
+
+    def shutdown(self):
+        for _ in self.threads:
+            self.jobs.put((-1, next(self.order), None, None))
+
+
+class Prefetcher:
+    # Builds display pyramids as PREFETCH jobs (Pillow releases the GIL while
+    # decoding). Keys are (path, (max_w, max_h)); scheduling a new window
+    # cancels queued work and drops finished pyramids that fell out of it.
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.lock = threading.Lock()
+        self.ready = {}
+        self.tokens = {}  # key -> CancelToken of the queued or running job
+
+    def schedule(self, keys):
+        wanted = set(keys)
+        with self.lock:
+            for key in list(self.tokens):
+                if key not in wanted:
+                    self.tokens.pop(key).cancel()
+            for key in list(self.ready):
+                if key not in wanted:
+                    del self.ready[key]
+            # Submission order is priority order
+            for key in keys:
+                if key not in self.ready and key not in self.tokens:
+                    token = self.tokens[key] = CancelToken()
+                    self.scheduler.submit(functools.partial(self._load, key, token), JobScheduler.PREFETCH, token)
+
+    def _load(self, key, token):
+        path, (w, h) = key
+        try:
+            levels = build_pyramid(path, w, h)
+        except Exception:
+            levels = None
+        with self.lock:
+            # Work cancelled while it was running is thrown away
+            if self.tokens.get(key) is token:
+                del self.tokens[key]
+                if levels is not None:
+                    self.ready[key] = levels
+
+    def take(self, key):
+        with self.lock:
+            return self.ready.pop(key, None)
+
+    def shutdown(self):
+        self.schedule([])
+
+
+class ThumbnailQueue:
+    # Work list for the thumbnail jobs. Keys requested by the view (urgent)
+    # always go before the import backlog; both are (path, size) keys. One job
+    # drains just the urgent keys and one drains everything; claim() tells
+    # whether such a job has to be started.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.urgent = OrderedDict()
+        self.backlog = OrderedDict()
+        self.in_flight = 0
+        self.draining = set()  # urgent_only flags of the running jobs
+        self.closed = False
+
+    def prioritize(self, keys):
+        with self.lock:
+            # Only the current view is urgent; older requests fall back to the backlog
+            for key in self.urgent:
+                self.backlog[key] = None
+            self.urgent = OrderedDict((key, None) for key in keys)
+
+    def add_backlog(self, keys):
+        with self.lock:
+            for key in keys:
+                self.backlog[key] = None
+
+    def claim(self, urgent_only):
+        with self.lock:
+            if self.closed or urgent_only in self.draining:
+                return False
+            if not self.urgent and (urgent_only or not self.backlog):
+                return False
+            self.draining.add(urgent_only)
+            return True
+
+    def clear(self):
+        with self.lock:
+            self.urgent.clear()
+            self.backlog.clear()
+
+    def pending(self):
+        with self.lock:
+            return len(self.urgent) + len(self.backlog) + self.in_flight
+
+    def task_done(self, count):
+        with self.lock:
+            self.in_flight -= count
+
+    def next_batch(self, limit, urgent_only=False):
+        # Returns (size, paths, urgent), or None when this job has nothing left
+        with self.lock:
+            if self.closed or (not self.urgent and (urgent_only or not self.backlog)):
+                self.draining.discard(urgent_only)
+                return None
+            urgent = bool(self.urgent)
+            source = self.urgent if urgent else self.backlog
+            size = next(iter(source))[1]
+            paths = []
+            for key in list(source):
+                if key[1] == size:
+                    del source[key]
+                    self.backlog.pop(key, None)
+                    paths.append(key[0])
+                    if len(paths) >= limit:
+                        break
+            self.in_flight += len(paths)
+            return size, paths, urgent
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+
+
+class ThumbRow:
+    # One recycled row of the virtualized thumbnail list
+    def __init__(self, canvas, on_click):
+        self.frame = tk.Frame(canvas)
+        self.index_label = tk.Label(self.frame, width=4, anchor="e")
+        self.index_label.pack(side=tk.LEFT, padx=(2, 5))
+        self.panel = tk.Label(
+            self.frame,
+            justify="left",
+            compound="left",
+            anchor="w",
+            bd=0,
+            relief="flat"
+        )
+        self.panel.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.panel.bind("<Button-1>", lambda e: on_click(self))
+        self.window_id = canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+        self.index = None
+        self.state = None
+
 
 class ImageClassifierApp:
     def __init__(self, root):
@@ -20,30 +2324,217 @@ class ImageClassifierApp:
         self.root.title("Image Rating App")
         self.root.geometry("1200x700")
 
-        self.image_list = []
+        self.images = ImageCollection()  # Paths in display order, with their ratings
         self.image_index = 0
-        self.image_ratings = {}
-        self.filtered_star = None
+        self.filter_stars = None  # star values shown in the rated panel, None for all
+        self.filter_query = ([], [], [])  # (filename terms, column ranges, cameras) from the search box
+        self.filter_index = FilterIndex(self.images)
+        self.filter_job = None
+        self.meta_pool = None
+        self.metadata_path = None  # Saved FilterIndex of the imported folder
+        self.sort_column = tk.StringVar(value="name")
         self.thumb_size = 80
         self.thumb_images = {}
-        self.rated_thumbs = []
+        self.rated_rows = {}  # path -> (frame, index_label, panel) shown in the rated panel
         self.rating_buttons = []
-        self.image_cache = {}
+        self.thumb_cache_bytes = 256 * 1024 * 1024
+        self.full_cache_bytes = 384 * 1024 * 1024
+        self.image_cache = ImageCache(self.thumb_cache_bytes, self.full_cache_bytes)
+        self.decoded_thumbs = {}  # (path, MASTER_THUMB_SIZE) -> PIL image fresh from the loader
+        self.master_cache_bytes = 128 * 1024 * 1024
+        self.masters = LRUSegment(self.master_cache_bytes)  # path -> master thumbnail
+        self.rated_resize_job = None
+        self.thumb_pool = None
+        self.thumb_workers = os.cpu_count() or 1
+        self.thumb_queue = ThumbnailQueue()
+        self.thumb_failed = set()  # (path, size) keys that could not be decoded
+        self.thumbs_dirty = False
+        # A batch gives every pool worker a full chunk (see generate_thumbnails)
+        self.thumb_chunk = 8
+        self.thumb_batch_size = max(32, self.thumb_workers * self.thumb_chunk)
+        self.scheduler = JobScheduler()
+        self.import_token = CancelToken()  # Cancelled when another folder is imported
+        self.restore_state = None  # (image path, thumb_offset) to return to while a session reopens
+        self.frame_interval = 16  # ms between scheduler pumps
+        self.frame_budget = 0.008  # seconds of posted results handled per pump
+        self.import_status = ""
+        self.rating_store = None
+        self.last_rating_time = 0
+        self.prefetcher = Prefetcher(self.scheduler)
+        self.pyramid_cache_bytes = 512 * 1024 * 1024
+        self.pyramids = LRUSegment(self.pyramid_cache_bytes)  # path -> pyramid levels
+        self.resize_job = None
+        self.prefetch_ahead = 4
+        self.prefetch_behind = 1
+        self.nav_direction = 1
+
+        self.zoom_step = None  # Zoom of the center view as a power of two, None to fit the window
+        self.zoom_center = (0.5, 0.5)  # Centre of the zoomed view as a fraction of the image size
+        self.zoom_origin = (0, 0)  # Top-left corner of the canvas in zoomed image pixels
+        self.tile_source = None
+        self.tile_cache_bytes = 192 * 1024 * 1024
+        self.tiles = LRUSegment(self.tile_cache_bytes)  # (path, step, tx, ty) -> PhotoImage
+        self.tile_tokens = {}  # tile key -> CancelToken of its queued or running load
+        self.visible_tiles = set()
+        self.zoom_placeholder = None
+        self.pan_anchor = None
+        self.pan_job = None
 
         self.tk_img = None
         self.current_img_path = None
 
-        self.page_size = 200
-        self.current_page = 0
+        self.thumb_rows = []
+        self.thumb_offset = 0  # Pixel offset of the view into the whole thumbnail list
+        self.thumb_overscan = 2
 
         self.status_var = tk.StringVar()
         self.thumb_resize_job = None  # <-- Added here
         self.active_scroll_area = None
 
-        self.supported_extensions = (".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp")
+        self.supported_extensions = SUPPORTED_EXTENSIONS
+
+        try:
+            self.thumb_store = ThumbnailStore(os.path.join(get_cache_dir(), "thumbnails.sqlite3"))
+        except (OSError, sqlite3.Error):
+            self.thumb_store = None  # Fall back to decoding every time
+
+        self.export_mode = tk.StringVar(value="copy")
+        self.archive_format = tk.StringVar(value="JPEG")
+        self.archive_max_edge = tk.StringVar(value="2048")  # Empty keeps the original size
+        self.archive_quality = tk.IntVar(value=90)
+        self.archive_strip = tk.BooleanVar(value=True)
+        self.hud_visible = tk.BooleanVar(value=False)
+        self.hud_job = None
+
+        self.group_similar = tk.BooleanVar(value=False)
+        self.groups = {}  # path -> tuple of near-duplicate paths, for groups of two or more
+        self.grouping_status = ""
+        self.scoring_status = ""
+        self.score_details = array("f")  # sharpness, brightness, clipped, noise per image id, -1 unscored
+        self.auto_rate_threshold = 30
+        self.view_rows = None  # image index of each thumbnail row while groups are collapsed
+        self.view_pos = {}  # image index -> thumbnail row
+
+        self.snapshot = None  # FolderSnapshot of the imported folder once its scan is done
+        self.atlas = None  # ThumbAtlas of the imported folder
+        self.rescanning = False
+        self.rescan_status = ""
+        self.watch_folder = tk.BooleanVar(value=False)
+        self.watch_interval = 3
+        self.last_watch_time = 0
 
         self.setup_ui()
         self.bind_keys()
+        self.root.after(self.frame_interval, self.poll_background)
+        self.root.after(100, self.enable_drop)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def enable_drop(self):
+        # Only a TkinterDnD root has tkdnd loaded; without it folders can still
+        # be imported from the File menu
+        if not getattr(self.root, "TkdndVersion", None):
+            return
+        from tkinterdnd2 import DND_FILES
+        for widget in (self.main_frame, self.bottom_frame):
+            widget.drop_target_register(DND_FILES)
+            widget.dnd_bind('<<Drop>>', self.on_drop)
+
+    def save_session(self):
+        # What the window showed at close, so the next start can reopen the
+        # folder from its saved listing and draw this view before decoding
+        snapshot = self.snapshot
+        if not snapshot or not self.images:
+            # Dropped files or a folder closed mid-scan can't be reopened from a
+            # listing; forget the older session rather than reopen it next time
+            for path in (session_path(), session_view_path()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return
+        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        view = None
+        if self.current_img_path:
+            try:
+                image = render_from_pyramid(self.get_pyramid(self.current_img_path), w, h)
+                image.convert("RGB").save(session_view_path(), "PPM")
+                view = [w, h]
+            except Exception:
+                pass
+        session = {
+            "folder": snapshot.folder,
+            "recursive": snapshot.recursive,
+            "image": self.current_img_path,
+            "thumb_offset": self.thumb_offset,
+            "thumb_size": self.thumb_size,
+            "filter": self.filter_var.get(),
+            "search": self.filter_text.get(),
+            "sort": self.sort_column.get(),
+            "geometry": self.root.geometry(),
+            "view": view,
+        }
+        tmp_path = session_path() + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(session, f)
+            os.replace(tmp_path, session_path())
+        except OSError:
+            pass
+
+    def restore_session(self):
+        # Reopens the folder of the last session without scanning it; the
+        # saved view stands in for the current image until that is decoded
+        session = load_session()
+        if not session or not os.path.isdir(session["folder"]):
+            return False
+        try:
+            folder = session["folder"]
+            recursive = bool(session["recursive"])
+            restore_state = (session["image"], int(session["thumb_offset"]))
+            thumb_size = min(max(int(session["thumb_size"]), 40), MASTER_THUMB_SIZE)
+            sort = session["sort"] if session["sort"] in FILTER_COLUMNS + INDEX_COLUMNS else "name"
+            filter_value, search = str(session["filter"]), str(session["search"])
+            geometry = str(session["geometry"])
+            view = tuple(int(v) for v in session["view"]) if session["view"] else None
+        except (KeyError, TypeError, ValueError):
+            return False
+        self.root.geometry(geometry)
+        self.thumb_size = thumb_size
+        self.thumb_slider.set(thumb_size)
+        self.sort_column.set(sort)
+        self.filter_var.set(filter_value)
+        self.filter_text.set(search)
+        self.apply_filter()
+        self.start_import(folder, recursive, restore=True)
+        self.restore_state = restore_state
+        if view:
+            try:
+                self.tk_img = tk.PhotoImage(file=session_view_path())
+            except tk.TclError:
+                return True
+            self.canvas.create_image(view[0] // 2, view[1] // 2, image=self.tk_img, tags="current_image")
+        return True
+
+    def on_close(self):
+        self.save_session()
+        self.import_token.cancel()
+        self.thumb_queue.close()
+        self.prefetcher.shutdown()
+        self.scheduler.shutdown()
+        if self.rating_store:
+            self.rating_store.close()
+        if self.atlas:
+            self.atlas.close()
+        if self.thumb_pool:
+            self.thumb_pool.shutdown(wait=False, cancel_futures=True)
+        if self.meta_pool:
+            self.meta_pool.shutdown(wait=False, cancel_futures=True)
+        if self.thumb_store:
+            try:
+                self.thumb_store.close()
+            except sqlite3.Error:
+                pass
+        self.root.destroy()
 
     def enable_scroll(self, area):
         self.active_scroll_area = area
@@ -79,47 +2570,80 @@ class ImageClassifierApp:
         file_menu = tk.Menu(self.menu, tearoff=0)
         self.menu.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Import Folder", command=self.import_folder)
+        file_menu.add_command(label="Import Folder with Subfolders", command=lambda: self.import_folder(recursive=True))
+        file_menu.add_command(label="Rescan Folder", accelerator="F5", command=self.rescan_folder)
+        file_menu.add_separator()
+        file_menu.add_command(label="Export Filtered Images as Archive...", command=self.export_archive)
         
         # Menu "Option" > "About"
         option_menu = tk.Menu(self.menu, tearoff=0)
         self.menu.add_cascade(label="Option", menu=option_menu)
+        export_menu = tk.Menu(option_menu, tearoff=0)
+        for mode in TRANSFER_MODES:
+            export_menu.add_radiobutton(label=mode.capitalize(), value=mode, variable=self.export_mode)
+        option_menu.add_cascade(label="Export Mode", menu=export_menu)
+        sort_menu = tk.Menu(option_menu, tearoff=0)
+        for label, column in (("Name", "name"), ("Capture Time", "captured"), ("Modified", "mtime"),
+                              ("File Size", "size"), ("Width", "width"), ("Height", "height"),
+                              ("Camera", "camera"), ("Orientation", "orientation"), ("Quality Score", "score")):
+            sort_menu.add_radiobutton(label=label, value=column, variable=self.sort_column, command=self.sort_images)
+        option_menu.add_cascade(label="Sort Thumbnails By", menu=sort_menu)
+        option_menu.add_checkbutton(label="Performance HUD (F12)", variable=self.hud_visible, command=self.refresh_hud)
+        option_menu.add_command(label="Export Performance Trace...", command=self.export_trace)
+        option_menu.add_checkbutton(label="Watch Folder for New Files", variable=self.watch_folder)
+        option_menu.add_checkbutton(label="Group Similar Images", variable=self.group_similar, command=self.toggle_grouping)
+        option_menu.add_command(label="Score Image Quality", command=self.start_scoring)
+        option_menu.add_command(label="Auto-Rate Low Scores...", command=self.auto_rate_low_scores)
         option_menu.add_command(label="About", command=self.show_about_popup)
 
-        self.thumb_slider = tk.Scale(self.left_frame, from_=40, to=160, label="Thumbnail Size", orient=tk.HORIZONTAL, command=self.update_thumbnail_size)
+        self.thumb_slider = tk.Scale(self.left_frame, from_=40, to=MASTER_THUMB_SIZE, label="Thumbnail Size", orient=tk.HORIZONTAL, command=self.update_thumbnail_size)
         self.thumb_slider.set(self.thumb_size)
         self.thumb_slider.pack(fill=tk.X, padx=5, pady=(5, 0))
 
-        self.thumb_canvas = tk.Canvas(self.left_frame)
-        self.thumb_scrollbar = tk.Scrollbar(self.left_frame, orient=tk.VERTICAL, command=self.thumb_canvas.yview)
-        self.thumb_frame = tk.Frame(self.thumb_canvas)
-
-        self.thumb_inner_id = self.thumb_canvas.create_window((0, 0), window=self.thumb_frame, anchor="nw")
-        self.thumb_canvas.configure(yscrollcommand=self.thumb_scrollbar.set)
+        # Only the rows on screen exist as widgets; the scrollbar drives thumb_offset
+        # directly instead of scrolling the canvas, so the list has no size limit.
+        self.thumb_canvas = tk.Canvas(self.left_frame, highlightthickness=0)
+        self.thumb_scrollbar = tk.Scrollbar(self.left_frame, orient=tk.VERTICAL, command=self.on_thumb_scroll)
 
         self.thumb_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.thumb_canvas.bind("<Enter>", lambda e: self.enable_scroll("thumb"))
         self.thumb_canvas.bind("<Leave>", lambda e: self.disable_scroll("thumb"))
-        self.root.drop_target_register(DND_FILES)
-        self.root.dnd_bind('<<Drop>>', self.on_drop)
         self.thumb_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.thumb_frame.bind("<Configure>", self.on_thumb_configure)
+        self.thumb_canvas.bind("<Configure>", lambda e: self.render_thumbnails())
 
         self.canvas = tk.Canvas(self.center_frame, bg="black")
         self.canvas.pack(fill=tk.BOTH, expand=True)
-        self.canvas.bind("<Configure>", lambda e: self.display_image())
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self.canvas.bind("<Enter>", lambda e: self.enable_scroll("view"))
+        self.canvas.bind("<Leave>", lambda e: self.disable_scroll("view"))
+        self.canvas.bind("<ButtonPress-1>", self.start_pan)
+        self.canvas.bind("<B1-Motion>", self.pan_view)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.toggle_zoom((e.x, e.y)))
 
         self.counter_label = tk.Label(self.center_frame, text="0 / 0", fg="white", bg="black", anchor="se")
         self.counter_label.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
 
+        self.hud_label = tk.Label(self.center_frame, fg="#7CFC00", bg="black", justify="left", anchor="nw", font=("Courier", 9))
+
         filter_frame = tk.Frame(self.right_frame)
         filter_frame.pack(fill=tk.X, pady=2)
         tk.Label(filter_frame, text="Filter by rating:").pack(side=tk.LEFT, padx=10)
         self.filter_var = tk.StringVar(value="All")
-        options = ["All", 1, 2, 3, 4, 5]
+        options = ["All", 1, 2, 3, 4, 5, "≥2", "≥3", "≥4"]
         self.filter_menu = tk.OptionMenu(filter_frame, self.filter_var, *options, command=self.apply_filter)
         self.filter_menu.config(width=8)
         self.filter_menu.pack(side=tk.LEFT, padx=5)
+
+        # e.g. "IMG_2 width>=4000 size<5mb date>=2024-06-01"
+        search_frame = tk.Frame(self.right_frame)
+        search_frame.pack(fill=tk.X, pady=2)
+        tk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=10)
+        self.filter_text = tk.StringVar()
+        self.filter_entry = tk.Entry(search_frame, textvariable=self.filter_text)
+        self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        self.filter_entry.bind("<Return>", self.apply_filter)
+        self.filter_entry.bind("<KeyRelease>", self.schedule_filter)
         
         self.filter_count_var = tk.StringVar(value="0 images")
         self.filter_count_label = tk.Label(self.right_frame, textvariable=self.filter_count_var, anchor="w")
@@ -165,25 +2689,28 @@ class ImageClassifierApp:
             btn.pack(side=tk.LEFT, padx=4)
 
         tk.Button(stars_frame, text="Skip", width=6, command=self.skip_image).pack(side=tk.LEFT, padx=10)
+
+        self.status_label = tk.Label(self.bottom_frame, textvariable=self.status_var, anchor="w", fg="gray30")
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10)
                 
     def clear_all_ratings(self):
-        if not self.image_ratings:
+        if not self.images.rated:
             return  # Không làm gì nếu chưa có đánh giá
 
         if not messagebox.askyesno("Confirm", "Do you want to clear all ratings?"):
             return
 
-        self.image_ratings.clear()
+        self.clear_ratings()
         self.update_thumbnails()
         self.update_rated_list()
 
     def confirm_clear_ratings(self):
-        if not self.image_ratings:
+        if not self.images.rated:
             return  # Không có gì để xóa
 
         result = messagebox.askyesno("Clear Ratings", "Are you sure you want to clear all ratings?")
         if result:
-            self.image_ratings.clear()
+            self.clear_ratings()
             self.update_rating_buttons(self.current_img_path)
             self.update_rated_list()
             self.highlight_selected_thumbnail()
@@ -191,80 +2718,57 @@ class ImageClassifierApp:
 
     def on_drop(self, event):
         paths = self.root.tk.splitlist(event.data)
+        token = self.import_token
 
-        # Filter supported image files or directories
-        dropped_files = []
-        for path in paths:
-            if os.path.isdir(path):
-                for f in os.listdir(path):
-                    full_path = os.path.join(path, f)
-                    if f.lower().endswith(self.supported_extensions):
-                        dropped_files.append(full_path)
-            elif path.lower().endswith(self.supported_extensions):
-                dropped_files.append(path)
+        def list_dropped():
+            # Filter supported image files or directories
+            dropped_files = []
+            for path in paths:
+                if os.path.isdir(path):
+                    for f in os.listdir(path):
+                        full_path = os.path.join(path, f)
+                        if f.lower().endswith(self.supported_extensions):
+                            dropped_files.append(full_path)
+                elif path.lower().endswith(self.supported_extensions):
+                    dropped_files.append(path)
+            self.scheduler.post(token, self.on_dropped_files, paths, sorted(set(dropped_files)))
+
+        self.scheduler.submit(list_dropped, JobScheduler.VISIBLE, token)
 
+    def on_dropped_files(self, paths, dropped_files):
         if not dropped_files:
             return
 
-        if not self.image_list:
+        if not self.images:
             answer = "replace"  # Không có ảnh → tự động replace
         else:
             answer = self.ask_add_or_replace()
 
+        if answer == "replace":
+            dirs = [path if os.path.isdir(path) else os.path.dirname(path) for path in paths]
+            try:
+                drop_folder = os.path.commonpath(dirs)
+            except ValueError:
+                drop_folder = dirs[0]  # Different drives
+            self.reset_folder(drop_folder)
+            self.extend_image_list(dropped_files)
+            self.apply_saved_ratings(dropped_files, update_rows=False)
+            self.update_rated_list()
+        elif answer == "add":
+            # Files already in the list are left alone
+            dropped_files = [path for path in dropped_files if path not in self.images]
+            self.extend_image_list(dropped_files)
+            self.apply_saved_ratings(dropped_files)
+        else:
+            return  # "cancel"
 
-        if answer in ("add", "replace"):
-            progress_popup = tk.Toplevel(self.root)
-            progress_popup.title("Loading Images")
-            progress_popup.geometry("400x100")
-            progress_popup.transient(self.root)
-            progress_popup.grab_set()
-
-            progress_popup.update_idletasks()
-            popup_w, popup_h = 400, 100
-            root_w = self.root.winfo_width()
-            root_h = self.root.winfo_height()
-            root_x = self.root.winfo_x()
-            root_y = self.root.winfo_y()
-            center_x = root_x + (root_w // 2) - (popup_w // 2)
-            center_y = root_y + (root_h // 2) - (popup_h // 2)
-            progress_popup.geometry(f"{popup_w}x{popup_h}+{center_x}+{center_y}")
-
-            label = tk.Label(progress_popup, text="Loading images...")
-            label.pack(pady=5)
-
-            progress = ttk.Progressbar(progress_popup, orient="horizontal", length=300, mode="determinate")
-            progress.pack(pady=5)
-
-            self.root.update()
-
-            def load_images():
-                self.set_widgets_state("disabled")
-                new_files = dropped_files if answer == "replace" else self.image_list + dropped_files
-                new_files = sorted(set(new_files))
-                total = len(new_files)
-                progress.config(maximum=total)
-
-                for idx, path in enumerate(new_files):
-                    self.get_cached_image(path, self.thumb_size)
-                    progress['value'] = idx + 1
-                    label.config(text=f"Loading {idx + 1}/{total} images...")
-                    self.root.update_idletasks()
-
-                self.image_list = new_files
-                self.image_index = 0
-                if answer == "replace":
-                    self.image_ratings.clear()
-                    self.current_page = 0
-                    self.update_rated_list()
-                self.display_image()
-                self.update_thumbnails()
-                progress_popup.destroy()
-                self.set_widgets_state("normal")
-
-            threading.Thread(target=load_images, daemon=True).start()
+        # Thumbnails and metadata fill in from the background like a folder import
+        self.queue_thumbnails(dropped_files)
+        self.extract_metadata(dropped_files, full=answer == "replace")
+        if self.images:
+            self.display_image()
+        self.update_thumbnails()
 
-        # if "cancel", do nothing
-    
     def ask_add_or_replace(self):
         popup = tk.Toplevel(self.root)
         popup.title("Add or Replace Thumbnails?")
@@ -296,156 +2800,451 @@ class ImageClassifierApp:
         self.root.wait_window(popup)
         return result.get()
 
-    def on_thumb_configure(self, event):
-        self.thumb_canvas.configure(scrollregion=self.thumb_canvas.bbox("all"))
-
     def bind_keys(self):
-        self.root.bind("<Down>", lambda e: self.move_selection(1))
-        self.root.bind("<Right>", lambda e: self.move_selection(1))
-        self.root.bind("<Up>", lambda e: self.move_selection(-1))
-        self.root.bind("<Left>", lambda e: self.move_selection(-1))
+        def key(action):
+            # Root bindings also fire for keys typed into the search box
+            def handler(event):
+                if not isinstance(event.widget, tk.Entry):
+                    action()
+            return handler
+
+        self.root.bind("<Down>", key(lambda: self.move_selection(1)))
+        self.root.bind("<Right>", key(lambda: self.move_selection(1)))
+        self.root.bind("<Up>", key(lambda: self.move_selection(-1)))
+        self.root.bind("<Left>", key(lambda: self.move_selection(-1)))
         for i in range(1, 6):
-            self.root.bind(str(i), lambda e, i=i: self.rate_image(i))
-        self.root.bind("<space>", lambda e: self.skip_image())
+            self.root.bind(str(i), key(lambda i=i: self.rate_image(i)))
+        self.root.bind("<space>", key(self.skip_image))
+        self.root.bind("<F12>", lambda e: self.toggle_hud())
+        self.root.bind("<F5>", lambda e: self.rescan_folder())
+        self.root.bind("z", key(self.toggle_zoom))
+        self.root.bind("<plus>", key(lambda: self.zoom_by(1)))
+        self.root.bind("<equal>", key(lambda: self.zoom_by(1)))
+        self.root.bind("<minus>", key(lambda: self.zoom_by(-1)))
 
     def mousewheel_scroll(self, event):
         if self.active_scroll_area == "thumb":
-            self.thumb_canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+            self.on_thumb_scroll("scroll", -1 * int(event.delta / 120), "units")
         elif self.active_scroll_area == "rated":
             self.rated_canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+        elif self.active_scroll_area == "view" and event.delta:
+            self.zoom_by(1 if event.delta > 0 else -1, (event.x, event.y))
 
-    def import_folder(self):
+    def import_folder(self, recursive=False):
         folder = filedialog.askdirectory()
         if not folder:
             return
+        self.start_import(folder, recursive)
 
-        progress_popup = tk.Toplevel(self.root)
-        progress_popup.title("Loading Images")
-        progress_popup.geometry("400x100")
-        progress_popup.transient(self.root)
-        progress_popup.grab_set()
-        # Center the popup
-        progress_popup.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (400 // 2)
-        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (100 // 2)
-        progress_popup.geometry(f"+{x}+{y}")
+    def reset_folder(self, folder):
+        # Cancels every job of the previous folder and opens the stores of this one
+        self.import_token.cancel()
+        self.import_token = CancelToken()
+        self.snapshot = None
+        self.restore_state = None
+        self.import_status = ""
+        self.rescan_status = ""
+        self.rescanning = False
+        self.grouping_status = ""
+        self.scoring_status = ""
+        self.score_details = array("f")
+        self.thumb_queue.clear()
+        self.decoded_thumbs.clear()
+        self.zoom_step = None
+        self.images = ImageCollection()
+        self.image_index = 0
+        self.thumb_offset = 0
+        self.canvas.delete("all")
+        self.groups = {}
+        self.filter_index = FilterIndex(self.images)
+        self.metadata_path = metadata_index_path(folder)
+        self.rebuild_view()
+        self.open_rating_store(folder)
+        self.open_atlas(folder)
 
-        label = tk.Label(progress_popup, text="Loading images...")
-        label.pack(pady=5)
+    def start_import(self, folder, recursive=False, restore=False):
+        # Streamed import: paths arrive in batches from a scheduler job and are
+        # thumbnailed in the background, so the window stays usable throughout.
+        # With `restore` the listing saved at the last scan is used as is and
+        # only the directories that changed since are listed again.
+        snapshot = self.snapshot
+        if (snapshot and self.images and snapshot.recursive == recursive
+                and os.path.abspath(snapshot.folder) == os.path.abspath(folder)):
+            # Importing the open folder again only picks up what changed
+            self.rescan_folder()
+            return
+        self.reset_folder(folder)
+        token = self.import_token
+        atlas = self.atlas
+        self.update_rated_list()
+        self.import_status = "Scanning..."
+        self.update_thumbnails()
 
-        progress = ttk.Progressbar(progress_popup, orient="horizontal", length=300, mode="determinate")
-        progress.pack(pady=5)
+        def scan():
+            # The snapshot from the last session tells which files are gone since
+            snapshot = FolderSnapshot(folder_snapshot_path(folder), folder, recursive)
+            if restore and snapshot.dirs:
+                for files in list(snapshot.files.values()):
+                    paths = list(files)
+                    for i in range(0, len(paths), 500):
+                        self.scheduler.post(token, self.on_scan_batch, paths[i:i + 500])
+                        yield
+                self.scheduler.post(token, self.on_scan_done, snapshot, True)
+                return
+            changed = []
+            removed = []
+            for batch, _, modified, gone in snapshot.scan([folder], self.supported_extensions):
+                changed.extend(modified)
+                removed.extend(gone)
+                if batch:
+                    self.scheduler.post(token, self.on_scan_batch, batch)
+                yield
+            if self.thumb_store and removed:
+                self.thumb_store.discard(removed)
+            if atlas and (changed or removed):
+                try:
+                    atlas.discard(changed + removed)
+                except ValueError:
+                    pass  # Closed by a newer import
+            try:
+                snapshot.save()
+            except OSError:
+                pass
+            self.scheduler.post(token, self.on_scan_done, snapshot)
+
+        self.scheduler.submit(scan(), JobScheduler.VISIBLE, token)
+
+    def on_scan_batch(self, batch):
+        first_batch = not self.images
+        self.extend_image_list(batch)
+        self.apply_saved_ratings(batch)
+        self.queue_thumbnails(batch)
+        self.import_status = f"Scanning... {len(self.images)} images"
+        if self.restore_state:
+            path, thumb_offset = self.restore_state
+            index = self.images.index(path)
+            if index is not None:
+                self.restore_state = None
+                self.image_index = index
+                self.thumb_offset = thumb_offset
+                self.display_image()
+                self.highlight_selected_thumbnail()
+        elif first_batch:
+            self.display_image()
+        self.thumbs_dirty = True
+
+    def on_scan_done(self, snapshot, restored=False):
+        self.snapshot = snapshot
+        self.import_status = ""
+        if self.restore_state:
+            self.restore_state = None  # The last image is gone, start at the first
+            self.display_image()
+        if self.thumb_store:
+            self.thumb_store.flush()
+            # Files deleted while the folder was closed
+            store, folder = self.thumb_store, snapshot.folder
+            self.scheduler.submit(lambda: store.prune_missing(folder), JobScheduler.BACKGROUND, self.import_token)
+        self.match_moved_ratings()
+        self.extract_metadata(list(self.images), full=True)
+        if self.group_similar.get():
+            self.start_grouping()
+        if restored:
+            self.rescan_folder(full=False)
 
-        self.root.update()
+    def rescan_folder(self, full=True):
+        # Lists the imported folder again (or with full=False only the directories
+        # whose mtime changed) and applies just the difference to the open list
+        snapshot = self.snapshot
+        if not snapshot or self.import_status or self.rescanning:
+            return
+        self.rescanning = True
+        token = self.import_token
 
-        def load_images():
-            self.set_widgets_state("disabled")
-            file_list = [os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(self.supported_extensions)]
-            file_list.sort()
+        def scan():
+            added, changed, removed, moved = [], [], {}, []
+            try:
+                dirs = [snapshot.folder] if full else snapshot.changed_dirs()
+                for _, new, modified, gone in snapshot.scan(dirs, self.supported_extensions, full):
+                    added.extend(new)
+                    changed.extend(modified)
+                    removed.update(gone)
+                    yield
+                if removed:
+                    # A file that was renamed or moved keeps its inode and size
+                    by_inode = {(sig[0], sig[2]): path for path, sig in removed.items() if sig[2]}
+                    for path in added:
+                        sig = snapshot.signature(path)
+                        old_path = by_inode.pop((sig[0], sig[2]), None) if sig else None
+                        if old_path:
+                            moved.append((old_path, path))
+                    if self.thumb_store:
+                        self.thumb_store.discard(removed)
+                if added or changed or removed:
+                    snapshot.save()
+            except OSError:
+                pass
+            self.scheduler.post(token, self.on_rescan, full, added, changed, list(removed), moved)
 
-            self.image_list = file_list
-            total = len(file_list)
-            progress.config(maximum=total)
+        self.scheduler.submit(scan(), JobScheduler.BACKGROUND, token)
 
-            for idx, path in enumerate(file_list):
-                self.get_cached_image(path, self.thumb_size)
-                progress['value'] = idx + 1
-                label.config(text=f"Loading {idx + 1}/{total} images...")
-                self.root.update_idletasks()
+    def on_rescan(self, *delta):
+        self.rescanning = False
+        self.apply_rescan(*delta)
 
-            self.image_index = 0
-            self.current_page = 0
+    def apply_rescan(self, full, added, changed, removed, moved):
+        self.forget_images(changed + removed)
+        self.extend_image_list(added)
+        self.apply_saved_ratings(added)
+        for old_path, path in moved:
+            stars = self.images.rating(old_path)
+            if stars and not self.images.rating(path):
+                self.set_rating(path, stars)
+                self.update_rated_row(path)
+        self.remove_images(removed)
+        self.queue_thumbnails(added + changed)
+        self.extract_metadata(added + changed)
+        if full or added or changed or removed:
+            self.rescan_status = f"Rescan: {len(added)} added, {len(changed)} changed, {len(removed)} removed"
+        if self.current_img_path in changed:
             self.display_image()
+        if self.group_similar.get() and (added or changed):
+            self.start_grouping()
+        self.thumbs_dirty = True
+
+    def forget_images(self, paths):
+        # Drops everything decoded from these files so they are read again
+        gone = set(paths)
+        if not gone:
+            return
+        self.image_cache.discard_paths(gone)
+        if self.atlas:
+            self.atlas.discard(gone)
+        for path in gone:
+            self.masters.discard(path)
+            self.pyramids.discard(path)
+            self.decoded_thumbs.pop((path, MASTER_THUMB_SIZE), None)
+            self.thumb_failed.discard((path, MASTER_THUMB_SIZE))
+        for key in [key for key in self.tiles.entries if key[0] in gone]:
+            self.tiles.discard(key)
+        if self.tile_source and self.tile_source.path in gone:
+            self.tile_source = None
+        for row in self.thumb_rows:
+            row.state = None
+
+    def poll_background(self):
+        # The one place background results reach Tk: every frame runs the
+        # callbacks jobs posted, up to the frame budget, then the periodic checks
+        try:
+            self.poll_once()
+        finally:
+            self.root.after(self.frame_interval, self.poll_background)
+
+    def poll_once(self):
+        self.scheduler.pump(self.frame_budget)
+
+        if self.watch_folder.get() and time.monotonic() - self.last_watch_time > self.watch_interval:
+            self.last_watch_time = time.monotonic()
+            self.rescan_folder(full=False)
+
+        # Compact the rating journal once the user has paused for a while
+        if (self.rating_store and time.monotonic() - self.last_rating_time > 5
+                and self.rating_store.needs_compaction()):
+            self.rating_store.compact()
+
+        if self.thumbs_dirty:
+            self.thumbs_dirty = False
             self.update_thumbnails()
-            progress_popup.destroy()
-            self.set_widgets_state("normal")
+        elif self.import_status or self.grouping_status or self.scoring_status or self.thumb_queue.pending():
+            self.update_status()
+
+    def on_restore(self, path, old_path, stars):
+        if self.images.rating(path):
+            return
+        self.set_rating(path, stars)
+        self.rating_store.record(old_path, 0)
+        self.update_rated_row(path)
+        self.thumbs_dirty = True
 
-        threading.Thread(target=load_images, daemon=True).start()
+    def request_thumbnails(self, keys):
+        # Thumbnails the view is waiting for, ahead of any other background work
+        self.thumb_queue.prioritize(keys)
+        self.start_thumbnail_jobs()
+
+    def queue_thumbnails(self, paths):
+        self.thumb_queue.add_backlog([(path, MASTER_THUMB_SIZE) for path in paths])
+        self.start_thumbnail_jobs()
+
+    def start_thumbnail_jobs(self):
+        if self.thumb_queue.claim(True):
+            self.scheduler.submit(self.thumbnail_work(True), JobScheduler.VISIBLE)
+        if self.thumb_queue.claim(False):
+            self.scheduler.submit(self.thumbnail_work(False), JobScheduler.BACKGROUND)
+
+    def thumbnail_work(self, urgent_only):
+        # One batch per step, so a backlog job gives way to newer urgent requests
+        while True:
+            batch = self.thumb_queue.next_batch(self.thumb_batch_size, urgent_only)
+            if batch is None:
+                return
+            size, paths, urgent = batch
+            try:
+                # Only what the view asked for is kept decoded; backlog work just fills the store
+                failed = self.generate_thumbnails(paths, size, keep=paths if urgent else [])
+            except Exception:
+                failed = []
+            finally:
+                self.thumb_queue.task_done(len(paths))
+            self.thumb_failed.update((path, size) for path in failed)
+            if urgent or failed:
+                self.thumbs_dirty = True
+            yield
 
     def update_thumbnails(self):
-        for widget in self.thumb_frame.winfo_children():
-            widget.destroy()
+        self.render_thumbnails()
+        self.update_status()
 
-        start = self.current_page * self.page_size
-        end = min(len(self.image_list), start + self.page_size)
-        for i in range(start, end):
-            path = self.image_list[i]
-            img = self.get_cached_image(path, self.thumb_size)
-            if not img:
-                continue
-                
-            frame = tk.Frame(self.thumb_frame)
-            index_label = tk.Label(frame, text=f"{i + 1}", width=4, anchor="e")
-            index_label.pack(side=tk.LEFT, padx=(2, 5))
-
-            rating = self.image_ratings.get(path, 0)
-            star_str = f"★ {rating}" if rating else "☆"
-            thumb_text = f"{star_str}\n{os.path.basename(path)}"
-
-            panel = tk.Label(
-                frame,
-                image=img,
-                text=thumb_text,
-                justify="left",
-                compound="left",
-                anchor="w",
-                bd=0,
-                relief="flat"
-            )
-            panel.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            panel.bind("<Button-1>", lambda e, idx=i: self.select_image(idx))
+    def update_status(self):
+        parts = [self.image_cache.stats_text()]
+        score = self.score_text()
+        if score:
+            parts.insert(0, score)
+        pending = self.thumb_queue.pending()
+        if pending:
+            parts.insert(0, f"Thumbnails queued: {pending}")
+        if self.rescan_status:
+            parts.insert(0, self.rescan_status)
+        if self.grouping_status:
+            parts.insert(0, self.grouping_status)
+        if self.scoring_status:
+            parts.insert(0, self.scoring_status)
+        if self.import_status:
+            parts.insert(0, self.import_status)
+        text = "  |  ".join(parts)
+        if text != self.status_var.get():
+            self.status_var.set(text)
+
+    def thumb_row_height(self):
+        # Tall enough for the thumbnail or the two text lines, whichever is bigger
+        return max(self.thumb_size, 36) + 4
+
+    def thumb_view_height(self):
+        return max(1, self.thumb_canvas.winfo_height())
+
+    def thumb_row_capacity(self):
+        return self.thumb_view_height() // self.thumb_row_height() + 1 + 2 * self.thumb_overscan
 
-            if i == self.image_index:
-                panel.config(bg="#a6d4fa")
+    def on_thumb_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.thumb_offset = int(float(amount) * self.row_count() * self.thumb_row_height())
+        elif action == "scroll":
+            step = self.thumb_row_height() if unit == "units" else self.thumb_view_height()
+            self.thumb_offset += int(amount) * step
+        self.render_thumbnails()
+
+    @profiled("thumb_rows")
+    def render_thumbnails(self):
+        row_h = self.thumb_row_height()
+        view_h = self.thumb_view_height()
+        total_h = self.row_count() * row_h
+        self.thumb_offset = max(0, min(self.thumb_offset, total_h - view_h))
+
+        first = max(0, self.thumb_offset // row_h - self.thumb_overscan)
+        last = min(self.row_count(), (self.thumb_offset + view_h) // row_h + 1 + self.thumb_overscan)
+        self.image_cache.pin("page", [(self.images[self.row_image(r)], self.thumb_size) for r in range(first, last)])
+
+        # Rows already showing an index in range keep it; the rest are recycled
+        by_index = {}
+        free = []
+        for row in self.thumb_rows:
+            if row.index is not None and first <= row.index < last:
+                by_index[row.index] = row
             else:
-                panel.config(bg="SystemButtonFace")
+                free.append(row)
+
+        width = self.thumb_canvas.winfo_width()
+        missing = []
+        for i in range(first, last):
+            row = by_index.get(i)
+            if row is None:
+                if free:
+                    row = free.pop()
+                else:
+                    row = ThumbRow(self.thumb_canvas, lambda r: self.select_image(self.row_image(r.index)))
+                    self.thumb_rows.append(row)
+            if not self.fill_thumb_row(row, i):
+                missing.append((self.images[self.row_image(i)], MASTER_THUMB_SIZE))
+            self.thumb_canvas.coords(row.window_id, 0, i * row_h - self.thumb_offset)
+            self.thumb_canvas.itemconfigure(row.window_id, width=width, height=row_h - 2, state="normal")
 
-            frame.pack(fill=tk.X, pady=1)
+        for row in free:
+            row.index = None
+            row.state = None
+            row.panel.image = None
+            self.thumb_canvas.itemconfigure(row.window_id, state="hidden")
+        if missing:
+            self.request_thumbnails(missing)
 
-        self.root.after(50, self.ensure_visible)
+        if total_h > 0:
+            self.thumb_scrollbar.set(self.thumb_offset / total_h, min(1.0, (self.thumb_offset + view_h) / total_h))
+        else:
+            self.thumb_scrollbar.set(0.0, 1.0)
+
+    def fill_thumb_row(self, row, r):
+        # Returns False when the thumbnail still has to be generated in the background
+        i = self.row_image(r)
+        record = self.images.record(i)
+        path = record.path
+        key = (path, MASTER_THUMB_SIZE)
+        rating = record.rating
+        count = len(self.group_members(path))
+        selected = self.image_row(self.image_index) == r
+        state = (path, self.thumb_size, rating, selected, count)
+        if row.index == r and row.state == state:
+            return True
+        img = self.get_cached_image(path, self.thumb_size, block=False)
+        if img is None and key not in self.thumb_failed:
+            state = None  # Placeholder row, fill it in again once the thumbnail exists
+        star_str = f"★ {rating}" if rating else "☆"
+        if count > 1:
+            star_str += f"  ×{count}"
+        row.index_label.config(text=f"{i + 1}")
+        row.panel.config(
+            image=img or "",
+            text=f"{star_str}\n{record.name}",
+            bg="#a6d4fa" if selected else "SystemButtonFace"
+        )
+        row.panel.image = img  # Keep the photo alive even if the cache evicts it
+        row.index = r
+        row.state = state
+        return img is not None or key in self.thumb_failed
 
     def ensure_visible(self):
-        children = self.thumb_frame.winfo_children()
-        local_index = self.image_index - self.current_page * self.page_size
-        if 0 <= local_index < len(children):
-            panel = children[local_index]
-            canvas_height = self.thumb_canvas.winfo_height()
-            panel_top = panel.winfo_y()
-            panel_bottom = panel_top + panel.winfo_height()
-            view_top = self.thumb_canvas.canvasy(0)
-            view_bottom = view_top + canvas_height
-
-            if panel_top < view_top:
-                self.thumb_canvas.yview_moveto(panel_top / max(1, self.thumb_frame.winfo_height()))
-            elif panel_bottom > view_bottom:
-                offset = panel_bottom - canvas_height
-                self.thumb_canvas.yview_moveto(offset / max(1, self.thumb_frame.winfo_height()))
+        row_h = self.thumb_row_height()
+        view_h = self.thumb_view_height()
+        top = self.image_row(self.image_index) * row_h
+        if top < self.thumb_offset:
+            self.thumb_offset = top
+        elif top + row_h > self.thumb_offset + view_h:
+            self.thumb_offset = top + row_h - view_h
+        self.render_thumbnails()
 
     def select_image(self, idx):
         self.image_index = idx
-        self.current_page = self.image_index // self.page_size
+        self.nav_direction = 1
         self.display_image()
         self.highlight_selected_thumbnail()
 
     def move_selection(self, direction):
-        new_index = self.image_index + direction
-        if 0 <= new_index < len(self.image_list):
-            self.image_index = new_index
-            new_page = self.image_index // self.page_size
-            if new_page != self.current_page:
-                self.current_page = new_page
+        # Steps by thumbnail row, so a collapsed group is skipped as a whole
+        new_row = self.image_row(self.image_index) + direction
+        if self.images and 0 <= new_row < self.row_count():
+            self.image_index = self.row_image(new_row)
+            self.nav_direction = direction
             self.display_image()
             self.highlight_selected_thumbnail()
             
     def highlight_selected_thumbnail(self):
-        children = self.thumb_frame.winfo_children()
-        local_index = self.image_index - self.current_page * self.page_size
-
-        for i, child in enumerate(children):
-            panel = child.winfo_children()[1] if len(child.winfo_children()) > 1 else child
-            bg_color = "#a6d4fa" if i == local_index else "SystemButtonFace"
-            panel.config(bg=bg_color)
-            
+        # fill_thumb_row re-colours only the rows whose selection state changed
         self.ensure_visible()
 
     def update_thumbnail_size(self, val):
@@ -454,111 +3253,1004 @@ class ImageClassifierApp:
 
         def apply_resize():
             self.thumb_size = int(val)
+            # Every size is derived from the in-memory masters: the thumbnail
+            # rows on screen first, then the rated panel a chunk at a time
             self.update_thumbnails()
-            self.update_rated_list()
+            self.resize_rated_rows()
 
         self.thumb_resize_job = self.root.after(100, apply_resize)
 
-    def get_cached_image(self, path, size):
+    def resize_rated_rows(self):
+        if self.rated_resize_job:
+            self.root.after_cancel(self.rated_resize_job)
+            self.rated_resize_job = None
+        view_top = self.rated_canvas.canvasy(0)
+        view_bottom = view_top + self.rated_canvas.winfo_height()
+        visible = []
+        rest = []
+        for path, row in self.rated_rows.items():
+            (visible if view_top - 200 <= row[0].winfo_y() <= view_bottom else rest).append(path)
+        pending = visible + rest
+        size = self.thumb_size
+
+        def step(start):
+            for path in pending[start:start + 50]:
+                row = self.rated_rows.get(path)
+                if row:
+                    tk_img = self.get_cached_image(path, size)
+                    row[2].config(image=tk_img or "")
+                    row[2].image = tk_img
+            if start + 50 < len(pending):
+                self.rated_resize_job = self.root.after(1, step, start + 50)
+            else:
+                self.rated_resize_job = None
+
+        step(0)
+
+    def get_cached_image(self, path, size, block=True):
+        # With block=False only already generated thumbnails are returned
         key = (path, size)
-        if key not in self.image_cache:
+        tk_img = self.image_cache.get(key)
+        if tk_img is None:
             try:
-                img = Image.open(path)
-                img.thumbnail((size, size))
-                self.image_cache[key] = ImageTk.PhotoImage(img)
+                atlas = self.atlas
+                img = atlas.get(path) if atlas and size <= atlas.cell else None
+                if img is not None:
+                    # Nothing will ask for the master the loader decoded any more
+                    self.decoded_thumbs.pop((path, MASTER_THUMB_SIZE), None)
+                else:
+                    img = self.get_master(path, block)
+                    if img is None:
+                        return None
+                    if atlas:
+                        try:
+                            atlas.put(path, img)
+                        except OSError:
+                            pass
+                img = derive_thumbnail(img, size)
+                with PROFILER.span("photoimage"):
+                    tk_img = ImageTk.PhotoImage(img)
             except:
                 return None
-        return self.image_cache[key]
+            self.image_cache.put(key, tk_img)
+        return tk_img
+
+    def get_master(self, path, block=True):
+        entry = self.masters.entries.get(path)
+        if entry is not None:
+            self.masters.entries.move_to_end(path)
+            return entry[0]
+        img = self.decoded_thumbs.pop((path, MASTER_THUMB_SIZE), None)
+        if img is None and not block:
+            img = self.read_stored_thumbnail(path, MASTER_THUMB_SIZE)
+            if img is None:
+                return None
+        if img is None:
+            img = self.load_thumbnail(path, MASTER_THUMB_SIZE)
+        nbytes = img.width * img.height * len(img.getbands())
+        self.masters.entries[path] = (img, nbytes)
+        self.masters.total_bytes += nbytes
+        self.masters.evict(())
+        return img
+
+    def read_stored_thumbnail(self, path, size):
+        if not self.thumb_store:
+            return None
+        data = self.thumb_store.get(path, size)
+        if data is None:
+            return None
+        try:
+            img = Image.open(io.BytesIO(data))
+            img.load()
+        except Exception:
+            return None
+        return img
+
+    def load_thumbnail(self, path, size):
+        # Serve from the on-disk store when possible so warm imports skip Pillow decoding
+        img = self.read_stored_thumbnail(path, size)
+        if img is not None:
+            return img
+        img = decode_thumbnail(path, size)
+        if self.thumb_store:
+            self.thumb_store.put(path, size, encode_thumbnail(img))
+        return img
+
+    def get_thumb_pool(self):
+        if self.thumb_pool is None:
+            self.thumb_pool = process_pool(self.thumb_workers)
+        return self.thumb_pool
+
+    def generate_thumbnails(self, paths, size, on_progress=None, keep=None):
+        # Called from a loader thread: makes sure every path has a stored thumbnail
+        # and fills decoded_thumbs with PIL images for the paths in `keep` (all of
+        # them without a store) that the atlas won't serve, so the Tk thread only
+        # has to wrap them in PhotoImage.
+        if keep is None or not self.thumb_store:
+            keep = paths
+        keep = set(keep)
+        total = len(paths)
+        done = 0
+        misses = []
+        atlas = self.atlas
+
+        def add_to_atlas(path, img):
+            if atlas:
+                try:
+                    atlas.put(path, img)
+                except (OSError, ValueError):
+                    pass  # Disk full, or closed by a newer import
+
+        # Rows at or below the atlas cell size are sliced from the atlas instead
+        from_atlas = bool(atlas and self.thumb_store and self.thumb_size <= atlas.cell)
+        for path in paths:
+            key = (path, size)
+            if key in self.image_cache or key in self.decoded_thumbs:
+                pass
+            elif path not in keep or (from_atlas and path in atlas):
+                if not self.thumb_store.has(path, size):
+                    misses.append(path)
+                    continue
+            else:
+                img = self.read_stored_thumbnail(path, size)
+                if img is None:
+                    misses.append(path)
+                    continue
+                add_to_atlas(path, img)
+                if not (from_atlas and path in atlas):
+                    self.decoded_thumbs[key] = img
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+
+        # Even a few misses go to the pool: decoding here would hold the GIL the
+        # Tk thread needs. Only get_master decodes in-thread, for a row shown now.
+        failed = []
+        jobs = [(path, size, True) for path in misses]
+        chunk = max(1, min(self.thumb_chunk, len(jobs) // self.thumb_workers))
+        results = self.get_thumb_pool().map(thumbnail_job, jobs, chunksize=chunk) if jobs else ()
+        for path, mode, dims, raw, encoded, events in results:
+            PROFILER.merge(events)
+            if raw is not None:
+                PROFILER.count("thumbs_generated")
+                img = Image.frombytes(mode, dims, raw)
+                add_to_atlas(path, img)
+                if path in keep and not (from_atlas and path in atlas):
+                    self.decoded_thumbs[(path, size)] = img
+                if self.thumb_store:
+                    self.thumb_store.put(path, size, encoded)
+            else:
+                failed.append(path)
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+
+        if self.thumb_store:
+            self.thumb_store.flush()
+        if atlas:
+            try:
+                atlas.flush()
+            except ValueError:
+                pass
+        return failed
 
+    @profiled("display")
     def display_image(self):
-        if not self.image_list or self.image_index >= len(self.image_list):
+        if not self.images or self.image_index >= len(self.images):
             return
-        img_path = self.image_list[self.image_index]
+        img_path = self.images[self.image_index]
         self.current_img_path = img_path
-        if (img_path, 'full') not in self.image_cache:
+        if self.zoom_step is None or not self.render_zoom(img_path):
+            if not self.render_fit(img_path):
+                return
+        self.update_rating_buttons(img_path)
+        zoom = f"  {2.0 ** self.zoom_step:.0%}" if self.zoom_step is not None else ""
+        self.counter_label.config(text=f"{self.image_index + 1} / {len(self.images)}{zoom}")
+        self.update_status()
+        self.schedule_prefetch()
+
+    def render_fit(self, img_path):
+        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        # Renders are cached per canvas size so a resize never shows a stale fit
+        key = (img_path, 'full', (w, h))
+        self.image_cache.pin("current", [key])
+        tk_img = self.image_cache.get(key)
+        if tk_img is None:
             try:
-                image = Image.open(img_path)
-                w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-                image.thumbnail((w, h))
-                self.image_cache[(img_path, 'full')] = ImageTk.PhotoImage(image)
+                image = render_from_pyramid(self.get_pyramid(img_path), w, h)
+                with PROFILER.span("photoimage"):
+                    tk_img = ImageTk.PhotoImage(image)
             except:
-                return
-        self.tk_img = self.image_cache[(img_path, 'full')]
+                return False
+            self.image_cache.put(key, tk_img)
+        self.tk_img = tk_img
         self.canvas.delete("all")
+        self.canvas.create_image(w // 2, h // 2, image=self.tk_img, tags="current_image")
+        return True
+
+    def get_tile_source(self, path):
+        if self.tile_source is None or self.tile_source.path != path:
+            try:
+                self.tile_source = TileSource(path)
+            except Exception:
+                self.tile_source = None
+        return self.tile_source
+
+    def fit_scale(self, source):
+        w, h = source.size
+        return min(self.canvas.winfo_width() / w, self.canvas.winfo_height() / h, 1.0)
+
+    def toggle_zoom(self, anchor=None):
+        # Between fitting the window and 100% around the anchor
+        self.set_zoom(None if self.zoom_step is not None else 0, anchor)
+
+    def zoom_by(self, delta, anchor=None):
+        if not self.current_img_path:
+            return
+        source = self.get_tile_source(self.current_img_path)
+        if source is None:
+            return
+        fit = self.fit_scale(source)
+        if self.zoom_step is not None:
+            step = self.zoom_step + delta
+        elif delta > 0:
+            step = math.floor(math.log2(fit)) + 1  # First step past the fit
+        else:
+            return
+        self.set_zoom(min(step, MAX_ZOOM_STEP) if 2.0 ** step > fit else None, anchor)
+
+    def set_zoom(self, step, anchor=None):
+        source = self.get_tile_source(self.current_img_path) if self.current_img_path else None
+        if source is None or step == self.zoom_step:
+            return
+        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if anchor is None:
+            anchor = (cw / 2, ch / 2)
+        w, h = source.size
+        if self.zoom_step is None:
+            old = self.fit_scale(source)
+            ox, oy = (w * old - cw) / 2, (h * old - ch) / 2
+        else:
+            old = 2.0 ** self.zoom_step
+            ox, oy = self.zoom_origin
+        # Keep the image point under the anchor where it is
+        px, py = (ox + anchor[0]) / old, (oy + anchor[1]) / old
+        if step is not None:
+            new = 2.0 ** step
+            self.zoom_center = ((px * new - anchor[0] + cw / 2) / (w * new), (py * new - anchor[1] + ch / 2) / (h * new))
+        self.zoom_step = step
+        self.display_image()
+
+    @profiled("zoom")
+    def render_zoom(self, path, placeholder=True):
+        # Draws the tiles of the zoomed view that are cached and queues the rest;
+        # False when the zoom is no larger than the fit and the fit view is wanted
+        source = self.get_tile_source(path)
+        if source is None:
+            return False
+        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        z = 2.0 ** self.zoom_step
+        if z <= self.fit_scale(source):
+            self.zoom_step = None
+            return False
+        w, h = source.size
+        sw, sh = w * z, h * z
+        # Keep the canvas covered where the image is larger, centred where it is not
+        ox = min(max(0, self.zoom_center[0] * sw - cw / 2), sw - cw) if sw > cw else (sw - cw) / 2
+        oy = min(max(0, self.zoom_center[1] * sh - ch / 2), sh - ch) if sh > ch else (sh - ch) / 2
+        self.zoom_center = ((ox + cw / 2) / sw, (oy + ch / 2) / sh)
+        self.zoom_origin = (ox, oy)
+
+        if placeholder:
+            self.canvas.delete("all")
+            self.draw_zoom_placeholder(path, source, z)
+        else:
+            self.canvas.delete("tile")
+        last_x = int(min(sw, ox + cw) - 1) // TILE_SIZE
+        last_y = int(min(sh, oy + ch) - 1) // TILE_SIZE
+        keys = [(path, self.zoom_step, tx, ty)
+                for ty in range(max(0, int(oy)) // TILE_SIZE, last_y + 1)
+                for tx in range(max(0, int(ox)) // TILE_SIZE, last_x + 1)]
+        # Tiles nearest the centre of the view load first
+        mid_x, mid_y = (ox + cw / 2) / TILE_SIZE - 0.5, (oy + ch / 2) / TILE_SIZE - 0.5
+        keys.sort(key=lambda key: (key[2] - mid_x) ** 2 + (key[3] - mid_y) ** 2)
+        self.visible_tiles = set(keys)
+        for key in list(self.tile_tokens):
+            if key not in self.visible_tiles:
+                self.tile_tokens.pop(key).cancel()
+        for key in keys:
+            entry = self.tiles.entries.get(key)
+            if entry is not None:
+                self.tiles.entries.move_to_end(key)
+                self.draw_tile(key, entry[0])
+            elif key not in self.tile_tokens:
+                token = self.tile_tokens[key] = CancelToken()
+                self.scheduler.submit(functools.partial(self.load_tile, source, key, token), JobScheduler.VISIBLE, token)
+        return True
+
+    def draw_zoom_placeholder(self, path, source, z):
+        # The screen-sized render, cropped and stretched, until the tiles arrive
+        ox, oy = self.zoom_origin
+        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        w, h = source.size
+        try:
+            base = self.get_pyramid(path)[0]
+        except Exception:
+            return
+        s = base.width / w
+        x0, y0 = max(0, ox / z), max(0, oy / z)
+        x1, y1 = min(w, (ox + cw) / z), min(h, (oy + ch) / z)
+        crop = base.crop((int(x0 * s), int(y0 * s), max(int(x0 * s) + 1, math.ceil(x1 * s)), max(int(y0 * s) + 1, math.ceil(y1 * s))))
+        size = (max(1, round((x1 - x0) * z)), max(1, round((y1 - y0) * z)))
+        with PROFILER.span("resample"):
+            self.zoom_placeholder = ImageTk.PhotoImage(crop.resize(size, Image.BILINEAR))
+        self.canvas.create_image(x0 * z - ox, y0 * z - oy, image=self.zoom_placeholder, anchor="nw", tags="placeholder")
+
+    def draw_tile(self, key, tk_img):
+        ox, oy = self.zoom_origin
+        self.canvas.create_image(key[2] * TILE_SIZE - ox, key[3] * TILE_SIZE - oy, image=tk_img, anchor="nw", tags="tile")
+
+    def load_tile(self, source, key, token):
+        # Runs on a scheduler worker
+        try:
+            img = source.tile(*key[1:])
+        except Exception:
+            img = None
+        self.scheduler.post(token, self.on_tile, key, img)
+
+    def on_tile(self, key, img):
+        self.tile_tokens.pop(key, None)
+        if img is None:
+            return
+        with PROFILER.span("photoimage"):
+            tk_img = ImageTk.PhotoImage(img)
+        self.tiles.discard(key)
+        self.tiles.entries[key] = (tk_img, img.width * img.height * 4)
+        self.tiles.total_bytes += img.width * img.height * 4
+        self.tiles.evict(self.visible_tiles)
+        if key in self.visible_tiles and key[0] == self.current_img_path and key[1] == self.zoom_step:
+            self.draw_tile(key, tk_img)
+
+    def start_pan(self, event):
+        self.pan_anchor = (event.x, event.y)
+
+    def pan_view(self, event):
+        if self.zoom_step is None or self.pan_anchor is None or not self.tile_source:
+            return
+        dx, dy = event.x - self.pan_anchor[0], event.y - self.pan_anchor[1]
+        self.pan_anchor = (event.x, event.y)
+        w, h = self.tile_source.size
+        z = 2.0 ** self.zoom_step
+        self.zoom_center = (self.zoom_center[0] - dx / (w * z), self.zoom_center[1] - dy / (h * z))
+        # Tiles follow the pointer right away; the stretched placeholder is redone once the drag pauses
+        old = self.zoom_origin
+        self.render_zoom(self.current_img_path, placeholder=False)
+        self.canvas.move("placeholder", old[0] - self.zoom_origin[0], old[1] - self.zoom_origin[1])
+        if self.pan_job:
+            self.root.after_cancel(self.pan_job)
+        self.pan_job = self.root.after(150, self.on_pan_settled)
+
+    def on_pan_settled(self):
+        self.pan_job = None
+        if self.zoom_step is not None:
+            self.display_image()
+
+    def pyramid_size(self):
+        # Pyramids are built for the whole screen so window resizes never re-decode
+        return self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+
+    def get_pyramid(self, path):
+        entry = self.pyramids.entries.get(path)
+        if entry is not None:
+            self.pyramids.entries.move_to_end(path)
+            return entry[0]
+        levels = self.prefetcher.take((path, self.pyramid_size()))
+        PROFILER.count("prefetch_hit" if levels is not None else "prefetch_miss")
+        if levels is None:
+            levels = build_pyramid(path, *self.pyramid_size())
+        nbytes = pyramid_nbytes(levels)
+        self.pyramids.entries[path] = (levels, nbytes)
+        self.pyramids.total_bytes += nbytes
+        self.pyramids.evict({path})
+        return levels
+
+    def on_canvas_resize(self, event):
+        # Keep the current render centred while the window or sash is dragged and
+        # only re-render once the size has settled
+        self.canvas.coords("current_image", event.width // 2, event.height // 2)
+        if self.resize_job:
+            self.root.after_cancel(self.resize_job)
+        self.resize_job = self.root.after(120, self.on_resize_settled)
+
+    def on_resize_settled(self):
+        self.resize_job = None
+        self.display_image()
+
+    def schedule_prefetch(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        self.canvas.create_image(w // 2, h // 2, image=self.tk_img)
-        self.update_rating_buttons(img_path)
-        self.counter_label.config(text=f"{self.image_index + 1} / {len(self.image_list)}")
+        if w <= 1 or h <= 1:
+            return
+        size = self.pyramid_size()
+        d = 1 if self.nav_direction >= 0 else -1
+        # Neighbours in the direction of travel first, then a few behind
+        offsets = [d * k for k in range(1, self.prefetch_ahead + 1)]
+        offsets += [-d * k for k in range(1, self.prefetch_behind + 1)]
+        keys = []
+        for offset in offsets:
+            i = self.image_index + offset
+            if 0 <= i < len(self.images):
+                path = self.images[i]
+                if path not in self.pyramids.entries and (path, 'full', (w, h)) not in self.image_cache:
+                    keys.append((path, size))
+        self.prefetcher.schedule(keys)
 
     def update_rating_buttons(self, img_path):
-        rating = self.image_ratings.get(img_path, 0)
+        rating = self.images.rating(img_path)
         for i, btn in enumerate(self.rating_buttons):
             btn.config(text="★" if i + 1 == rating else "☆")
 
     def rate_image(self, stars):
-        if not self.image_list:
+        if not self.images:
             return
-        img_path = self.image_list[self.image_index]
-        self.image_ratings[img_path] = stars
+        img_path = self.images[self.image_index]
+        for path in self.group_members(img_path):
+            self.set_rating(path, stars)
+            self.update_rated_row(path)
         self.update_rating_buttons(img_path)
-        self.update_rated_list()
         self.move_selection(1)
         self.highlight_selected_thumbnail()
 
     def skip_image(self):
         self.move_selection(1)
 
-    def apply_filter(self, event):
+    def apply_filter(self, event=None):
+        if self.filter_job:
+            self.root.after_cancel(self.filter_job)
+            self.filter_job = None
         selection = self.filter_var.get()
-        self.filtered_star = None if selection == "All" else int(selection)
+        if selection == "All":
+            self.filter_stars = None
+        elif selection.startswith("≥"):
+            self.filter_stars = frozenset(range(int(selection[1:]), 6))
+        else:
+            self.filter_stars = frozenset((int(selection),))
+        try:
+            self.filter_query = parse_filter_query(self.filter_text.get())
+        except ValueError as e:
+            self.filter_count_var.set(str(e))
+            return
         self.update_rated_list()
         self.highlight_selected_thumbnail()
 
+    def schedule_filter(self, event):
+        if event.keysym == "Return":
+            return
+        if self.filter_job:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(300, self.apply_filter)
+
+    def extract_metadata(self, paths, full=False):
+        # Header-only metadata for filtering and sorting, read in worker
+        # processes alongside thumbnailing. A full pass reuses the folder's
+        # saved index for files whose size and mtime have not changed.
+        token = self.import_token
+        snapshot = self.snapshot
+        index_path = self.metadata_path
+        pool = self.get_meta_pool()
+
+        def read():
+            saved = load_metadata_index(index_path) if full and index_path else {}
+            batch = []
+            jobs = []
+            for path in paths:
+                sig = snapshot.signature(path) if snapshot else None
+                entry = saved.get(path)
+                if entry and sig and entry[0]["size"] == sig[0] and entry[0]["mtime_ns"] == sig[1]:
+                    batch.append((path, *entry))
+                else:
+                    jobs.append((path, sig))
+            self.scheduler.post(token, self.on_metadata, batch, not jobs)
+            yield
+            # A few hundred files per step, so a cancelled import stops the pool soon
+            for start in range(0, len(jobs), 512):
+                try:
+                    results = pool.map(read_metadata, jobs[start:start + 512], chunksize=64)
+                    batch = [result for result in results if result[1] is not None]
+                except RuntimeError:
+                    return  # Pool shut down on close
+                self.scheduler.post(token, self.on_metadata, batch, start + 512 >= len(jobs))
+                yield
+
+        self.scheduler.submit(read(), JobScheduler.BACKGROUND, token)
+
+    def on_metadata(self, batch, done):
+        for path, values, camera in batch:
+            self.filter_index.set_metadata(path, values, camera)
+        if done:
+            self.save_metadata()
+            if self.sort_column.get() != "name":
+                self.sort_images()
+            if self.filter_query[1] or self.filter_query[2]:
+                self.update_rated_list()
+
+    def get_meta_pool(self):
+        if self.meta_pool is None:
+            self.meta_pool = process_pool(2)
+        return self.meta_pool
+
+    def save_metadata(self):
+        index_path = self.metadata_path
+        if not index_path:
+            return
+        index = self.filter_index
+        ids = array("I", self.images.order)
+
+        def save():
+            try:
+                index.save(index_path, ids)
+            except OSError:
+                pass
+
+        self.scheduler.submit(save)
+
+    def sort_images(self):
+        if not self.images:
+            return
+        column = self.sort_column.get()
+        if column == "name":
+            ids = sorted(self.images.order, key=self.images.path_of)
+        else:
+            ids = self.filter_index.sort_ids(self.images.order, column)
+        current = self.images[self.image_index]
+        self.set_image_order(ids)
+        self.image_index = self.images.index(current) or 0
+        for path, row in self.rated_rows.items():
+            index = self.images.index(path)
+            row[1].config(text=f"{index + 1}" if index is not None else "-")
+        for row in self.thumb_rows:
+            row.state = None
+        self.highlight_selected_thumbnail()
+
+    def set_image_order(self, ids):
+        self.images.set_order(ids)
+        self.rebuild_view()
+
+    def extend_image_list(self, paths):
+        added = self.images.extend(paths)
+        self.filter_index.sync()
+        if self.view_rows is not None:
+            for i in added:
+                self.view_pos[i] = len(self.view_rows)
+                self.view_rows.append(i)
+
+    def rebuild_view(self):
+        # Collapses every group of similar images into the row of its first member
+        if not self.group_similar.get() or not self.groups:
+            self.view_rows = None
+            self.view_pos = {}
+            return
+        self.view_rows = []
+        self.view_pos = {}
+        group_rows = {}
+        for i, path in enumerate(self.images):
+            group = self.groups.get(path)
+            if group is not None and group in group_rows:
+                self.view_pos[i] = group_rows[group]
+                continue
+            if group is not None:
+                group_rows[group] = len(self.view_rows)
+            self.view_pos[i] = len(self.view_rows)
+            self.view_rows.append(i)
+
+    def row_count(self):
+        return len(self.images) if self.view_rows is None else len(self.view_rows)
+
+    def row_image(self, row):
+        return row if self.view_rows is None else self.view_rows[row]
+
+    def image_row(self, index):
+        return index if self.view_rows is None else self.view_pos.get(index, 0)
+
+    def group_members(self, path):
+        group = self.groups.get(path) if self.view_rows is not None else None
+        if group is None:
+            return (path,)
+        return [p for p in group if p in self.images]
+
+    def toggle_grouping(self):
+        if self.group_similar.get():
+            if load_numpy() is None:
+                messagebox.showerror("Group Similar Images", "Grouping similar images needs NumPy:\n\npip install numpy")
+                self.group_similar.set(False)
+                return
+            if not self.import_status:
+                self.start_grouping()
+        self.rebuild_view()
+        self.update_thumbnails()
+
+    def start_grouping(self):
+        if load_numpy() is None:
+            return
+        token = self.import_token
+        paths = list(self.images)
+        self.grouping_status = "Grouping similar images..."
+
+        def work():
+            hashes, valid = yield from self.compute_hashes(paths)
+            hashed = [path for path, ok in zip(paths, valid) if ok]
+            members = {}
+            for path, first in zip(hashed, group_similar(hashes[valid])):
+                members.setdefault(first, []).append(path)
+            groups = {}
+            for group in members.values():
+                if len(group) > 1:
+                    group = tuple(group)
+                    for path in group:
+                        groups[path] = group
+            self.scheduler.post(token, self.on_groups, groups)
+
+        self.scheduler.submit(work(), JobScheduler.BACKGROUND, token)
+
+    def on_groups(self, groups):
+        self.groups = groups
+        self.grouping_status = ""
+        self.rebuild_view()
+        self.thumbs_dirty = True
+
+    def compute_hashes(self, paths):
+        # A job step per 256 files. Hashes of unchanged files come from the
+        # store; the rest are computed from the master thumbnails and saved.
+        known = self.thumb_store.get_hashes(paths) if self.thumb_store else {}
+        hashes = np.zeros(len(paths), dtype=np.int64)
+        valid = np.zeros(len(paths), dtype=bool)
+        missing = []
+        for i, path in enumerate(paths):
+            value = known.get(path)
+            if value is None:
+                missing.append(i)
+            else:
+                hashes[i] = value
+                valid[i] = True
+
+        for start in range(0, len(missing), 256):
+            samples = []
+            hashed = []
+            for i in missing[start:start + 256]:
+                sample = self.read_hash_sample(paths[i])
+                if sample is not None:
+                    samples.append(sample)
+                    hashed.append(i)
+            if samples:
+                values = dhash(samples).view(np.int64)
+                hashes[hashed] = values
+                valid[hashed] = True
+                if self.thumb_store:
+                    self.thumb_store.put_hashes(zip([paths[i] for i in hashed], values.tolist()))
+            self.grouping_status = f"Hashing... {min(start + 256, len(missing))}/{len(missing)}"
+            yield
+        return hashes.view(np.uint64), valid
+
+    def read_hash_sample(self, path):
+        data = self.thumb_store.get(path, MASTER_THUMB_SIZE) if self.thumb_store else None
+        try:
+            if data is not None:
+                return dhash_sample(Image.open(io.BytesIO(data)))
+            return dhash_sample(self.load_thumbnail(path, MASTER_THUMB_SIZE))
+        except Exception:
+            return None
+
+    def start_scoring(self):
+        if load_numpy() is None:
+            messagebox.showerror("Score Image Quality", "Scoring image quality needs NumPy:\n\npip install numpy")
+            return
+        if not self.images or self.scoring_status:
+            return
+        token = self.import_token
+        paths = list(self.images)
+        store = self.thumb_store
+        pool = self.get_thumb_pool()
+        in_flight = 2 * (os.cpu_count() or 1)
+        self.scoring_status = "Scoring image quality..."
+
+        def work():
+            # Scores of unchanged files come from the store. The rest are
+            # computed from the master thumbnails in batches of 256 on the
+            # worker processes, a couple of batches per worker at a time.
+            try:
+                known = store.get_scores(paths) if store else {}
+                missing = [path for path in paths if path not in known]
+                self.scheduler.post(token, self.on_scores, list(known.items()), 0, len(missing))
+                batches = (missing[start:start + 256] for start in range(0, len(missing), 256))
+                pending = deque()
+                done = 0
+                while True:
+                    for batch in batches:
+                        items = [(path, store.get(path, MASTER_THUMB_SIZE) if store else None) for path in batch]
+                        pending.append((len(batch), pool.submit(score_job, items)))
+                        if len(pending) >= in_flight:
+                            break
+                    if not pending:
+                        return
+                    count, future = pending.popleft()
+                    try:
+                        scores, thumbs = future.result()
+                    except RuntimeError:
+                        return  # Pool shut down on close
+                    if store:
+                        for path, data in thumbs:
+                            store.put(path, MASTER_THUMB_SIZE, data)
+                        store.put_scores(scores)
+                    done += count
+                    self.scheduler.post(token, self.on_scores, scores, done, len(missing))
+                    yield
+            finally:
+                # Also when a batch failed, so scoring can be started again
+                self.scheduler.post(token, self.on_scoring_done)
+
+        self.scheduler.submit(work(), JobScheduler.BACKGROUND, token)
+
+    def on_scores(self, scores, done, total):
+        details = self.score_details
+        for path, values in scores:
+            i = self.images.id_of(path)
+            if i is None:
+                continue
+            self.filter_index.set_metadata(path, {"score": round(values[0])}, "")
+            if len(details) < 4 * i + 4:
+                details.extend([-1.0] * (4 * i + 4 - len(details)))
+            details[4 * i:4 * i + 4] = array("f", values[1:])
+        self.scoring_status = f"Scoring image quality... {done}/{total}"
+
+    def on_scoring_done(self):
+        self.scoring_status = ""
+        if self.sort_column.get() == "score":
+            self.sort_images()
+        if any(column == "score" for column, _, _ in self.filter_query[1]):
+            self.update_rated_list()
+        self.update_status()
+
+    def score_text(self):
+        # Breakdown of the current image's score, kept in memory by on_scores
+        i = self.images.id_of(self.current_img_path) if self.current_img_path else None
+        if i is None or 4 * i + 4 > len(self.score_details):
+            return ""
+        score = self.filter_index.columns["score"][i]
+        if score < 0:
+            return ""
+        sharpness, brightness, clipped, noise = self.score_details[4 * i:4 * i + 4]
+        return (f"Quality {score}: sharpness {sharpness:.0f}, brightness {brightness:.0f}, "
+                f"clipped {clipped:.1%}, noise {noise:.1f}")
+
+    def auto_rate_low_scores(self):
+        scores = self.filter_index.columns["score"]
+        if not any(scores[i] >= 0 for i in self.images.order):
+            messagebox.showinfo("Auto-Rate Low Scores", "Score the images first with Option → Score Image Quality.")
+            return
+        threshold = simpledialog.askinteger(
+            "Auto-Rate Low Scores", "Rate unrated images scoring below this with 1 star:",
+            initialvalue=self.auto_rate_threshold, minvalue=1, maxvalue=100, parent=self.root)
+        if threshold is None:
+            return
+        self.auto_rate_threshold = threshold
+        ids = [i for i in self.images.order if 0 <= scores[i] < threshold and not self.images.ratings[i]]
+        if not ids:
+            messagebox.showinfo("Auto-Rate Low Scores", f"No unrated image scores below {threshold}.")
+            return
+        if not messagebox.askyesno("Auto-Rate Low Scores", f"Rate {len(ids)} unrated image(s) scoring below {threshold} with 1 star?"):
+            return
+        for i in ids:
+            self.set_rating(self.images.path_of(i), 1)
+        self.update_rated_list()
+        if self.current_img_path:
+            self.update_rating_buttons(self.current_img_path)
+        self.thumbs_dirty = True
+
+    def set_rating(self, path, stars, persist=True):
+        self.images.set_rating(path, stars)
+        if persist and self.rating_store:
+            self.rating_store.record(path, stars)
+            self.last_rating_time = time.monotonic()
+
+    def clear_ratings(self, persist=True):
+        self.images.clear_ratings()
+        if persist and self.rating_store:
+            self.rating_store.record_clear()
+
+    def remove_rating(self, path, persist=True):
+        if self.images.remove_rating(path):
+            if persist and self.rating_store:
+                self.rating_store.record(path, 0)
+
+    def remove_images(self, paths):
+        gone = set(paths)
+        if not gone:
+            return
+        for path in gone:
+            self.remove_rating(path)
+        self.images.remove(gone)
+        self.rebuild_view()
+        self.image_index = min(self.image_index, max(0, len(self.images) - 1))
+        self.update_rated_list()
+        self.update_thumbnails()
+        if self.images:
+            self.display_image()
+        else:
+            self.canvas.delete("all")
+
+    def open_atlas(self, folder):
+        if self.atlas:
+            self.atlas.close()
+        try:
+            self.atlas = ThumbAtlas(thumb_atlas_path(folder))
+        except OSError:
+            self.atlas = None  # Thumbnails come from the masters only
+
+    def open_rating_store(self, folder):
+        if self.rating_store:
+            self.rating_store.close()
+        try:
+            self.rating_store = RatingStore(rating_journal_path(folder), folder)
+        except OSError:
+            self.rating_store = None  # Ratings stay in memory only
+
+    def apply_saved_ratings(self, paths, update_rows=True):
+        if not self.rating_store or not self.rating_store.records:
+            return
+        for path in paths:
+            stars = self.rating_store.saved_stars(path)
+            if stars and not self.images.rating(path):
+                self.set_rating(path, stars, persist=False)
+                if update_rows:
+                    self.update_rated_row(path)
+
+    def match_moved_ratings(self):
+        # Saved ratings whose file is gone may belong to a file that was renamed
+        # or moved; look for unrated files with the same content fingerprint.
+        store = self.rating_store
+        if not store or not store.records:
+            return
+        orphans = store.orphans({store.relpath(path) for path in self.images})
+        if not orphans:
+            return
+        sizes = {fp.split(":", 1)[0] for fp in orphans}
+        ratings = self.images.ratings
+        candidates = [self.images.path_of(i) for i in self.images.order if not ratings[i]]
+        token = self.import_token
+
+        def match():
+            for i, path in enumerate(candidates):
+                if i % 500 == 499:
+                    yield
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                # Only hash files whose size matches a missing one
+                if str(st.st_size) not in sizes:
+                    continue
+                hit = orphans.pop(file_fingerprint(path, st), None)
+                if hit:
+                    self.scheduler.post(token, self.on_restore, path, hit[1], hit[0])
+
+        self.scheduler.submit(match(), JobScheduler.BACKGROUND, token)
+
+    def rated_paths(self):
+        rated = self.images.rated_ids(self.filter_stars)
+        if any(self.filter_query):
+            matching = self.filter_index.query(*self.filter_query)
+            rated = [i for i in rated if i in matching]
+        return [self.images.path_of(i) for i in rated]
+
+    @profiled("rated_list")
     def update_rated_list(self):
         for widget in self.rated_frame.winfo_children():
             widget.destroy()
-        self.rated_thumbs.clear()
+        self.rated_rows.clear()
 
-        for path, star in self.image_ratings.items():
-            if self.filtered_star is None or star == self.filtered_star:
-                tk_img = self.get_cached_image(path, self.thumb_size)
-                if not tk_img:
-                    continue
-                self.rated_thumbs.append(tk_img)
-                frame = tk.Frame(self.rated_frame)
-
-                index = self.image_list.index(path) + 1 if path in self.image_list else "-"
-                index_label = tk.Label(frame, text=f"{index}", width=4, anchor="e")
-                index_label.pack(side=tk.LEFT, padx=(2, 5))
-
-                star_str = f"★ {star}" if star else "☆"
-                thumb_text = f"{star_str}\n{os.path.basename(path)}"
-
-                panel = tk.Label(
-                    frame,
-                    image=tk_img,
-                    text=thumb_text,
-                    justify="left",
-                    compound="left",
-                    anchor="w"
-                )
-                panel.bind("<Button-1>", lambda e, path=path: self.jump_to_image(path))
-                panel.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                frame.pack(fill=tk.X, pady=1)
-                
-        self.filter_count_var.set(f"{len(self.rated_thumbs)} image(s)")
-        has_rated = bool(self.rated_thumbs)
+        for path in self.rated_paths():
+            self.add_rated_row(path)
+        self.update_rated_count()
+
+    @profiled("rated_row")
+    def update_rated_row(self, path):
+        # Touch only the row of the image whose rating just changed
+        star = self.images.rating(path)
+        matches = star > 0 and (self.filter_stars is None or star in self.filter_stars)
+        if matches and any(self.filter_query):
+            matches = self.filter_index.matches(path, *self.filter_query)
+        row = self.rated_rows.get(path)
+        if row and not matches:
+            row[0].destroy()
+            del self.rated_rows[path]
+        elif row:
+            row[2].config(text=self.rated_row_text(path, star))
+        elif matches:
+            self.add_rated_row(path)
+        self.update_rated_count()
+
+    def rated_row_text(self, path, star):
+        star_str = f"★ {star}" if star else "☆"
+        return f"{star_str}\n{os.path.basename(path)}"
+
+    def add_rated_row(self, path):
+        tk_img = self.get_cached_image(path, self.thumb_size)
+        frame = tk.Frame(self.rated_frame)
+
+        index = self.images.index(path)
+        index_label = tk.Label(frame, text=f"{index + 1}" if index is not None else "-", width=4, anchor="e")
+        index_label.pack(side=tk.LEFT, padx=(2, 5))
+
+        panel = tk.Label(
+            frame,
+            image=tk_img or "",
+            text=self.rated_row_text(path, self.images.rating(path)),
+            justify="left",
+            compound="left",
+            anchor="w"
+        )
+        panel.image = tk_img  # Keep the photo alive even if the cache evicts it
+        panel.bind("<Button-1>", lambda e, path=path: self.jump_to_image(path))
+        panel.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        frame.pack(fill=tk.X, pady=1)
+        self.rated_rows[path] = (frame, index_label, panel)
+
+    def update_rated_count(self):
+        count = len(self.rated_rows)
+        self.filter_count_var.set(f"{count} image(s)")
+        has_rated = count > 0
         self.clear_button.config(state="normal" if has_rated else "disabled")
         self.copy_button.config(state="normal" if has_rated else "disabled")
     
     def jump_to_image(self, path):
-        if path in self.image_list:
-            idx = self.image_list.index(path)
+        idx = self.images.index(path)
+        if idx is not None:
             self.image_index = idx
-            self.current_page = self.image_index // self.page_size
+            self.nav_direction = 1
             self.display_image()
             self.highlight_selected_thumbnail()
     
+    def toggle_hud(self):
+        self.hud_visible.set(not self.hud_visible.get())
+        self.refresh_hud()
+
+    def refresh_hud(self):
+        if self.hud_job:
+            self.root.after_cancel(self.hud_job)
+            self.hud_job = None
+        if not self.hud_visible.get():
+            self.hud_label.place_forget()
+            return
+        lines = [f"{'stage':12s}{'n':>6s}{'p50':>9s}{'p95':>9s} ms"]
+        for name in sorted(PROFILER.samples):
+            n, p50, p95 = PROFILER.percentiles(name)
+            lines.append(f"{name:12s}{n:6d}{p50:9.2f}{p95:9.2f}")
+        lookups = self.image_cache.hits + self.image_cache.misses
+        hit_rate = self.image_cache.hits / lookups * 100 if lookups else 0
+        lines.append(f"cache hit rate {hit_rate:.0f}%")
+        lines.append(f"queues: thumbs {self.thumb_queue.pending()}  prefetch {len(self.prefetcher.tokens)}  jobs {self.scheduler.pending()}  results {len(self.scheduler.results)}")
+        lines.append(f"tiles: {len(self.tiles.entries)} ({self.tiles.total_bytes / 1048576:.0f} MB)  loading {len(self.tile_tokens)}")
+        memory = process_memory_mb()
+        lines.append(f"memory: {memory:.0f} MB" if memory is not None else "memory: n/a")
+        for name, value in sorted(PROFILER.counters.items()):
+            lines.append(f"{name}: {value}")
+        self.hud_label.config(text="\n".join(lines))
+        self.hud_label.place(x=10, y=10, anchor="nw")
+        self.hud_label.lift()
+        self.hud_job = self.root.after(500, self.refresh_hud)
+
+    def export_trace(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            initialfile="image_rating_trace.json",
+            filetypes=[("Chrome trace", "*.json")],
+        )
+        if not path:
+            return
+        try:
+            PROFILER.export_trace(path)
+        except OSError as e:
+            messagebox.showerror("Export Trace", str(e))
+
     def show_about_popup(self):
         popup = tk.Toplevel(self.root)
         popup.title("About Me")
@@ -579,8 +4271,7 @@ class ImageClassifierApp:
         tk.Label(popup, text="\nQR code for donate if you like my work:", font=("Arial", 10, "bold")).pack(pady=(0, 5))
 
         try:
-            qr_data = base64.b64decode(qr_code_base64)
-            qr_img = Image.open(io.BytesIO(qr_data))
+            qr_img = Image.open(ABOUT_QR_PATH)
             qr_img = qr_img.resize((150, 150), Image.LANCZOS)
             self.qr_photo = ImageTk.PhotoImage(qr_img)  # Keep reference
             tk.Label(popup, image=self.qr_photo).pack()
@@ -590,18 +4281,119 @@ class ImageClassifierApp:
         tk.Button(popup, text="Close", command=popup.destroy).pack(pady=10)
 
     def copy_filtered_images(self):
-        if not self.image_ratings:
+        paths = list(self.rated_paths())
+        if not paths:
             return  # Không có ảnh nào đã đánh giá
 
         target_dir = filedialog.askdirectory()
         if not target_dir:
             return
 
-        for img_path, rating in self.image_ratings.items():
-            if self.filtered_star is None or rating == self.filtered_star:
-                shutil.copy(img_path, os.path.join(target_dir, os.path.basename(img_path)))
+        mode = self.export_mode.get()
+        if mode == "move" and not messagebox.askyesno(
+                "Confirm", f"Move {len(paths)} image(s) out of the current folder?"):
+            return
+
+        job = ExportJob(paths, target_dir, mode)
+        job.start()
+        self.show_export_progress(job)
+
+    def export_archive(self):
+        paths = list(self.rated_paths())
+        if not paths:
+            return
+
+        popup = tk.Toplevel(self.root)
+        popup.title("Export as Archive")
+        popup.geometry("340x220")
+        popup.transient(self.root)
+        popup.grab_set()
+        popup.resizable(False, False)
+        popup.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (340 // 2)
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (220 // 2)
+        popup.geometry(f"+{x}+{y}")
+
+        form = tk.Frame(popup)
+        form.pack(fill=tk.X, padx=10, pady=10)
+        tk.Label(form, text="Format:").grid(row=0, column=0, sticky="w")
+        tk.OptionMenu(form, self.archive_format, *ARCHIVE_FORMATS).grid(row=0, column=1, sticky="w")
+        tk.Label(form, text="Longest edge (px):").grid(row=1, column=0, sticky="w")
+        tk.Entry(form, textvariable=self.archive_max_edge, width=8).grid(row=1, column=1, sticky="w")
+        tk.Label(form, text="Quality:").grid(row=2, column=0, sticky="w")
+        tk.Scale(form, from_=50, to=100, orient=tk.HORIZONTAL, variable=self.archive_quality).grid(row=2, column=1, sticky="we")
+        tk.Checkbutton(form, text="Strip metadata (EXIF, XMP, comments)", variable=self.archive_strip).grid(
+            row=3, column=0, columnspan=2, sticky="w")
+
+        def start():
+            edge = self.archive_max_edge.get().strip()
+            if edge and not edge.isdigit():
+                messagebox.showerror("Export", "Longest edge must be a number of pixels, or empty to keep the size.", parent=popup)
+                return
+            archive_path = filedialog.asksaveasfilename(
+                parent=popup, defaultextension=".zip",
+                filetypes=[("Zip archive", "*.zip"), ("Tar archive", "*.tar")])
+            if not archive_path:
+                return
+            popup.destroy()
+            job = ArchiveExportJob(paths, archive_path, self.archive_format.get(), int(edge or 0) or None,
+                                   self.archive_quality.get(), self.archive_strip.get())
+            job.start()
+            self.show_export_progress(job)
+
+        buttons = tk.Frame(popup)
+        buttons.pack(pady=5)
+        tk.Button(buttons, text="Export...", width=10, command=start).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Cancel", width=10, command=popup.destroy).pack(side=tk.LEFT, padx=5)
+
+    def show_export_progress(self, job):
+        # Not modal: rating and browsing keep working while files are exported
+        popup = tk.Toplevel(self.root)
+        popup.title("Exporting Images")
+        popup.geometry("400x120")
+        popup.transient(self.root)
+        popup.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (400 // 2)
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (120 // 2)
+        popup.geometry(f"+{x}+{y}")
+
+        label = tk.Label(popup, text=f"Exporting ({job.mode})...")
+        label.pack(pady=5)
+
+        progress = ttk.Progressbar(popup, orient="horizontal", length=300, mode="determinate", maximum=max(1, job.total))
+        progress.pack(pady=5)
+
+        tk.Button(popup, text="Cancel", width=10, command=job.cancel).pack(pady=5)
+        popup.protocol("WM_DELETE_WINDOW", job.cancel)
+
+        def poll():
+            progress['value'] = job.done
+            label.config(text=job.progress_text())
+            if not job.finished:
+                self.root.after(200, poll)
+                return
+            popup.destroy()
+            if job.mode == "move":
+                self.remove_images(job.transferred)
+            summary = f"Exported {len(job.transferred)} image(s), skipped {job.skipped} already exported."
+            if job.cancelled and job.mode == "archive":
+                summary += "\nExport was cancelled; no archive was written."
+            elif job.cancelled:
+                summary += "\nExport was cancelled; run it again to resume."
+            if job.errors:
+                summary += f"\n{len(job.errors)} error(s), first: {job.errors[0][0]}: {job.errors[0][1]}"
+                messagebox.showwarning("Export", summary)
+            else:
+                messagebox.showinfo("Export", summary)
+
+        poll()
 
 if __name__ == '__main__':
-    root = TkinterDnD.Tk()
+    try:
+        from tkinterdnd2 import TkinterDnD
+        root = TkinterDnD.Tk()
+    except (ImportError, RuntimeError):
+        root = tk.Tk()
     app = ImageClassifierApp(root)
+    app.restore_session()
     root.mainloop()
\ No newline at end of file